@@ -0,0 +1,65 @@
+"""
+A tiny local stand-in for the Ed API used by the benchmarks in this directory.
+
+Every request is answered with a fixed JSON body (or one chosen by ``routes``) over
+HTTP/1.1 so that clients are able to keep connections alive between requests.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+
+class StandInServer:
+    def __init__(
+        self,
+        body: Any = None,
+        route: Optional[Callable[[str, str], tuple[int, dict[str, str], bytes]]] = None,
+    ):
+        default_body = json.dumps(body if body is not None else {"ok": True}).encode()
+        self.request_count = 0
+        self.connection_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                server.connection_count += 1
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    self.rfile.read(length)
+                server.request_count += 1
+
+                if route is not None:
+                    status, headers, payload = route(self.command, self.path)
+                else:
+                    status, headers, payload = 200, {}, default_body
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/api/"
+
+    def __enter__(self) -> "StandInServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,96 @@
+"""
+Time to copy a lesson into several new lessons against a stand-in server with simulated
+latency.
+
+Compares creating each lesson and cloning its slides one call at a time with
+Lesson.clone_into, which builds the lessons concurrently.
+
+Usage: PYTHONPATH=. python benchmarks/bench_clone.py [num_lessons] [num_slides] [latency_ms]
+"""
+import json
+import sys
+import time
+
+import edstem.auth
+from _server import StandInServer
+from edstem.ed_api import EdStemAPI
+from edstem.lesson import Lesson
+
+LESSON = {
+    "id": 1,
+    "course_id": 1234,
+    "title": "Lesson",
+    "password": "",
+    "tutorial_regex": "",
+    "settings": {},
+    "is_hidden": True,
+    "is_timed": False,
+    "updated_at": None,
+}
+SLIDE = {
+    "id": 1,
+    "original_id": None,
+    "lesson_id": 1,
+    "user_id": 1,
+    "course_id": 1234,
+    "type": "document",
+    "title": "Slide",
+    "points": 0,
+    "index": 1,
+    "is_hidden": False,
+    "status": "unseen",
+    "created_at": "2023-03-29T11:04:36.691113+11:00",
+    "passage": "<document version='2.0'><paragraph>Hello</paragraph></document>",
+    "is_survey": False,
+    "mode": "",
+    "active_status": "active",
+    "correct": None,
+    "response": None,
+    "updated_at": None,
+}
+
+
+def main(lessons: int, slides: int, latency: float) -> None:
+    edstem.auth.set_token("Fake Token")
+    lesson_body = json.dumps({"lesson": LESSON}).encode()
+    slide_body = json.dumps({"slide": SLIDE}).encode()
+
+    def route(method: str, path: str) -> tuple[int, dict[str, str], bytes]:
+        time.sleep(latency)
+        return 200, {}, slide_body if path.endswith("/clone") else lesson_body
+
+    with StandInServer(route=route) as server:
+        EdStemAPI.API_URL = server.url
+        api = EdStemAPI(pool_maxsize=16)
+        source = Lesson.from_dict(
+            LESSON | {"slides": [SLIDE | {"id": i} for i in range(slides)]}, api=api
+        )
+        titles = [f"Section {i}" for i in range(lessons)]
+
+        def timed(label: str, clone) -> None:
+            before = server.request_count
+            start = time.perf_counter()
+            clone()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<24}: {elapsed:6.2f}s "
+                f"({server.request_count - before} requests)"
+            )
+
+        def sequential() -> None:
+            for title in titles:
+                lesson = api.create_lesson(title, course_id=1234)
+                for slide in source.slides:
+                    api.clone_slide(slide.id, lesson["id"], is_hidden=slide.hidden)
+
+        timed("sequential", sequential)
+        timed(
+            "clone_into (16 workers)", lambda: source.clone_into(titles, max_workers=16)
+        )
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    slides = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    main(n, slides, latency_ms / 1000)
@@ -0,0 +1,81 @@
+"""
+Throughput of bulk lesson edits against a stand-in server with simulated latency.
+
+Compares reading each lesson before writing it (edit_lesson without current, the
+previous behavior) with writing the locally held state in one round trip, both one
+lesson at a time and concurrently through a ChangeSet.
+
+Usage: PYTHONPATH=. python benchmarks/bench_edits.py [num_lessons] [latency_ms]
+"""
+import json
+import sys
+import time
+
+import edstem.auth
+from _server import StandInServer
+from edstem.changes import ChangeSet
+from edstem.ed_api import EdStemAPI
+from edstem.lesson import Lesson
+
+LESSON = {
+    "id": 1,
+    "course_id": 1234,
+    "title": "Lesson",
+    "password": "",
+    "tutorial_regex": "",
+    "settings": {},
+    "is_hidden": True,
+    "is_timed": False,
+    "updated_at": None,
+}
+
+
+def main(n: int, latency: float) -> None:
+    edstem.auth.set_token("Fake Token")
+    body = json.dumps({"lesson": LESSON}).encode()
+
+    def route(method: str, path: str) -> tuple[int, dict[str, str], bytes]:
+        time.sleep(latency)
+        return 200, {}, body
+
+    with StandInServer(route=route) as server:
+        EdStemAPI.API_URL = server.url
+        api = EdStemAPI(pool_maxsize=16)
+
+        def timed(label: str, edit) -> None:
+            before = server.request_count
+            start = time.perf_counter()
+            edit()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<34}: {n / elapsed:7.1f} lessons/s "
+                f"({server.request_count - before} requests)"
+            )
+
+        timed(
+            "read then write (sequential)",
+            lambda: [api.edit_lesson(i, {"is_hidden": False}) for i in range(n)],
+        )
+        timed(
+            "write local state (sequential)",
+            lambda: [
+                api.edit_lesson(i, {"is_hidden": False}, current=LESSON)
+                for i in range(n)
+            ],
+        )
+
+        def change_set() -> None:
+            changes = ChangeSet(max_workers=16)
+            for i in range(n):
+                lesson = Lesson.from_dict(LESSON | {"id": i}, api=api)
+                lesson.visibility.hidden = False
+                changes.add(lesson)
+            changes.flush()
+
+        timed("write local state (ChangeSet, 16)", change_set)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    main(n, latency_ms / 1000)
@@ -0,0 +1,101 @@
+"""
+Time for EdCourse.get_all_lessons to hydrate a large course.
+
+Compares the previous deep copy of every lesson (and embedded slide) against the current
+shallow copy and the copy=False ownership-transfer mode.
+
+Usage: PYTHONPATH=. python benchmarks/bench_hydration.py [num_lessons] [slides_per_lesson]
+"""
+import copy
+import sys
+import timeit
+from unittest.mock import MagicMock
+
+import edstem.auth
+from edstem import EdCourse, Lesson
+from edstem.ed_api import EdStemAPI
+
+
+def make_slide(lesson_id: int, index: int) -> dict:
+    return {
+        "id": lesson_id * 1000 + index,
+        "original_id": None,
+        "lesson_id": lesson_id,
+        "user_id": 1,
+        "course_id": 1234,
+        "type": "document",
+        "title": f"Slide {index}",
+        "points": 0,
+        "index": index,
+        "is_hidden": False,
+        "status": "unseen",
+        "created_at": "2023-03-29T11:04:36.691113+11:00",
+        "passage": "<document version='2.0'><paragraph>"
+        + "x" * 500
+        + "</paragraph></document>",
+        "is_survey": False,
+        "mode": "",
+        "active_status": "active",
+        "correct": None,
+        "response": None,
+        "updated_at": None,
+    }
+
+
+def make_lesson(lesson_id: int, num_slides: int) -> dict:
+    return {
+        "id": lesson_id,
+        "title": f"Lesson {lesson_id}",
+        "course_id": 1234,
+        "module_id": None,
+        "user_id": 1,
+        "created_at": "2023-03-29T11:04:36.691113+11:00",
+        "openable": True,
+        "is_hidden": False,
+        "is_unlisted": False,
+        "is_timed": False,
+        "password": "",
+        "tutorial_regex": "",
+        "prerequisites": [],
+        "available_at": None,
+        "due_at": None,
+        "locked_at": None,
+        "solutions_at": None,
+        "settings": {
+            "quiz_question_number_style": "",
+            "quiz_mode": "multiple-attempts",
+            "quiz_active_status": "active",
+        },
+        "slides": [make_slide(lesson_id, i) for i in range(num_slides)],
+    }
+
+
+def main(num_lessons: int, slides_per_lesson: int) -> None:
+    edstem.auth.set_token("Fake Token")
+    payload = [make_lesson(i, slides_per_lesson) for i in range(num_lessons)]
+    api = MagicMock(spec=EdStemAPI)
+    api.get_all_lessons.return_value = payload
+    course = EdCourse(1234, api=api)
+
+    def deep_copy():
+        return [
+            Lesson.from_dict(copy.deepcopy(l), api=api, copy=False) for l in payload
+        ]
+
+    def owned():
+        fresh = [dict(l) for l in payload]  # Stand-in for freshly decoded JSON
+        return [Lesson.from_dict(l, api=api, copy=False) for l in fresh]
+
+    print(f"{num_lessons} lessons x {slides_per_lesson} slides")
+    for label, func in [
+        ("deepcopy (before)", deep_copy),
+        ("get_all_lessons", course.get_all_lessons),
+        ("copy=False", owned),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"  {label:>18}: {seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*(args + [150, 20][len(args) :]))
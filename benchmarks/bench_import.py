@@ -0,0 +1,43 @@
+"""
+Time to `import edstem` in a fresh interpreter, checked against a budget.
+
+Exits with an error if the median import time is over budget or if importing edstem
+loads pandas.
+
+Usage: PYTHONPATH=. python benchmarks/bench_import.py [budget_ms] [runs]
+"""
+import statistics
+import subprocess
+import sys
+
+CODE = """
+import sys, time
+start = time.perf_counter()
+import edstem
+print(time.perf_counter() - start, 'pandas' in sys.modules)
+"""
+
+
+def main(budget_ms: float, runs: int) -> None:
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE], capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(output[0]) * 1000)
+        if output[1] == "True":
+            sys.exit("import edstem loaded pandas")
+
+    median = statistics.median(times)
+    print(
+        f"import edstem: median {median:.1f} ms, min {min(times):.1f} ms ({runs} runs)"
+    )
+    if median > budget_ms:
+        sys.exit(f"Over budget of {budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 250,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,57 @@
+"""
+Memory held by a large roster of User objects.
+
+Compares the slotted User (no per-instance __dict__, change set made on first edit)
+against an equivalent class with a __dict__ and an eager change set, as before.
+
+Usage: PYTHONPATH=. python benchmarks/bench_memory.py [num_users]
+"""
+import sys
+import tracemalloc
+from unittest.mock import MagicMock
+
+from edstem.ed_api import EdStemAPI
+from edstem.user import User
+
+
+class DictUser(User):
+    # No __slots__, so instances get a __dict__ like before
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._changes = set()
+
+
+def measure(cls, users: list[dict], api: EdStemAPI) -> int:
+    tracemalloc.start()
+    roster = [cls(**u, api=api) for u in users]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del roster
+    return size
+
+
+def main(n: int) -> None:
+    api = MagicMock(spec=EdStemAPI)
+    users = [
+        {
+            "id": i,
+            "role": "student",
+            "name": f"Student {i}",
+            "email": f"student{i}@uw.edu",
+            "tutorial": f"A{i % 20}",
+            "accepted": True,
+        }
+        for i in range(n)
+    ]
+
+    before = measure(DictUser, users, api)
+    after = measure(User, users, api)
+    print(f"{n} users")
+    print(
+        f"  __dict__ + eager set: {before / 2**20:6.1f} MiB ({before / n:.0f} B/user)"
+    )
+    print(f"  __slots__           : {after / 2**20:6.1f} MiB ({after / n:.0f} B/user)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,59 @@
+"""
+Time to parse a synthetic challenge results CSV into a typed DataFrame.
+
+Compares edstem.results.parse_challenge_results (one read_csv pass plus vectorized
+column conversions) against a plain, untyped pandas.read_csv of the same file.
+
+Usage: PYTHONPATH=. python benchmarks/bench_results.py [num_students] [num_testcases]
+"""
+import io
+import random
+import sys
+import timeit
+
+import pandas as pd
+
+from edstem.results import parse_challenge_results
+
+
+def make_csv(num_students: int, num_testcases: int, score_type: str) -> bytes:
+    rng = random.Random(0)
+    out = io.StringIO()
+    tests = [f"Test {i}" for i in range(num_testcases)]
+    out.write(",".join(["Name", "Email", "Tutorial", "Submitted At", *tests]) + "\n")
+    for s in range(num_students):
+        if score_type == "passfail":
+            scores = [rng.choice(["pass", "fail"]) for _ in tests]
+        else:
+            scores = [str(rng.choice([0, 0.5, 1])) for _ in tests]
+        submitted = f"2023-05-{rng.randint(10, 28)}T{rng.randint(10, 23)}:00:00-07:00"
+        row = [f"Student {s}", f"s{s}@uw.edu", f"A{s % 20}", submitted, *scores]
+        out.write(",".join(row) + "\n")
+    return out.getvalue().encode()
+
+
+def main(num_students: int, num_testcases: int) -> None:
+    for score_type in ["pertestcase", "passfail"]:
+        content = make_csv(num_students, num_testcases, score_type)
+        untyped = min(
+            timeit.repeat(lambda: pd.read_csv(io.BytesIO(content)), number=1, repeat=3)
+        )
+        typed = min(
+            timeit.repeat(
+                lambda: parse_challenge_results(content, score_type), number=1, repeat=3
+            )
+        )
+        frame = parse_challenge_results(content, score_type)
+        memory = frame.memory_usage(deep=True).sum()
+        print(
+            f"{score_type} ({num_students} x {num_testcases}, {len(content) / 2**20:.1f} MiB)"
+        )
+        print(f"  read_csv (untyped)     : {untyped * 1000:7.1f} ms")
+        print(
+            f"  parse_challenge_results: {typed * 1000:7.1f} ms, {memory / 2**20:.1f} MiB in memory"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*(args + [5000, 200][len(args) :]))
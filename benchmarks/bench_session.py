@@ -0,0 +1,44 @@
+"""
+Requests/second of EdStemAPI's pooled session against one-off requests.get calls.
+
+Usage: PYTHONPATH=. python benchmarks/bench_session.py [num_requests]
+"""
+import sys
+import time
+
+import requests
+
+import edstem.auth
+from _server import StandInServer
+from edstem.ed_api import EdStemAPI, urljoin
+
+
+def main(n: int) -> None:
+    edstem.auth.set_token("Fake Token")
+
+    with StandInServer({"lesson": {"id": 1, "title": "Benchmark"}}) as server:
+        url = urljoin(server.url, "lessons", 1)
+
+        start = time.perf_counter()
+        for _ in range(n):
+            response = requests.get(url, headers={"Authorization": "Bearer Fake Token"})
+            response.raise_for_status()
+            response.json()
+        unpooled = time.perf_counter() - start
+        unpooled_connections = server.connection_count
+
+        server.connection_count = 0
+        with EdStemAPI() as api:
+            start = time.perf_counter()
+            for _ in range(n):
+                api._get_request(url)
+            pooled = time.perf_counter() - start
+        pooled_connections = server.connection_count
+
+    print(f"{'':>10} {'req/s':>10} {'connections':>12}")
+    print(f"{'requests':>10} {n / unpooled:>10.0f} {unpooled_connections:>12}")
+    print(f"{'session':>10} {n / pooled:>10.0f} {pooled_connections:>12}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
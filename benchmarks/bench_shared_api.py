@@ -0,0 +1,57 @@
+"""
+Object count and time for EdCourse.get_all_users on a large roster.
+
+Compares loading the roster through one shared EdStemAPI with the cost of building
+one client per User (the previous behavior).
+
+Usage: PYTHONPATH=. python benchmarks/bench_shared_api.py [num_users]
+"""
+import gc
+import sys
+import time
+
+import edstem.auth
+from _server import StandInServer
+from edstem import EdCourse
+from edstem.ed_api import EdStemAPI
+
+
+def count_clients() -> int:
+    return sum(isinstance(o, EdStemAPI) for o in gc.get_objects())
+
+
+def main(n: int) -> None:
+    edstem.auth.set_token("Fake Token")
+    users = [
+        {
+            "id": i,
+            "role": "student",
+            "name": f"Student {i}",
+            "email": f"student{i}@uw.edu",
+            "tutorial": f"A{i % 20}",
+            "accepted": True,
+        }
+        for i in range(n)
+    ]
+
+    with StandInServer({"users": users}) as server:
+        EdStemAPI.API_URL = server.url
+        course = EdCourse(1234)
+
+        start = time.perf_counter()
+        roster = course.get_all_users()
+        shared = time.perf_counter() - start
+        print(f"get_all_users ({len(roster)} users): {shared * 1000:.1f} ms")
+        print(f"  live EdStemAPI objects: {count_clients()}")
+
+    start = time.perf_counter()
+    clients = [EdStemAPI() for _ in range(n)]
+    per_object = time.perf_counter() - start
+    print(
+        f"constructing {len(clients)} clients (old per-object cost): "
+        f"{per_object * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,68 @@
+"""
+Time to first submission and peak memory when decoding a large submissions export.
+
+Compares decoding the whole response with json.loads (what get_all_submissions callers
+had to do) against iter_json_array, which decodes submissions as chunks arrive.
+
+Usage: PYTHONPATH=. python benchmarks/bench_submissions.py [num_submissions]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from edstem.ed_api import DOWNLOAD_CHUNK_SIZE
+from edstem.submission import Submission, iter_json_array
+
+
+def make_export(n: int) -> bytes:
+    submissions = [
+        {
+            "id": i,
+            "user_id": i % 2000,
+            "challenge_id": 5,
+            "created_at": "2023-05-18T08:00:00+10:00",
+            "result": {"score": i % 10, "tests": [{"passed": True}] * 20},
+            "code": "x = 1\n" * 200,
+        }
+        for i in range(n)
+    ]
+    return json.dumps({"submissions": submissions}).encode()
+
+
+def chunks(content: bytes):
+    for i in range(0, len(content), DOWNLOAD_CHUNK_SIZE):
+        yield content[i : i + DOWNLOAD_CHUNK_SIZE]
+
+
+def measure(label: str, decode) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for data in decode():
+        Submission.from_dict(data)
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<16}: first after {first * 1000:7.1f} ms, all {count} after "
+        f"{total * 1000:7.1f} ms, peak {peak / 2**20:6.1f} MiB"
+    )
+
+
+def main(n: int) -> None:
+    content = make_export(n)
+    print(f"{n} submissions, {len(content) / 2**20:.1f} MiB")
+    measure(
+        "json.loads",
+        lambda: json.loads(b"".join(chunks(content)))["submissions"],
+    )
+    measure("iter_json_array", lambda: iter_json_array(chunks(content), "submissions"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
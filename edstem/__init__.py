@@ -1,10 +1,29 @@
 import importlib.metadata
 
+from edstem.challenge import Challenge
 from edstem.course import EdCourse
 from edstem.lesson import Lesson
 from edstem.module import Module
+from edstem.quiz_question import QuizQuestion
 from edstem.user import User
 
-from . import challenge, course, ed_api, lesson, module, quiz_question, slide, user
+from . import (
+    async_ed_api,
+    bulk,
+    challenge,
+    changes,
+    course,
+    ed_api,
+    export,
+    lesson,
+    mirror,
+    module,
+    quiz_question,
+    rate_limit,
+    results,
+    slide,
+    submission,
+    user,
+)
 
 # __version__ = importlib.metadata.version("edstem")
@@ -0,0 +1,46 @@
+"""
+Command line tools for the EdStem API
+
+Usage: python -m edstem export <token or token file> <course id> <directory>
+"""
+import argparse
+
+from edstem import auth
+from edstem.ed_api import EdStemAPI
+from edstem.export import export_results
+
+
+def export(args: argparse.Namespace) -> None:
+    with EdStemAPI(pool_maxsize=args.max_workers) as api:
+        report = export_results(
+            api, args.course_id, args.directory, max_workers=args.max_workers
+        )
+    changed = [r for r in report.succeeded if r.value.changed]  # type: ignore
+    print(f"{report}: {len(changed)} of {len(report.results)} files changed")
+    for failure in report.failed:
+        print(f"Failed {failure.key}: {failure.error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m edstem")
+    commands = parser.add_subparsers(required=True)
+
+    export_parser = commands.add_parser(
+        "export",
+        help="Export the results of every lesson, challenge and quiz in a course",
+    )
+    export_parser.add_argument(
+        "token", help="EdStem API token, or a file containing it"
+    )
+    export_parser.add_argument("course_id", type=int)
+    export_parser.add_argument("directory")
+    export_parser.add_argument("--max-workers", type=int, default=8)
+    export_parser.set_defaults(command=export)
+
+    args = parser.parse_args()
+    auth.set_token(args.token)
+    args.command(args)
+
+
+if __name__ == "__main__":
+    main()
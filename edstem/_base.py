@@ -1,10 +1,19 @@
-import copy
+import functools
 from datetime import datetime
-from typing import Any, Generic, NewType, Optional, TypedDict, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    NewType,
+    Optional,
+    TypedDict,
+    TypeVar,
+)
+from zoneinfo import ZoneInfo
 
-from pandas import to_datetime
-
-from edstem.ed_api import EdStemAPI
+from edstem.ed_api import EdStemAPI, get_default_api
 
 # Types
 EdID = NewType("EdID", int)
@@ -13,8 +22,10 @@ UserID = NewType("UserID", int)
 ModuleID = NewType("ModuleID", int)
 LessonID = NewType("LessonID", int)
 SlideID = NewType("SlideID", int)
+QuestionID = NewType("QuestionID", int)
+ChallengeID = NewType("ChallengeID", int)
 
-# Discussion? Quiz Question? Challenge?
+# Discussion?
 
 JSON = dict[str, Any]
 XML = str
@@ -25,7 +36,7 @@ ValueType = TypeVar("ValueType", bound="EdObject")
 
 
 def _rename_dict(d: dict[str, Any], renames: list[tuple[str, str]]) -> dict[str, Any]:
-    d = copy.deepcopy(d)
+    d = dict(d)
     for old_key, new_key in renames:
         d[new_key] = d[old_key]
         del d[old_key]
@@ -57,13 +68,36 @@ def _proper_keys(
 
 
 class EdObject(Generic[IdType]):
+    # Slots keep small, numerous objects (users, slides, ...) compact. Subclasses that are
+    # few in number (e.g. Lesson) don't declare __slots__ and so still get a __dict__.
+    __slots__ = ("_data", "_changed", "_api")
+
     _data: dict[str, Any]
-    _changes: set[str]
+    _changed: set[str] | None
     _api: EdStemAPI
 
-    def __init__(self, **kwargs):
-        self._api = EdStemAPI()
-        self._changes = set()
+    def __init__(self, api: Optional[EdStemAPI] = None, **kwargs):
+        self._api = api if api is not None else get_default_api()
+        self._changed = None
+
+    @property
+    def _changes(self) -> set[str]:
+        # Most objects are never edited, so only make a set once one is needed
+        if self._changed is None:
+            self._changed = set()
+        return self._changed
+
+    @_changes.setter
+    def _changes(self, value: set[str]) -> None:
+        self._changed = value
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if the object has changes that have not been posted to Ed."""
+        return bool(self._changed)
+
+    def _mark_clean(self) -> None:
+        self._changed = None
 
     # Getters all EdObjects will have
     @property
@@ -78,6 +112,8 @@ class EdObject(Generic[IdType]):
     def _filter_id_or_name(
         values: list[ValueType], id_or_name: IdType | str
     ) -> list[ValueType]:
+        if isinstance(values, EdCollection):
+            return values.filter(id_or_name)
         return [v for v in values if v.id == id_or_name or v.name == id_or_name]
 
     @staticmethod
@@ -99,13 +135,26 @@ class EdObject(Generic[IdType]):
     ) -> datetime | None:
         if timestamp is None:
             return None
-        result = to_datetime(timestamp)
+
+        result: datetime
+        if isinstance(timestamp, datetime):
+            result = timestamp
+        else:
+            try:
+                # Ed sends ISO 8601 timestamps, which the standard library parses quickly
+                result = datetime.fromisoformat(timestamp)
+            except ValueError:
+                # Fall back on pandas' lenient parser, which is only imported when needed
+                # since importing pandas is slow
+                from pandas import to_datetime
+
+                result = to_datetime(timestamp).to_pydatetime()
 
         if timezone:
-            if result.tz:
-                result = result.tz_localize(timezone)
+            if result.tzinfo is None:
+                result = result.replace(tzinfo=ZoneInfo(timezone))
             else:
-                result = result.tz_convert(timezone)
+                result = result.astimezone(ZoneInfo(timezone))
         return result
 
     # TODO need to go back to Ed String format?
@@ -130,3 +179,91 @@ class EdObject(Generic[IdType]):
 
     def __hash__(self) -> int:
         return hash(self._tuple())
+
+
+class EdCollection(List[ValueType]):
+    """A list of EdObjects that looks objects up by id or name in constant time.
+
+    The id and name indexes are built on the first lookup and rebuilt after the list is
+    modified. They are not updated when an object in the list is renamed; call reindex()
+    after renaming objects.
+    """
+
+    _by_id: Optional[dict[Any, list[ValueType]]]
+    _by_name: Optional[dict[Any, list[ValueType]]]
+
+    def __init__(self, values: Iterable[ValueType] = ()) -> None:
+        super().__init__(values)
+        self._by_id = None
+        self._by_name = None
+
+    def reindex(self) -> None:
+        by_id: dict[Any, list[ValueType]] = {}
+        by_name: dict[Any, list[ValueType]] = {}
+        for value in self:
+            by_id.setdefault(value.id, []).append(value)
+            by_name.setdefault(value.name, []).append(value)
+        self._by_id = by_id
+        self._by_name = by_name
+
+    def filter(self, id_or_name: int | str) -> list[ValueType]:
+        """Returns every object whose id or name matches, in list order."""
+        if self._by_id is None or self._by_name is None:
+            self.reindex()
+        assert self._by_id is not None and self._by_name is not None
+
+        by_id = self._by_id.get(id_or_name, [])
+        by_name = self._by_name.get(id_or_name, [])
+        if not by_id or not by_name:
+            return list(by_id or by_name)
+        # An object matching both ways (rare) should only be returned once
+        return [v for v in self if v.id == id_or_name or v.name == id_or_name]
+
+    def get(self, id_or_name: int | str) -> ValueType:
+        """Returns the single object whose id or name matches.
+
+        Raises:
+            ValueError: If no objects or more than one object matches
+        """
+        filtered = self.filter(id_or_name)
+        if len(filtered) == 0:
+            raise ValueError(f"Identifier failed to identify any objects: {id_or_name}")
+        elif len(filtered) > 1:
+            raise ValueError(
+                f"Identifier identified too many objects: {id_or_name} (found {len(filtered)})"
+            )
+        return filtered[0]
+
+    def duplicate_names(self) -> dict[str, list[ValueType]]:
+        """Returns the objects sharing a name with another object, grouped by name."""
+        if self._by_name is None:
+            self.reindex()
+        assert self._by_name is not None
+        return {name: vs for name, vs in self._by_name.items() if len(vs) > 1}
+
+
+def _invalidates_index(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self: EdCollection, *args: Any, **kwargs: Any) -> Any:
+        self._by_id = None
+        self._by_name = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(EdCollection, _method, _invalidates_index(getattr(list, _method)))
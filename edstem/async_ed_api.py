@@ -0,0 +1,119 @@
+"""
+Module defining asyncio access to the EdStem API
+
+AsyncEdStemAPI exposes the same endpoints as EdStemAPI as coroutines so many requests
+can be awaited concurrently from a single event loop, e.g.
+
+>>> async with AsyncEdStemAPI(max_concurrency=50) as ed:
+>>>     slides = await asyncio.gather(*(ed.get_slide(s) for s in slide_ids))
+
+Requests are still made with EdStemAPI (and its pooled session) on a private thread
+pool, so no extra HTTP dependency is needed. A semaphore bounds the number of requests
+in flight at once.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from edstem.ed_api import EdStemAPI
+
+T = TypeVar("T")
+
+
+def _mirror(name: str) -> Callable[..., Any]:
+    """Makes a coroutine method that runs EdStemAPI.<name> with the same arguments."""
+    method = getattr(EdStemAPI, name)
+
+    @functools.wraps(method)
+    async def wrapper(self: "AsyncEdStemAPI", *args: Any, **kwargs: Any) -> Any:
+        return await self._call(getattr(self._api, name), *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncEdStemAPI:
+    def __init__(self, max_concurrency: int = 16, api: Optional[EdStemAPI] = None):
+        """Initializes asyncio access to the EdStem API.
+
+        Optional Args:
+            max_concurrency: Maximum number of requests in flight at once
+            api: EdStemAPI used to send requests. By default a new one is made with a
+              connection pool large enough for max_concurrency requests. A given api
+              must have a pool_maxsize of at least max_concurrency, and is not closed by
+              close(), since it may be shared.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive: {max_concurrency}")
+        if api is not None and api.pool_maxsize < max_concurrency:
+            raise ValueError(
+                f"max_concurrency ({max_concurrency}) is larger than the api's "
+                f"pool_maxsize ({api.pool_maxsize}), so extra connections would be "
+                "opened and discarded"
+            )
+        self._owns_api = api is None
+        self._api = api if api is not None else EdStemAPI(pool_maxsize=max_concurrency)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="edstem"
+        )
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    def close(self) -> None:
+        """Shuts down the worker threads and closes the connections of its own api."""
+        self._executor.shutdown(wait=True)
+        if self._owns_api:
+            self._api.close()
+
+    async def __aenter__(self) -> "AsyncEdStemAPI":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        # Waiting for the worker threads would otherwise block the event loop
+        await asyncio.to_thread(self.close)
+
+    # Enrollment info
+    get_all_users = _mirror("get_all_users")
+    edit_user = _mirror("edit_user")
+
+    # Lessons, modules and slides
+    get_all_lessons = _mirror("get_all_lessons")
+    get_all_modules = _mirror("get_all_modules")
+    edit_module = _mirror("edit_module")
+    get_lesson = _mirror("get_lesson")
+    get_slide = _mirror("get_slide")
+    create_lesson = _mirror("create_lesson")
+    edit_lesson = _mirror("edit_lesson")
+    clone_slide = _mirror("clone_slide")
+    edit_slide = _mirror("edit_slide")
+    delete_slide = _mirror("delete_slide")
+
+    # Quiz questions
+    get_questions = _mirror("get_questions")
+    edit_question = _mirror("edit_question")
+    delete_question = _mirror("delete_question")
+
+    # Results
+    get_lesson_completions = _mirror("get_lesson_completions")
+    get_challenge_results = _mirror("get_challenge_results")
+    get_quiz_results = _mirror("get_quiz_results")
+    download_lesson_completions = _mirror("download_lesson_completions")
+    download_challenge_results = _mirror("download_challenge_results")
+    download_quiz_results = _mirror("download_quiz_results")
+
+    # Challenges and submissions
+    post_grades = _mirror("post_grades")
+    connect_user_to_workspace = _mirror("connect_user_to_workspace")
+    submit_all_challenge = _mirror("submit_all_challenge")
+    submit_all_quiz = _mirror("submit_all_quiz")
+    get_all_users_for_challenge = _mirror("get_all_users_for_challenge")
+    get_all_users_analytics = _mirror("get_all_users_analytics")
+    get_all_submissions = _mirror("get_all_submissions")
+    get_all_submissions_for_user = _mirror("get_all_submissions_for_user")
+    delete_submission = _mirror("delete_submission")
@@ -0,0 +1,161 @@
+"""
+Module for running many EdStem API calls concurrently
+
+run_bulk applies a function to many items on a bounded thread pool. Instead of stopping
+at the first error, it records the outcome of every item in a BulkReport so callers can
+inspect (or retry) just the items that failed.
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, cast
+
+import requests
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[ResultType]):
+    key: Any
+    ok: bool
+    value: Optional[ResultType] = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    skipped: bool = False
+
+    def result(self) -> ResultType:
+        """Returns the value, or raises the error if the item failed (like Future.result)."""
+        if not self.ok:
+            assert self.error is not None
+            raise self.error
+        return cast(ResultType, self.value)
+
+
+@dataclass(frozen=True)
+class BulkReport(Generic[ResultType]):
+    results: list[BulkResult[ResultType]]  # In the same order as the input items
+    elapsed: float  # Seconds
+    dry_run: bool = False  # Nothing was done; succeeded lists what would have been
+
+    @property
+    def succeeded(self) -> list[BulkResult[ResultType]]:
+        return [r for r in self.results if r.ok and not r.skipped]
+
+    @property
+    def failed(self) -> list[BulkResult[ResultType]]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def skipped(self) -> list[BulkResult[ResultType]]:
+        return [r for r in self.results if r.skipped]
+
+    def values(self) -> list[ResultType]:
+        """Returns the value of every processed (not skipped) item, in input order.
+
+        Raises:
+            The error of the first item that failed
+        """
+        return [r.result() for r in self.results if not r.skipped]
+
+    @property
+    def throughput(self) -> float:
+        """Items processed (not skipped) per second."""
+        processed = len(self.results) - len(self.skipped)
+        return processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        dry_run = ", dry_run=True" if self.dry_run else ""
+        return (
+            f"BulkReport(succeeded={len(self.succeeded)}, failed={len(self.failed)}, "
+            f"skipped={len(self.skipped)}, elapsed={self.elapsed:.2f}s{dry_run})"
+        )
+
+
+def is_transient(error: BaseException) -> bool:
+    """Returns True if the error is worth retrying (connection problems, 429 and 5xx)."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def run_bulk(
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    key: Optional[Callable[[ItemType], Any]] = None,
+    max_workers: int = 8,
+    retries: int = 0,
+    backoff: float = 0.5,
+    skip: Optional[Callable[[ItemType], bool]] = None,
+    on_result: Optional[Callable[[BulkResult[ResultType]], None]] = None,
+    dry_run: bool = False,
+) -> BulkReport[ResultType]:
+    """Calls func on every item using at most max_workers threads.
+
+    Args:
+        func: Function to call on each item
+        items: Items to process
+    Optional Args:
+        key: Function giving the identifier recorded for an item. Defaults to the item.
+        max_workers: Maximum number of concurrent calls
+        retries: Number of times to retry an item that failed with a transient error.
+          EdStemAPI already retries each request that is safe to retry (see its
+          max_retries), so bulk operations built on it leave this at 0 rather than
+          multiplying the attempts.
+        backoff: Base delay in seconds between retries. Doubles (with jitter) each retry.
+        skip: Items for which this returns True are not processed
+        on_result: Called with each item's result as soon as it finishes. Always called
+          from the calling thread, so it does not need to be thread-safe.
+        dry_run: If True, func is never called. Every item that would be processed is
+          reported as succeeded (with no value), so the report lists what would be done.
+
+    Returns:
+        A BulkReport with one result per item, in input order
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be positive: {max_workers}")
+    key_of = key if key is not None else (lambda item: item)
+
+    def attempt(item: ItemType) -> BulkResult[ResultType]:
+        for attempt_number in range(1, retries + 2):
+            try:
+                return BulkResult(
+                    key_of(item), True, func(item), attempts=attempt_number
+                )
+            except Exception as e:
+                if attempt_number > retries or not is_transient(e):
+                    return BulkResult(
+                        key_of(item), False, error=e, attempts=attempt_number
+                    )
+                delay = backoff * 2 ** (attempt_number - 1)
+                time.sleep(delay * random.uniform(0.5, 1.5))
+        raise AssertionError("unreachable")
+
+    start = time.perf_counter()
+    results: dict[int, BulkResult[ResultType]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for i, item in enumerate(items):
+            if skip is not None and skip(item):
+                results[i] = BulkResult(key_of(item), True, skipped=True)
+            elif dry_run:
+                results[i] = BulkResult(key_of(item), True)
+            else:
+                futures[executor.submit(attempt, item)] = i
+                continue
+            if on_result is not None:
+                on_result(results[i])
+
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    elapsed = time.perf_counter() - start
+
+    return BulkReport([results[i] for i in range(len(results))], elapsed, dry_run)
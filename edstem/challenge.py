@@ -1,2 +1,113 @@
-class Challenge:
-    pass
+"""
+Module defining coding challenges and a cache of their users, submissions and results
+
+Each of these needs a request (the results and submissions can be large downloads), so a
+Challenge loads them on first use and keeps them until refresh() is called:
+
+>>> challenge = lesson.get_slide("Homework 1").challenge
+>>> challenge.latest_submissions()  # Downloads submissions once
+>>> challenge.best_submissions()  # Served from the cache
+>>> challenge.refresh()  # The next access downloads again
+"""
+from typing import TYPE_CHECKING, Any, Optional
+
+import edstem._base as base
+from edstem.ed_api import EdStemAPI
+from edstem.results import parse_challenge_results
+from edstem.submission import Submission, SubmissionIndex
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class Challenge(base.EdObject[base.ChallengeID]):
+    __slots__ = ("_id", "_name", "_users", "_submissions", "_results")
+
+    def __init__(
+        self,
+        challenge_id: base.ChallengeID,
+        name: str = "",
+        api: Optional[EdStemAPI] = None,
+    ) -> None:
+        """Initializes a challenge. Nothing is downloaded until it is needed.
+
+        Args:
+            challenge_id: Identifier for challenge (not the same as a slide_id)
+        Optional Args:
+            name: Name of the challenge, usually its slide's title
+            api: Client used to send requests. Defaults to the default client.
+        """
+        super().__init__(api)
+        self._id = challenge_id
+        self._name = name
+        self._users: Optional[list[base.JSON]] = None
+        self._submissions: dict[str, SubmissionIndex] = {}
+        self._results: dict[tuple, "DataFrame"] = {}
+
+    @property
+    def id(self) -> base.ChallengeID:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def _tuple(self) -> tuple:
+        return (self.id,)
+
+    def __repr__(self) -> str:
+        return f"Challenge(id={self.id}, name={self.name})"
+
+    def refresh(self) -> None:
+        """Forgets cached users, submissions and results so they are downloaded again."""
+        self._users = None
+        self._submissions.clear()
+        self._results.clear()
+
+    def users(self, refresh: bool = False) -> list[base.JSON]:
+        """Returns the users with access to this challenge, as returned by Ed.
+
+        Optional Args:
+            refresh: If True, downloads the users again even if they are cached
+        """
+        if self._users is None or refresh:
+            self._users = self._api.get_all_users_for_challenge(self.id)
+        return self._users
+
+    def submissions(self, type: str = "all", refresh: bool = False) -> SubmissionIndex:
+        """Returns this challenge's submissions, indexed by user.
+
+        Optional Args:
+            type: Which submissions to download. Options: 'latest', 'optimised', 'all'
+            refresh: If True, downloads the submissions again even if they are cached
+        """
+        if type not in self._submissions or refresh:
+            self._submissions[type] = SubmissionIndex(
+                self._api.iter_submissions(self.id, type=type)
+            )
+        return self._submissions[type]
+
+    def latest_submissions(self, refresh: bool = False) -> dict[int, Submission]:
+        """Returns each user's latest submission, keyed by user id."""
+        return self.submissions(refresh=refresh).latest(self.id)
+
+    def best_submissions(self, refresh: bool = False) -> dict[int, Submission]:
+        """Returns each user's best submission, keyed by user id."""
+        return self.submissions(refresh=refresh).best(self.id)
+
+    def results(self, refresh: bool = False, **options: Any) -> "DataFrame":
+        """Returns this challenge's results as a DataFrame (see parse_challenge_results).
+
+        Results are cached separately for each set of options.
+
+        Optional Args:
+            refresh: If True, downloads the results again even if they are cached
+            **options: Same optional arguments as EdStemAPI.get_challenge_results
+        """
+        key = tuple(sorted(options.items()))
+        if key not in self._results or refresh:
+            content = self._api.get_challenge_results(self.id, **options)
+            self._results[key] = parse_challenge_results(
+                content, options.get("score_type", "pertestcase")
+            )
+        return self._results[key]
@@ -0,0 +1,98 @@
+"""
+Module defining ChangeSet, a unit of work for posting edits to many objects at once
+
+Calling post_changes on each edited object posts them one at a time. A ChangeSet
+collects edited lessons, slides, modules and users and posts only the dirty ones,
+concurrently, in a single flush:
+
+>>> with ChangeSet(max_workers=8) as changes:
+>>>     for lesson in course.get_all_lessons():
+>>>         lesson.schedule.due_at = new_due_date
+>>>         changes.add(lesson)
+
+A lesson's dirty slides are posted alongside the lesson itself rather than one after
+another. Objects that fail to post stay dirty (and in the ChangeSet), so flushing again
+retries just those.
+"""
+from typing import Any, Callable, Iterable, Optional
+
+from edstem._base import EdObject
+from edstem.bulk import BulkReport, run_bulk
+from edstem.lesson import Lesson
+
+
+class ChangeSet:
+    def __init__(self, max_workers: int = 8, retries: int = 0):
+        """Initializes an empty ChangeSet.
+
+        Optional Args:
+            max_workers: Maximum number of objects posted at once
+            retries: Number of times to retry posting an object after a transient error
+        """
+        self.max_workers = max_workers
+        self.retries = retries
+        self.last_report: Optional[BulkReport[Any]] = None
+        # Keyed by identity, since an object's hash changes as it is edited
+        self._objects: dict[int, EdObject] = {}
+
+    def add(self, *objects: EdObject) -> None:
+        """Tracks objects whose changes should be posted on the next flush."""
+        for obj in objects:
+            self._objects[id(obj)] = obj
+
+    def add_all(self, objects: Iterable[EdObject]) -> None:
+        self.add(*objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def dirty(self) -> list[EdObject]:
+        """Tracked objects with changes that have not been posted."""
+        return [obj for obj in self._objects.values() if obj.is_dirty]
+
+    def _pending(self) -> list[tuple[EdObject, Callable[[], Any]]]:
+        """Splits dirty objects into independent posts."""
+        pending: list[tuple[EdObject, Callable[[], Any]]] = []
+        for obj in self.dirty:
+            if isinstance(obj, Lesson):
+                pending.extend(
+                    (slide, slide.post_changes)
+                    for slide in obj._slides or []
+                    if slide.is_dirty
+                )
+                if obj._changed:
+                    pending.append((obj, obj._post_lesson_changes))
+            else:
+                pending.append((obj, obj.post_changes))  # type: ignore
+        return pending
+
+    def flush(self) -> BulkReport[Any]:
+        """Posts the changes of every dirty object, concurrently.
+
+        Clean objects are skipped without any requests. Objects that posted successfully
+        are no longer tracked.
+
+        Returns:
+            A BulkReport with one result per post, keyed by the object posted (a dirty
+            slide of a lesson is posted, and reported, separately from the lesson)
+        """
+        self.last_report = run_bulk(
+            lambda post: post[1](),
+            self._pending(),
+            key=lambda post: post[0],
+            max_workers=self.max_workers,
+            retries=self.retries,
+        )
+        self._objects = {key: obj for key, obj in self._objects.items() if obj.is_dirty}
+        return self.last_report
+
+    def __enter__(self) -> "ChangeSet":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        # Nothing is posted if the block raised
+        if exc_type is None:
+            report = self.flush()
+            if report.failed:
+                raise report.failed[0].error  # type: ignore
@@ -1,10 +1,13 @@
 import itertools
-from typing import Any, Optional, TypeVar
+from typing import Any, Dict, Optional, TypeVar
 
 from edstem._base import *
-from edstem.ed_api import EdStemAPI
+from edstem.bulk import BulkReport
+from edstem.ed_api import EdStemAPI, get_default_api
+from edstem.export import ExportedFile, export_results
 from edstem.lesson import Lesson
 from edstem.module import Module
+from edstem.quiz_question import QuizQuestion
 from edstem.user import User
 
 
@@ -12,15 +15,17 @@ class EdCourse(EdObject[CourseID]):
     course_id: int
     _api: EdStemAPI
 
-    def __init__(
-        self, course_id: CourseID
-    ):  # , api_constructor: Optional[Callable[[str], EdStemAPI]] = None):
+    def __init__(self, course_id: CourseID, api: Optional[EdStemAPI] = None):
+        # Every object loaded through this course shares its API client
         self.course_id = course_id
-        self._api = EdStemAPI()
+        self._api = api if api is not None else get_default_api()
 
     # Users
-    def get_all_users(self) -> list[User]:
-        return [User.from_dict(u) for u in self._api.get_all_users(self.course_id)]
+    def get_all_users(self) -> EdCollection[User]:
+        return EdCollection(
+            User.from_dict(u, api=self._api)
+            for u in self._api.get_all_users(self.course_id)
+        )
 
     def get_user(self, user: UserID | str) -> User:
         users = self.get_all_users()
@@ -42,18 +47,47 @@ class EdCourse(EdObject[CourseID]):
     ## TODO Get analytics users?
 
     # Modules
-    def get_all_modules(self) -> list[Module]:
-        return [Module.from_dict(m) for m in self._api.get_all_modules(self.course_id)]
+    def get_all_modules(self) -> EdCollection[Module]:
+        return EdCollection(
+            Module.from_dict(m, api=self._api)
+            for m in self._api.get_all_modules(self.course_id)
+        )
 
     def get_module(self, id_or_name: ModuleID | str) -> Module:
         modules = self.get_all_modules()
         return EdObject._filter_single_id_or_name(modules, id_or_name)
 
     # Lessons
-    def get_all_lessons(self) -> list[Lesson]:
+    def get_all_lessons(self) -> EdCollection[Lesson]:
         lessons = self._api.get_all_lessons(self.course_id)
-        return [Lesson.from_dict(l) for l in lessons]
+        return EdCollection(Lesson.from_dict(l, api=self._api) for l in lessons)
 
     def get_lesson(self, id_or_name: LessonID | str) -> Lesson:
         lessons = self.get_all_lessons()
         return EdObject._filter_single_id_or_name(lessons, id_or_name)
+
+    # Quiz questions
+    def get_all_questions(
+        self, max_workers: int = 8
+    ) -> dict[SlideID, EdCollection[QuizQuestion]]:
+        """Gets the questions of every quiz slide in this course, concurrently."""
+        lesson_ids = [lesson.id for lesson in self.get_all_lessons()]
+        quizzes: list[SlideID] = []
+        for lesson in self._api.get_lessons_bulk(lesson_ids, max_workers).values():
+            slides = lesson.get("slides", [])
+            quizzes.extend(s["id"] for s in slides if s["type"] == "quiz")
+        return QuizQuestion.get_questions_by_slide(quizzes, self._api, max_workers)
+
+    # Results
+    def export_results(
+        self,
+        directory: str,
+        max_workers: int = 8,
+        retries: int = 0,
+        options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> BulkReport[ExportedFile]:
+        """Downloads the results of every lesson, challenge and quiz in this course
+        into directory. See edstem.export.export_results."""
+        return export_results(
+            self._api, self.course_id, directory, max_workers, retries, options
+        )
@@ -8,18 +8,57 @@ Every request requires you authenticate. In order to do this, you will need your
 authentication token from EdStem. You can access your token by looking at network requests
 on EdStem and finding a request with an x-token header.
 """
+import contextlib
+import dataclasses
+import email.utils
 import itertools
 import json
-from typing import Any, Dict, List, Optional
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from edstem.auth import get_token
+from edstem.bulk import BulkReport, BulkResult, run_bulk
+from edstem.rate_limit import RequestStats, TokenBucket
+from edstem.submission import Submission, iter_json_array
 
 # Special type to indicate only a 0 or 1 should be passed
 BinaryFlag = int
 
+# Methods that are safe to retry after a server error
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# Where a download is written: a file path or a binary file-like object
+Destination = str | os.PathLike | BinaryIO
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class DownloadStats:
+    bytes: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+class EditConflictError(requests.HTTPError):
+    """Raised when an edit is rejected because the object changed since it was read.
+
+    The change may be the edit itself: if Ed applied a write but answered with a 5xx, the
+    automatic retry is rejected because of the first attempt. Read the object again to
+    tell the two apart before re-applying an edit.
+    """
+
 
 def urljoin(*parts):
     """Combines parts of a URL into a fully path.
@@ -41,8 +80,54 @@ def urljoin(*parts):
 class EdStemAPI:
     API_URL = f"https://us.edstem.org/api/"
 
-    def __init__(self):
-        """Initializes access to the EdStem API."""
+    def __init__(
+        self,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        lessons_cache_ttl: float = 0.0,
+        conditional_get: bool = False,
+    ):
+        """Initializes access to the EdStem API.
+
+        All requests are sent through a single pooled session so connections (and their
+        TLS handshakes) are reused between calls.
+
+        Optional Args:
+            pool_connections: Number of per-host connection pools to keep. Almost all traffic
+              goes to a single Ed host, so the default of 1 is usually enough.
+            pool_maxsize: Maximum number of connections kept open per host. Should be at least
+              the number of threads sharing this object.
+            pool_block: If True, block when all pooled connections to a host are in use instead
+              of opening (and then discarding) an extra connection.
+            keep_alive: If False, ask the server to close each connection after the response.
+            rate_limit: Target requests per second. When set, requests are spaced out with a
+              token bucket that slows down whenever Ed responds with 429 (Too Many Requests).
+              By default requests are not rate limited.
+            burst: Requests allowed at once after being idle when rate_limit is set
+            max_retries: Number of times a request is retried after a 429 response, or after
+              a 5xx response or connection error for idempotent (GET/PUT/DELETE) requests.
+              This is the only layer that retries by default: the bulk methods' retries
+              argument defaults to 0.
+            backoff: Base delay in seconds between retries, doubled (with jitter) each retry.
+              A Retry-After header from Ed takes precedence.
+            max_backoff: Largest delay in seconds between retries
+            lessons_cache_ttl: Seconds a course's lessons/modules listing is reused before
+              being fetched again. Writes made through this object invalidate it early.
+              Off (0) by default, since the cached JSON is then shared between calls and
+              must not be modified (e.g. by models loaded with copy=False).
+            conditional_get: If True, remember the ETag/Last-Modified validators of each GET
+              and send them with the next GET of the same URL. When Ed answers 304 (Not
+              Modified), the previously parsed JSON is returned without downloading or
+              decoding it again. Returned JSON is then shared between calls and must not be
+              modified.
+        """
         token = get_token()
         if token is None:
             raise ValueError(
@@ -51,6 +136,135 @@ class EdStemAPI:
         self._token = token
         self._course_id = None  # TODO fix methods that rely on this
 
+        self._pool_maxsize = pool_maxsize
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["Authorization"] = "Bearer " + self._token
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+        self.rate_limiter = (
+            TokenBucket(rate_limit, burst) if rate_limit is not None else None
+        )
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._stats = RequestStats()
+        self._stats_lock = threading.Lock()
+
+        self._lessons_cache_ttl = lessons_cache_ttl
+        self._course_lessons: dict[int, tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+
+        self._conditional_get = conditional_get
+        self._validated: dict[str, tuple[Dict[str, str], Dict[str, Any]]] = {}
+
+    @property
+    def stats(self) -> RequestStats:
+        """A snapshot of the request, retry and throttling counters for this object."""
+        with self._stats_lock:
+            return dataclasses.replace(self._stats)
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Maximum number of connections kept open per host."""
+        return self._pool_maxsize
+
+    def close(self) -> None:
+        """Closes all pooled connections held by this object."""
+        self._session.close()
+
+    def __enter__(self) -> "EdStemAPI":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _count(self, **increments: float) -> None:
+        with self._stats_lock:
+            for name, amount in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    def _retry_delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        if response is not None and "Retry-After" in response.headers:
+            retry_after = response.headers["Retry-After"]
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+                if retry_at.tzinfo is None:
+                    # A "-0000" offset means UTC without saying so
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass  # A malformed header falls back to exponential backoff
+        delay = min(self._max_backoff, self._backoff * 2**attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Sends a request to EdStem, rate limiting and retrying as configured.
+
+        Args:
+            method: HTTP method
+            url: URL endpoint to hit
+            **kwargs: Passed on to requests
+
+        Returns:
+            The successful response
+
+        Raises:
+            HTTPError: If there was an error with the HTTP request that was not resolved by
+              retrying
+        """
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self._count(waited=self.rate_limiter.acquire())
+
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._count(connection_errors=1)
+                if not idempotent or attempt >= self._max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                self._count(requests=1)
+                status = response.status_code
+                if status == 429:
+                    # Throttled requests were never processed, so any method can be retried
+                    self._count(throttled=1)
+                    delay = self._retry_delay(attempt, response)
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.slow_down(delay)
+                    if attempt >= self._max_retries:
+                        response.raise_for_status()
+                elif status >= 500:
+                    self._count(server_errors=1)
+                    if not idempotent or attempt >= self._max_retries:
+                        response.raise_for_status()
+                    delay = self._retry_delay(attempt, response)
+                else:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.speed_up()
+                    response.raise_for_status()
+                    return response
+                # Give a streamed response's connection back to the pool
+                response.close()
+
+            self._count(retries=1, waited=delay)
+            time.sleep(delay)
+            attempt += 1
+
     # General functions for GET/POST
     def _get_request(
         self, url: str, query_params: Dict[str, Any] = {}
@@ -67,11 +281,43 @@ class EdStemAPI:
         Raises:
             HTTPError: If there was an error with the HTTP request
         """
-        response = requests.get(
-            url, params=query_params, headers={"Authorization": "Bearer " + self._token}
-        )
-        response.raise_for_status()
-        return response.json()
+        if not self._conditional_get:
+            return self._request("GET", url, params=query_params).json()
+
+        key = requests.Request("GET", url, params=query_params).prepare().url or url
+        with self._cache_lock:
+            cached = self._validated.get(key)
+
+        headers = cached[0] if cached is not None else {}
+        response = self._request("GET", url, params=query_params, headers=headers)
+        if response.status_code == 304:
+            if cached is not None:
+                self._count(cache_hits=1)
+                return cached[1]
+            # Nothing to reuse (e.g. the entry was dropped), so ask for the full body
+            response.close()
+            response = self._request(
+                "GET", url, params=query_params, headers={"Cache-Control": "no-cache"}
+            )
+            if response.status_code == 304:
+                raise requests.HTTPError(
+                    f"304 Not Modified without a cached response for url: {url}",
+                    response=response,
+                )
+
+        self._count(cache_misses=1)
+        body = response.json()
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        with self._cache_lock:
+            if validators:
+                self._validated[key] = (validators, body)
+            else:
+                self._validated.pop(key, None)
+        return body
 
     def _post_request(
         self, url: str, query_params: Dict[str, Any] = {}, json: Dict[str, Any] = {}
@@ -89,13 +335,12 @@ class EdStemAPI:
         Raises:
             HTTPError: If there was an error with the HTTP request
         """
-        response = requests.post(
+        response = self._request(
+            "POST",
             url,
             params=query_params,
             json=json,
-            headers={"Authorization": "Bearer " + self._token},
         )
-        response.raise_for_status()
         return response.content
 
     def _put_request(
@@ -104,6 +349,7 @@ class EdStemAPI:
         query_params: Dict[str, Any] = {},
         json: Dict[str, Any] = {},
         data: Dict[str, Any] = {},
+        headers: Dict[str, str] = {},
     ) -> bytes:
         """Sends a PUT request to EdStem.
 
@@ -111,23 +357,50 @@ class EdStemAPI:
             url: URL endpoint to hit
             query_params: A dictionary of query parameters and values
             json: A dictionary of parameters and values to pass as the payload
+            headers: Extra headers, e.g. preconditions from _unmodified_since
 
         Returns:
             A binary string containing response content
 
         Raises:
+            EditConflictError: If a precondition in headers failed
             HTTPError: If there was an error with the HTTP request
         """
-        response = requests.put(
-            url,
-            params=query_params,
-            json=json,
-            data=data,
-            headers={"Authorization": "Bearer " + self._token},
-        )
-        response.raise_for_status()
+        try:
+            response = self._request(
+                "PUT",
+                url,
+                params=query_params,
+                json=json,
+                data=data,
+                headers=headers,
+            )
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 412:
+                raise EditConflictError(
+                    f"{url} was modified after it was read", response=e.response
+                ) from e
+            raise
         return response.content
 
+    @staticmethod
+    def _unmodified_since(current: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Headers asking Ed to reject a write if the object changed after updated_at."""
+        updated_at = current.get("updated_at") if current is not None else None
+        if not updated_at:
+            return {}
+        try:
+            timestamp = datetime.fromisoformat(updated_at)
+        except (TypeError, ValueError):
+            return {}  # Send the write unconditionally rather than failing it
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        # HTTP dates have whole seconds, so round up or the object looks modified
+        if timestamp.microsecond:
+            timestamp = timestamp.replace(microsecond=0) + timedelta(seconds=1)
+        timestamp = timestamp.astimezone(timezone.utc)
+        return {"If-Unmodified-Since": email.utils.format_datetime(timestamp, True)}
+
     def _patch_request(
         self,
         url: str,
@@ -148,14 +421,13 @@ class EdStemAPI:
         Raises:
             HTTPError: If there was an error with the HTTP request
         """
-        response = requests.patch(
+        response = self._request(
+            "PATCH",
             url,
             params=query_params,
             json=json,
             data=data,
-            headers={"Authorization": "Bearer " + self._token},
         )
-        response.raise_for_status()
         return response
 
     def _delete_request(
@@ -178,16 +450,52 @@ class EdStemAPI:
         Raises:
             HTTPError: If there was an error with the HTTP request
         """
-        response = requests.delete(
+        response = self._request(
+            "DELETE",
             url,
             params=query_params,
             json=json,
             data=data,
-            headers={"Authorization": "Bearer " + self._token},
         )
-        response.raise_for_status()
         return response.content
 
+    def _download(
+        self,
+        url: str,
+        query_params: Dict[str, Any],
+        destination: Destination,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> DownloadStats:
+        """Sends a POST request to EdStem and streams the response into a file.
+
+        Args:
+            url: URL endpoint to hit
+            query_params: A dictionary of query parameters and values
+            destination: Path of the file to write, or a binary file-like object
+            chunk_size: Number of bytes read from the network at a time
+
+        Returns:
+            Number of bytes downloaded and the time taken
+
+        Raises:
+            HTTPError: If there was an error with the HTTP request
+        """
+        start = time.perf_counter()
+        written = 0
+        with self._request(
+            "POST", url, params=query_params, json={}, stream=True
+        ) as response:
+            with contextlib.ExitStack() as stack:
+                f: BinaryIO
+                if isinstance(destination, (str, os.PathLike)):
+                    f = stack.enter_context(open(destination, "wb"))
+                else:
+                    f = destination
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+        return DownloadStats(written, time.perf_counter() - start)
+
     # Enrollment info
     def get_all_users(self, course_id: int) -> list[dict[str, Any]]:
         admin_path = urljoin(EdStemAPI.API_URL, f"courses/{course_id}/admin")
@@ -200,49 +508,106 @@ class EdStemAPI:
         user_dict = {"user": data}
         return self._patch_request(user_path, json=user_dict).json()["user"]
 
+    # Course lessons/modules listing (shared by lessons and modules)
+    def _get_course_lessons(self, course_id: int) -> Dict[str, Any]:
+        """Gets the lessons and modules for a course. Endpoint: /courses/{course_id}/lessons
+
+        The response is cached for lessons_cache_ttl seconds, so lessons, modules and lookups
+        for the same course share one request. The cached JSON is shared between callers and
+        must not be modified.
+
+        Returns:
+            A JSON object with "lessons" and "modules" lists
+        """
+        with self._cache_lock:
+            cached = self._course_lessons.get(course_id)
+        if cached is not None:
+            fetched_at, payload = cached
+            if time.monotonic() - fetched_at < self._lessons_cache_ttl:
+                return payload
+
+        lessons_path = urljoin(EdStemAPI.API_URL, f"courses/{course_id}/lessons")
+        payload = self._get_request(lessons_path)
+        if self._lessons_cache_ttl > 0:
+            with self._cache_lock:
+                self._course_lessons[course_id] = (time.monotonic(), payload)
+        return payload
+
+    def _invalidate_course(self, *course_ids: Optional[int]) -> None:
+        """Invalidates the first of course_ids that is known, or every course if none is."""
+        known = [course_id for course_id in course_ids if course_id is not None]
+        self.invalidate_course_cache(known[0] if known else None)
+
+    def invalidate_course_cache(self, course_id: Optional[int] = None) -> None:
+        """Forgets the cached lessons/modules listing of a course.
+
+        Args:
+            course_id: Course to forget, or None to forget every course
+        """
+        with self._cache_lock:
+            if course_id is None:
+                self._course_lessons.clear()
+            else:
+                self._course_lessons.pop(course_id, None)
+
     # Get lesson info
     def get_all_lessons(self, course_id: int) -> list[dict[str, Any]]:
         """Gets all lessons for a course. Endpoint: /courses/{course_id}/lessons
 
         Returns:
-            A list of JSON objects, one for each lesson.
+            A list of JSON objects, one for each lesson. Shared with the course cache, so
+            it must not be modified.
         """
-        lessons_path = urljoin(EdStemAPI.API_URL, f"courses/{course_id}/lessons")
-        lessons = self._get_request(lessons_path)
-        return lessons["lessons"]
+        return self._get_course_lessons(course_id)["lessons"]
 
     # Get module info
     def get_all_modules(self, course_id: int) -> list[dict[str, Any]]:
         """Gets all modules for a course. Endpoint: /courses/{}/lessons
 
         Returns:
-            A list of JSON objects, one for each module.
+            A list of JSON objects, one for each module. Shared with the course cache, so
+            it must not be modified.
         """
-        lessons_path = urljoin(EdStemAPI.API_URL, f"courses/{course_id}/lessons")
-        lessons = self._get_request(lessons_path)
-        return lessons["modules"]
+        return self._get_course_lessons(course_id)["modules"]
 
     # Edit module info
     def edit_module(
-        self, course_id: int, module_id: int, data: dict[str, Any]
+        self,
+        course_id: int,
+        module_id: int,
+        data: dict[str, Any],
+        current: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Modifies an existing Ed Module. Endpoint: /lessons/modules/{module_id}
 
         Args:
             module_id: Identifier for module
             data: Dictionary of options to set on the module
+        Optional Args:
+            current: The module's full current data (e.g. Module._data). If given, it is
+              sent with data applied instead of reading the module from Ed first, and the
+              edit raises EditConflictError if Ed reports the module changed since its
+              updated_at.
 
         Returns:
             A JSON object with the updated module's metadata
         """
-        modules = self.get_all_modules(course_id)
-        modules = [m for m in modules if m["id"] == module_id]
-        assert len(modules) == 1
-        module = modules[0]
+        if current is None:
+            modules = self.get_all_modules(course_id)
+            modules = [m for m in modules if m["id"] == module_id]
+            assert len(modules) == 1
+            current = modules[0]
 
         module_path = urljoin(EdStemAPI.API_URL, f"lessons/modules/{module_id}")
-        module_dict = {"module": module | data}
-        module = json.loads(self._put_request(module_path, json=module_dict))["module"]
+        module_dict = {"module": current | data}
+        module = json.loads(
+            self._put_request(
+                module_path,
+                json=module_dict,
+                headers=self._unmodified_since(current),
+            )
+        )["module"]
+        self.invalidate_course_cache(course_id)
         return module
 
     def get_lesson(self, lesson_id: int) -> Dict[str, Any]:
@@ -258,6 +623,25 @@ class EdStemAPI:
         lesson = self._get_request(lesson_path)["lesson"]
         return lesson
 
+    def get_lessons_bulk(
+        self, lesson_ids: Iterable[int], max_workers: int = 8, retries: int = 0
+    ) -> BulkReport[Dict[str, Any]]:
+        """Gets many lessons, with their slides, concurrently.
+
+        Args:
+            lesson_ids: Lessons to get
+        Optional Args:
+            max_workers: Maximum number of lessons fetched at once
+            retries: Number of times to retry a lesson after a transient error
+
+        Returns:
+            A BulkReport keyed by lesson id, whose values are each lesson's metadata. Call
+            values() on it to get the lessons in order, raising the first failure.
+        """
+        return run_bulk(
+            self.get_lesson, lesson_ids, max_workers=max_workers, retries=retries
+        )
+
     def get_slide(self, slide_id: int) -> Dict[str, Any]:
         """Gets metadata for a single slide. Endpoint: /lessons/slides/{slide_id}
 
@@ -272,40 +656,63 @@ class EdStemAPI:
         return slide
 
     def create_lesson(
-        self, title: Optional[str] = None, options: Dict[str, Any] = {}
+        self,
+        title: Optional[str] = None,
+        options: Dict[str, Any] = {},
+        course_id: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Creates a new Ed lesson. Endpoint: /courses/{course_id}/lessons
 
         Args:
             title: Title for the new lesson
             options: Dictionary of options to set on the lesson
+        Optional Args:
+            course_id: Identifier for course to create the lesson in
 
         Returns:
             A JSON object with the new lesson's metadata
         """
-        lessons_path = urljoin(EdStemAPI.API_URL, f"courses/{self._course_id}/lessons")
+        course_id = course_id if course_id is not None else self._course_id
+        lessons_path = urljoin(EdStemAPI.API_URL, f"courses/{course_id}/lessons")
         lesson_dict = {"lesson": ({"title": title} | options)}
         lesson = json.loads(self._post_request(lessons_path, json=lesson_dict))[
             "lesson"
         ]
+        self._invalidate_course(course_id, lesson.get("course_id"))
         return lesson
 
     def edit_lesson(
-        self, lesson_id: int, options: Dict[str, Any] = {}
+        self,
+        lesson_id: int,
+        options: Dict[str, Any] = {},
+        current: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Modifies an existing Ed lesson. Endpoint: /lessons/{lesson_id}
 
         Args:
             lesson_id: Identifier for lesson
             options: Dictionary of options to set on the lesson
+        Optional Args:
+            current: The lesson's full current data (e.g. Lesson._data). If given, it is
+              sent with options applied instead of reading the lesson from Ed first, and
+              the edit raises EditConflictError if Ed reports the lesson changed since its
+              updated_at.
 
         Returns:
             A JSON object with the updated lesson's metadata
         """
-        lesson = self.get_lesson(lesson_id)
+        if current is None:
+            current = self.get_lesson(lesson_id)
         lesson_path = urljoin(EdStemAPI.API_URL, f"lessons/{lesson_id}")
-        lesson_dict = {"lesson": lesson | options}
-        lesson = json.loads(self._put_request(lesson_path, json=lesson_dict))["lesson"]
+        lesson_dict = {"lesson": current | options}
+        lesson = json.loads(
+            self._put_request(
+                lesson_path,
+                json=lesson_dict,
+                headers=self._unmodified_since(current),
+            )
+        )["lesson"]
+        self._invalidate_course(current.get("course_id"), lesson.get("course_id"))
         return lesson
 
     def clone_slide(
@@ -313,12 +720,16 @@ class EdStemAPI:
         slide_id: int,
         lesson_id: int,
         is_hidden: bool = False,
+        course_id: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Clones an existing Ed slide into a new lesson. Endpoint: /lessons/slides/{slide_id}/clone
 
         Args:
             slide_id: Identifier for slide to clone
             lesson_id: Identifier for lesson to clone into
+        Optional Args:
+            is_hidden: Whether the new slide is hidden
+            course_id: Course of the lesson cloned into, whose cached listing is invalidated
 
         Returns:
             A JSON object with the cloned slide's metadata
@@ -327,34 +738,55 @@ class EdStemAPI:
         clone_path = urljoin(EdStemAPI.API_URL, f"lessons/slides/{slide_id}/clone")
         payload = {"lesson_id": lesson_id, "is_hidden": is_hidden}
         slide = json.loads(self._post_request(clone_path, json=payload))["slide"]
+        self._invalidate_course(course_id, slide.get("course_id"))
         return slide
 
-    def edit_slide(self, slide_id: int, options: Dict[str, Any] = {}) -> Dict[str, Any]:
+    def edit_slide(
+        self,
+        slide_id: int,
+        options: Dict[str, Any] = {},
+        current: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Modifies an existing Ed slide. Endpoint: /lessons/slides/{slide_id}
 
         Args:
             slide_id: Identifier for slide
             options: Dictionary of options to set on the slide
+        Optional Args:
+            current: The slide's full current data, as returned by get_slide (slides
+              listed in a lesson lack their content). If given, it is sent with options
+              applied instead of reading the slide from Ed first, and the edit raises
+              EditConflictError if Ed reports the slide changed since its updated_at.
 
         Returns:
             A JSON object with the updated slide's metadata
         """
-        slide = self.get_slide(slide_id)
+        if current is None:
+            current = self.get_slide(slide_id)
         slide_path = urljoin(EdStemAPI.API_URL, f"lessons/slides/{slide_id}")
-        slide_dict = slide | options
+        slide_dict = current | options
         slide = json.loads(
-            self._put_request(slide_path, data={"slide": json.dumps(slide_dict)})
+            self._put_request(
+                slide_path,
+                data={"slide": json.dumps(slide_dict)},
+                headers=self._unmodified_since(current),
+            )
         )["slide"]
+        self._invalidate_course(current.get("course_id"), slide.get("course_id"))
         return slide
 
-    def delete_slide(self, slide_id: int) -> None:
+    def delete_slide(self, slide_id: int, course_id: Optional[int] = None) -> None:
         """Deletes an existing Ed slide. Endpoint: /lessons/slides/{slide_id}
 
         Args:
             slide_id: Identifier for slide
+        Optional Args:
+            course_id: Course of the slide, whose cached listing is invalidated. By
+              default every course's listing is invalidated.
         """
         slide_path = urljoin(EdStemAPI.API_URL, f"lessons/slides/{slide_id}")
         self._delete_request(slide_path)
+        self._invalidate_course(course_id)
 
     def get_questions(self, slide_id: int) -> List[Dict[str, Any]]:
         """Gets metadata for a single Quiz slide's questions. Endpoint: /lessons/slides/{slide_id}/questions
@@ -371,6 +803,24 @@ class EdStemAPI:
         questions = self._get_request(questions_path)["questions"]
         return questions
 
+    def get_questions_bulk(
+        self, slide_ids: Iterable[int], max_workers: int = 8, retries: int = 0
+    ) -> BulkReport[List[Dict[str, Any]]]:
+        """Gets the questions of many quiz slides concurrently.
+
+        Args:
+            slide_ids: Quiz slides to get questions for
+        Optional Args:
+            max_workers: Maximum number of slides fetched at once
+            retries: Number of times to retry a slide after a transient error
+
+        Returns:
+            A BulkReport keyed by slide id, whose values are each slide's questions
+        """
+        return run_bulk(
+            self.get_questions, slide_ids, max_workers=max_workers, retries=retries
+        )
+
     def edit_question(
         self, question_id: int, question_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -410,6 +860,34 @@ class EdStemAPI:
         )
         self._delete_request(delete_path)
 
+    def delete_questions(
+        self,
+        question_ids: Iterable[int],
+        max_workers: int = 8,
+        retries: int = 0,
+        dry_run: bool = False,
+    ) -> BulkReport[None]:
+        """Deletes many questions concurrently.
+
+        Args:
+            question_ids: Questions to delete. Duplicates are deleted once.
+        Optional Args:
+            max_workers: Maximum number of questions deleted at once
+            retries: Number of times to retry a question after a transient error
+            dry_run: If True, nothing is deleted and the report lists the questions that
+              would be
+
+        Returns:
+            A BulkReport with one result per question, keyed by question id
+        """
+        return run_bulk(
+            self.delete_question,
+            dict.fromkeys(question_ids),
+            max_workers=max_workers,
+            retries=retries,
+            dry_run=dry_run,
+        )
+
     # Methods for getting information about lesson/assignment completion
     def get_lesson_completions(
         self,
@@ -447,23 +925,72 @@ class EdStemAPI:
         Returns:
             Bytes content of the result file. Usually will be used to save to a file.
         """
+        return self._post_request(
+            *self._lesson_completions_request(
+                lesson_id,
+                completions=completions,
+                numbers=numbers,
+                scores=scores,
+                students=students,
+                strategy=strategy,
+                ignore_late=ignore_late,
+                late_no_points=late_no_points,
+                tz=tz,
+            )
+        )
+
+    def download_lesson_completions(
+        self,
+        lesson_id: int,
+        destination: Destination,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        **options: Any,
+    ) -> DownloadStats:
+        """Streams completion information for a single lesson into a file.
+
+        Unlike get_lesson_completions, the file is never held in memory all at once.
+
+        Args:
+            lesson_id: Identifier for lesson
+            destination: Path of the file to write, or a binary file-like object
+        Optional Args:
+            chunk_size: Number of bytes read from the network at a time
+            **options: Same optional arguments as get_lesson_completions
+
+        Returns:
+            Number of bytes downloaded and the time taken
+        """
+        return self._download(
+            *self._lesson_completions_request(lesson_id, **options),
+            destination,
+            chunk_size,
+        )
+
+    def _lesson_completions_request(
+        self,
+        lesson_id: int,
+        completions: BinaryFlag = 1,
+        numbers: BinaryFlag = 1,
+        scores: BinaryFlag = 1,
+        students: BinaryFlag = 1,
+        strategy: str = "latest",
+        ignore_late: BinaryFlag = 0,
+        late_no_points: BinaryFlag = 0,
+        tz: str = "America/Los_Angeles",
+    ) -> tuple[str, Dict[str, Any]]:
         lesson_completion_path = urljoin(
             EdStemAPI.API_URL, "lessons", lesson_id, "results.csv"
         )
-        result = self._post_request(
-            lesson_completion_path,
-            {
-                "numbers": numbers,
-                "scores": scores,
-                "students": students,
-                "completions": completions,
-                "strategy": strategy,
-                "ignore_late": ignore_late,
-                "late_no_points": late_no_points,
-                "tz": tz,
-            },
-        )
-        return result
+        return lesson_completion_path, {
+            "numbers": numbers,
+            "scores": scores,
+            "students": students,
+            "completions": completions,
+            "strategy": strategy,
+            "ignore_late": ignore_late,
+            "late_no_points": late_no_points,
+            "tz": tz,
+        }
 
     def get_challenge_results(
         self,
@@ -502,26 +1029,74 @@ class EdStemAPI:
         Returns:
             Bytes content of the result file. Usually will be used to save to a file.
         """
+        return self._post_request(
+            *self._challenge_results_request(
+                challenge_id,
+                students=students,
+                feedback=feedback,
+                type=type,
+                score_type=score_type,
+                numbers=numbers,
+                scores=scores,
+                tz=tz,
+            )
+        )
+
+    def download_challenge_results(
+        self,
+        challenge_id: int,
+        destination: Destination,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        **options: Any,
+    ) -> DownloadStats:
+        """Streams results for a single coding challenge into a file.
+
+        Unlike get_challenge_results, the file is never held in memory all at once, which
+        matters for large exports such as type='all'.
+
+        Args:
+            challenge_id: Identifier for challenge (not the same as a slide_id)
+            destination: Path of the file to write, or a binary file-like object
+        Optional Args:
+            chunk_size: Number of bytes read from the network at a time
+            **options: Same optional arguments as get_challenge_results
+
+        Returns:
+            Number of bytes downloaded and the time taken
+        """
+        return self._download(
+            *self._challenge_results_request(challenge_id, **options),
+            destination,
+            chunk_size,
+        )
+
+    def _challenge_results_request(
+        self,
+        challenge_id: int,
+        students: BinaryFlag = 1,
+        feedback: BinaryFlag = 0,
+        type: str = "optimised",
+        score_type: str = "pertestcase",
+        numbers: BinaryFlag = 0,
+        scores: BinaryFlag = 0,
+        tz: str = "America/Los_Angeles",
+    ) -> tuple[str, Dict[str, Any]]:
         challenge_path = urljoin(
             EdStemAPI.API_URL, "challenges", challenge_id, "results"
         )
-        result = self._post_request(
-            challenge_path,
-            {
-                "students": students,
-                "type": type,
-                "numbers": numbers,
-                "scores": scores,
-                "score_type": score_type,
-                "feedback": feedback,
-                "tz": tz,
-            },
-        )
-        return result
+        return challenge_path, {
+            "students": students,
+            "type": type,
+            "numbers": numbers,
+            "scores": scores,
+            "score_type": score_type,
+            "feedback": feedback,
+            "tz": tz,
+        }
 
     def get_quiz_results(
         self, quiz_id: int, students: BinaryFlag = 1, no_attempt: BinaryFlag = 1
-    ):
+    ) -> bytes:
         """Gets results for a single quiz. Endpoint: /lessons/slides/{quiz_id}/questions/results
 
         Note that the quiz_id is not the same as the slide_id for a quiz slide
@@ -540,24 +1115,54 @@ class EdStemAPI:
             Bytes content of the result file. Usually will be used to save to a file.
 
         """
+        return self._post_request(
+            *self._quiz_results_request(
+                quiz_id, students=students, no_attempt=no_attempt
+            )
+        )
+
+    def download_quiz_results(
+        self,
+        quiz_id: int,
+        destination: Destination,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        **options: Any,
+    ) -> DownloadStats:
+        """Streams results for a single quiz into a file.
+
+        Unlike get_quiz_results, the file is never held in memory all at once.
+
+        Args:
+            quiz_id: Identifier for quiz
+            destination: Path of the file to write, or a binary file-like object
+        Optional Args:
+            chunk_size: Number of bytes read from the network at a time
+            **options: Same optional arguments as get_quiz_results
+
+        Returns:
+            Number of bytes downloaded and the time taken
+        """
+        return self._download(
+            *self._quiz_results_request(quiz_id, **options), destination, chunk_size
+        )
+
+    def _quiz_results_request(
+        self, quiz_id: int, students: BinaryFlag = 1, no_attempt: BinaryFlag = 1
+    ) -> tuple[str, Dict[str, Any]]:
         quiz_path = urljoin(
             EdStemAPI.API_URL, "lessons/slides", quiz_id, "questions/results"
         )
-        result = self._post_request(
-            quiz_path,
-            {
-                "students": students,
-                "noAttempt": no_attempt,
-            },
-        )
-        return result
+        return quiz_path, {
+            "students": students,
+            "noAttempt": no_attempt,
+        }
 
     def post_grades(
         self,
         submission_id: int,
         grades: List[Dict[str, Any]],
         comment: str = '<document version="2.0"><paragraph/></document>',
-    ):
+    ) -> bytes:
         """
         Posts feedback to the given submission id with the given grades and optional comment.
 
@@ -586,10 +1191,99 @@ class EdStemAPI:
         }
         return self._put_request(path, json=data)
 
+    def post_grades_bulk(
+        self,
+        records: Iterable[tuple[int, List[Dict[str, Any]], Optional[str]]],
+        max_workers: int = 8,
+        retries: int = 0,
+        checkpoint: Optional[str] = None,
+    ) -> BulkReport[bytes]:
+        """
+        Posts feedback for many submissions concurrently. See post_grades for the format of
+        each submission's grades and comment.
+
+        Args:
+            records: (submission_id, grades, comment) tuples. A comment of None posts the
+              default empty comment.
+        Optional Args:
+            max_workers: Maximum number of submissions posted at once
+            retries: Number of times to retry a submission after a transient error
+            checkpoint: Path of a file recording each submission posted successfully. If
+              the file exists, submissions it lists are skipped, so re-running after a crash
+              only posts what is left.
+
+        Returns:
+            A BulkReport with one result per record, keyed by submission_id
+        """
+        done: set[int] = set()
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, "r") as f:
+                done = {int(line) for line in f if line.strip()}
+
+        def post(record: tuple[int, List[Dict[str, Any]], Optional[str]]) -> bytes:
+            submission_id, grades, comment = record
+            if comment is None:
+                return self.post_grades(submission_id, grades)
+            return self.post_grades(submission_id, grades, comment)
+
+        checkpoint_file = open(checkpoint, "a") if checkpoint is not None else None
+        try:
+
+            def record_success(result: BulkResult) -> None:
+                if checkpoint_file is not None and result.ok and not result.skipped:
+                    checkpoint_file.write(f"{result.key}\n")
+                    checkpoint_file.flush()
+
+            return run_bulk(
+                post,
+                records,
+                key=lambda record: record[0],
+                max_workers=max_workers,
+                retries=retries,
+                skip=lambda record: record[0] in done,
+                on_result=record_success,
+            )
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
+
     def connect_user_to_workspace(self, challenge_id, user_id):
         connect_path = urljoin(EdStemAPI.API_URL, "challenges", challenge_id, "connect")
         self._post_request(connect_path, json={"user_id": user_id})
 
+    def connect_users_to_workspace(
+        self,
+        challenge_id: int,
+        user_ids: Iterable[int],
+        max_workers: int = 8,
+        retries: int = 0,
+        dry_run: bool = False,
+    ) -> BulkReport[None]:
+        """
+        Connects many users to a challenge's workspace concurrently. Requests go through
+        this object's rate limiter, if it has one.
+
+        Args:
+            challenge_id: Identifier for challenge (not the same as a slide_id)
+            user_ids: Users to connect. Duplicates are connected once.
+        Optional Args:
+            max_workers: Maximum number of users connected at once
+            retries: Number of times to retry a user after a transient error
+            dry_run: If True, nothing is connected and the report lists the users that
+              would be
+
+        Returns:
+            A BulkReport with one result per user, keyed by user_id. Its throughput is
+            users connected per second.
+        """
+        return run_bulk(
+            lambda user_id: self.connect_user_to_workspace(challenge_id, user_id),
+            dict.fromkeys(user_ids),
+            max_workers=max_workers,
+            retries=retries,
+            dry_run=dry_run,
+        )
+
     def submit_all_challenge(self, challenge_id):
         submit_path = urljoin(
             EdStemAPI.API_URL, "challenges", challenge_id, "submit_all"
@@ -622,14 +1316,52 @@ class EdStemAPI:
         tz: str = "America/Los_Angeles",
     ):
         # TODO also add ability to specify before date
+        return self._post_request(
+            *self._submissions_request(challenge_id, students, type, tz)
+        )
+
+    def iter_submissions(
+        self,
+        challenge_id: int,
+        students: BinaryFlag = 1,
+        type: str = "optimised",
+        tz: str = "America/Los_Angeles",
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Iterator[Submission]:
+        """Yields a challenge's submissions as they download. Endpoint: /challenges/{challenge_id}/submissions
+
+        Unlike get_all_submissions, the response is decoded incrementally, so the first
+        submission is available as soon as it arrives and memory use does not grow with
+        the size of the export. The response is closed when the iterator is exhausted or
+        closed.
+
+        Args:
+            challenge_id: Identifier for challenge (not the same as a slide_id)
+        Optional Args:
+            students: Check; "Include students only"
+            type: Which submissions to include. Options: 'latest', 'optimised', 'all'
+            tz: Timezone for datetimes
+            chunk_size: Number of bytes read from the network at a time
+
+        Returns:
+            An iterator of submissions, in the order Ed sends them
+        """
+        url, query_params = self._submissions_request(challenge_id, students, type, tz)
+        with self._request(
+            "POST", url, params=query_params, json={}, stream=True
+        ) as response:
+            # Ed may send a bare array or an object wrapping it
+            chunks = response.iter_content(chunk_size)
+            for data in iter_json_array(chunks, key="submissions"):
+                yield Submission.from_dict(data, challenge_id=challenge_id)
+
+    def _submissions_request(
+        self, challenge_id: int, students: BinaryFlag, type: str, tz: str
+    ) -> tuple[str, Dict[str, Any]]:
         submission_path = urljoin(
             EdStemAPI.API_URL, "challenges", challenge_id, "submissions"
         )
-        result = self._post_request(
-            submission_path,
-            query_params={"studuents": students, "type": type, "tz": tz},
-        )
-        return result
+        return submission_path, {"students": students, "type": type, "tz": tz}
 
     def get_all_submissions_for_user(
         self,
@@ -648,6 +1380,133 @@ class EdStemAPI:
         result = self._get_request(submission_path)["submissions"]
         return result
 
+    def get_submissions_bulk(
+        self,
+        challenge_ids: Iterable[int],
+        user_ids: Optional[Iterable[int]] = None,
+        max_workers: int = 8,
+        retries: int = 0,
+    ) -> BulkReport[List[Submission]]:
+        """
+        Gets the submissions of many users to many challenges concurrently, e.g. to build a
+        SubmissionIndex:
+
+        >>> report = ed.get_submissions_bulk(challenge_ids)
+        >>> index = SubmissionIndex.from_report(report)
+        >>> index.latest(challenge_ids[0])  # {user_id: Submission}
+
+        Args:
+            challenge_ids: Challenges to get submissions for
+        Optional Args:
+            user_ids: Users to get submissions for. By default, every user with access to
+              each challenge (see get_all_users_for_challenge), listed concurrently.
+            max_workers: Maximum number of requests made at once
+            retries: Number of times to retry a request after a transient error
+
+        Returns:
+            A BulkReport with one result per (challenge_id, user_id) pair, whose values
+            are that user's submissions to that challenge
+
+        Raises:
+            HTTPError: If the users of a challenge could not be listed
+        """
+        challenge_ids = list(challenge_ids)
+        pairs: List[tuple[int, int]]
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            pairs = [(c, u) for c in challenge_ids for u in user_ids]
+        else:
+            users = run_bulk(
+                self.get_all_users_for_challenge,
+                challenge_ids,
+                max_workers=max_workers,
+                retries=retries,
+            )
+            pairs = [
+                (challenge_id, user["id"])
+                for challenge_id, challenge_users in zip(challenge_ids, users.values())
+                for user in challenge_users
+            ]
+
+        def fetch(pair: tuple[int, int]) -> List[Submission]:
+            challenge_id, user_id = pair
+            return [
+                Submission.from_dict(s, user_id=user_id, challenge_id=challenge_id)
+                for s in self.get_all_submissions_for_user(challenge_id, user_id)
+            ]
+
+        return run_bulk(fetch, pairs, max_workers=max_workers, retries=retries)
+
     def delete_submission(self, sub_id):
         delete_path = urljoin(EdStemAPI.API_URL, "challenges", "submissions", sub_id)
         return self._delete_request(delete_path)
+
+    def delete_submissions(
+        self,
+        submission_ids: Iterable[int],
+        max_workers: int = 8,
+        retries: int = 0,
+        dry_run: bool = False,
+    ) -> BulkReport[bytes]:
+        """
+        Deletes many submissions concurrently. Requests go through this object's rate
+        limiter, if it has one.
+
+        Args:
+            submission_ids: Submissions to delete. Duplicates are deleted once.
+        Optional Args:
+            max_workers: Maximum number of submissions deleted at once
+            retries: Number of times to retry a submission after a transient error
+            dry_run: If True, nothing is deleted and the report lists the submissions
+              that would be
+
+        Returns:
+            A BulkReport with one result per submission, keyed by submission id. Its
+            throughput is submissions deleted per second.
+        """
+        return run_bulk(
+            self.delete_submission,
+            dict.fromkeys(submission_ids),
+            max_workers=max_workers,
+            retries=retries,
+            dry_run=dry_run,
+        )
+
+
+# Process-wide client shared by every EdObject that isn't handed one explicitly
+_default_api: Optional[EdStemAPI] = None
+_default_api_pinned = False
+_default_api_lock = threading.Lock()
+
+
+def get_default_api() -> EdStemAPI:
+    """Returns the EdStemAPI shared by all objects that are not given their own.
+
+    The client is created on first use. If it was created automatically, it is replaced
+    when the auth token changes so that a new edstem.auth.set_token(...) takes effect.
+
+    Returns:
+        The process-wide EdStemAPI
+    """
+    global _default_api
+    with _default_api_lock:
+        if _default_api is None or (
+            not _default_api_pinned and _default_api._token != get_token()
+        ):
+            _default_api = EdStemAPI()
+        return _default_api
+
+
+def set_default_api(api: Optional[EdStemAPI]) -> None:
+    """Sets the EdStemAPI shared by all objects that are not given their own.
+
+    Useful to share a client configured with non-default options. Passing None goes back
+    to lazily creating a default client.
+
+    Args:
+        api: Client to share, or None to reset
+    """
+    global _default_api, _default_api_pinned
+    with _default_api_lock:
+        _default_api = api
+        _default_api_pinned = api is not None
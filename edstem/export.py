@@ -0,0 +1,197 @@
+"""
+Module for exporting the results of every lesson, challenge and quiz in a course
+
+export_results finds every results CSV a course has, downloads them concurrently into a
+directory and records a manifest of what was written. Each file is downloaded to a
+temporary file and moved into place with os.replace, so an interrupted export never
+leaves a partially written CSV behind. Files whose content is unchanged since the last
+export (by SHA-256) are left untouched, keeping their modification times, so backup tools
+only pick up results that actually changed.
+
+Ed does not report when results last changed, so every CSV is still downloaded.
+
+Usage: python -m edstem export <token or token file> <course id> <directory>
+"""
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from edstem.bulk import BulkReport, BulkResult, run_bulk
+from edstem.ed_api import EdStemAPI
+
+MANIFEST_NAME = "manifest.json"
+
+# Kinds of results, and the download method used for each
+KINDS = {
+    "lesson": "download_lesson_completions",
+    "challenge": "download_challenge_results",
+    "quiz": "download_quiz_results",
+}
+
+
+@dataclass(frozen=True)
+class ExportItem:
+    kind: str  # One of KINDS
+    id: int  # Lesson, challenge or quiz slide id
+    name: str
+    lesson_id: int
+
+    @property
+    def filename(self) -> str:
+        return f"{self.kind}-{self.id}.csv"
+
+
+@dataclass(frozen=True)
+class ExportedFile:
+    item: ExportItem
+    path: str
+    sha256: str
+    bytes: int
+    changed: bool  # False if the file already held the same results
+
+
+def find_export_items(
+    api: EdStemAPI, course_id: int, max_workers: int = 8
+) -> list[ExportItem]:
+    """Lists every lesson, challenge and quiz in a course that has results.
+
+    Lessons are fetched concurrently to find their challenge and quiz slides.
+
+    Args:
+        api: Client used to send requests
+        course_id: Identifier for course
+    Optional Args:
+        max_workers: Maximum number of lessons fetched at once
+
+    Returns:
+        One item per lesson, then the challenges and quizzes of each lesson in order
+
+    Raises:
+        HTTPError: If a lesson could not be fetched
+    """
+    lesson_ids = [lesson["id"] for lesson in api.get_all_lessons(course_id)]
+    items = []
+    for lesson in api.get_lessons_bulk(lesson_ids, max_workers).values():
+        items.append(ExportItem("lesson", lesson["id"], lesson["title"], lesson["id"]))
+        for slide in lesson.get("slides", []):
+            if slide.get("challenge_id") is not None:
+                kind, item_id = "challenge", slide["challenge_id"]
+            elif slide["type"] == "quiz":
+                kind, item_id = "quiz", slide["id"]
+            else:
+                continue
+            items.append(ExportItem(kind, item_id, slide["title"], lesson["id"]))
+    return items
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_manifest(directory: str, manifest: Dict[str, Any]) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, os.path.join(directory, MANIFEST_NAME))
+
+
+def export_results(
+    api: EdStemAPI,
+    course_id: int,
+    directory: str,
+    max_workers: int = 8,
+    retries: int = 0,
+    options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> BulkReport[ExportedFile]:
+    """Downloads the results of every lesson, challenge and quiz in a course.
+
+    Each results CSV is saved as <kind>-<id>.csv in directory, alongside a manifest.json
+    describing every file. Re-running an export only replaces files whose results changed,
+    and removes the files of lessons, challenges and quizzes no longer in the course.
+
+    Args:
+        api: Client used to send requests
+        course_id: Identifier for course
+        directory: Directory to write to. Created if it does not exist.
+    Optional Args:
+        max_workers: Maximum number of downloads at once
+        retries: Number of times to retry a download after a transient error
+        options: Optional arguments for each kind's download method, keyed by kind (e.g.
+          {"challenge": {"type": "all"}})
+
+    Returns:
+        A BulkReport with one result per file, keyed by filename
+    """
+    options = options or {}
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    previous: Dict[str, Any] = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            previous = json.load(f)["files"]
+
+    def export(item: ExportItem) -> ExportedFile:
+        path = os.path.join(directory, item.filename)
+        download = getattr(api, KINDS[item.kind])
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                stats = download(item.id, f, **options.get(item.kind, {}))
+            sha256 = _sha256(temp_path)
+            entry = previous.get(item.filename)
+            changed = not (
+                entry is not None and entry["sha256"] == sha256 and os.path.exists(path)
+            )
+            if changed:
+                os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return ExportedFile(item, path, sha256, stats.bytes, changed)
+
+    items = find_export_items(api, course_id, max_workers)
+    current = {item.filename for item in items}
+    files = {name: entry for name, entry in previous.items() if name in current}
+    for name in previous.keys() - current:
+        stale_path = os.path.join(directory, name)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+    exported_at = datetime.now(timezone.utc).isoformat()
+
+    def record(result: BulkResult[ExportedFile]) -> None:
+        exported = result.value
+        if exported is not None:
+            entry = files.get(exported.item.filename, {})
+            files[exported.item.filename] = {
+                "kind": exported.item.kind,
+                "id": exported.item.id,
+                "name": exported.item.name,
+                "lesson_id": exported.item.lesson_id,
+                "sha256": exported.sha256,
+                "bytes": exported.bytes,
+                "changed_at": exported_at
+                if exported.changed
+                else entry.get("changed_at", exported_at),
+            }
+
+    report = run_bulk(
+        export,
+        items,
+        key=lambda item: item.filename,
+        max_workers=max_workers,
+        retries=retries,
+        on_result=record,
+    )
+    _write_manifest(
+        directory,
+        {"course_id": course_id, "exported_at": exported_at, "files": files},
+    )
+    return report
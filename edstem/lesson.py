@@ -1,12 +1,25 @@
-import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, NotRequired, Optional, Sequence, TypedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    NotRequired,
+    Optional,
+    Sequence,
+    TypedDict,
+)
 
 import edstem._base as base
-from edstem.ed_api import EdStemAPI
+from edstem.bulk import BulkReport, run_bulk
+from edstem.challenge import Challenge
+from edstem.ed_api import EdStemAPI, get_default_api
+from edstem.quiz_question import QuizQuestion
 from edstem.slide import Slide, SlideData
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 @dataclass(frozen=True)
 class Prerequisite:
@@ -36,11 +49,27 @@ class LessonData(TypedDict):
 # to Ed objects.
 
 
+# Fields Ed reports with a lesson that describe its slides or the viewing user's progress
+# rather than the lesson itself. They are left out when a lesson is written back.
+_NON_LESSON_KEYS = frozenset(
+    {
+        "slides",
+        "slide_count",
+        "attempted_at",
+        "first_viewed_at",
+        "last_viewed_slide_id",
+        "openable",
+        "state",
+        "status",
+    }
+)
+
+
 class Lesson(base.EdObject[base.LessonID]):
     _data: dict[str, Any]
     _cached_created_at: datetime | None
     _timezone: str | None
-    _slides: list[Slide]
+    _slides: base.EdCollection[Slide] | None
 
     class VisibilitySettings:
         def __init__(self, lesson: "Lesson") -> None:
@@ -168,44 +197,56 @@ class Lesson(base.EdObject[base.LessonID]):
             ]
 
     class ScheduledSettings:
+        TIMESTAMP_KEYS = ("available_at", "due_at", "locked_at", "solutions_at")
+
         def __init__(self, lesson: "Lesson") -> None:
             self._lesson = lesson
+            # Parsed timestamps, cleared by the setters
+            self._parsed: dict[str, datetime | None] = {}
+
+        def _get_datetime(self, key: str) -> datetime | None:
+            if key not in self._parsed:
+                self._parsed[key] = base.EdObject.str_to_datetime(
+                    self._lesson._data[key]
+                )
+            return self._parsed[key]
+
+        def _set_datetime(self, key: str, value: str | datetime | None) -> None:
+            self._lesson._changes.add(key)
+            self._lesson._data[key] = value
+            self._parsed.pop(key, None)
 
         @property
         def available_at(self) -> datetime | None:
-            return base.EdObject.str_to_datetime(self._lesson._data["available_at"])
+            return self._get_datetime("available_at")
 
         @available_at.setter
         def available_at(self, value: str | datetime | None) -> None:
-            self._lesson._changes.add("available_at")
-            self._lesson._data["available_at"] = value
+            self._set_datetime("available_at", value)
 
         @property
         def due_at(self) -> datetime | None:
-            return base.EdObject.str_to_datetime(self._lesson._data["due_at"])
+            return self._get_datetime("due_at")
 
         @due_at.setter
         def due_at(self, value: str | datetime | None) -> None:
-            self._lesson._changes.add("due_at")
-            self._lesson._data["due_at"] = value
+            self._set_datetime("due_at", value)
 
         @property
         def locked_at(self) -> datetime | None:
-            return base.EdObject.str_to_datetime(self._lesson._data["locked_at"])
+            return self._get_datetime("locked_at")
 
         @locked_at.setter
         def locked_at(self, value: str | datetime | None) -> None:
-            self._lesson._changes.add("locked_at")
-            self._lesson._data["locked_at"] = value
+            self._set_datetime("locked_at", value)
 
         @property
         def solutions_at(self) -> datetime | None:
-            return base.EdObject.str_to_datetime(self._lesson._data["solutions_at"])
+            return self._get_datetime("solutions_at")
 
         @solutions_at.setter
         def solutions_at(self, value: str | datetime | None) -> None:
-            self._lesson._changes.add("solutions_at")
-            self._lesson._data["solutions_at"] = value
+            self._set_datetime("solutions_at", value)
 
         @property
         def late_submissions(self) -> bool:
@@ -295,12 +336,20 @@ class Lesson(base.EdObject[base.LessonID]):
 
     # TODO Right now we don't allow constructor setting of many settings and the setters need
     # To be called. Figure out a good interface for specifying settings at beginning if desired
-    def __init__(self, data: dict[str, Any]) -> None:
+    def __init__(
+        self, data: dict[str, Any], api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> None:
         # Currently left out: updated_at (assumed always null?), state, status
-        super().__init__()
-
-        # Set simple properties
-        self._data = copy.deepcopy(data)
+        super().__init__(api)
+
+        # Set simple properties. Setters only replace top-level values, except for the
+        # nested settings dict, so copying those two levels keeps the caller's dict intact
+        # without a deep copy. With copy=False, the lesson takes ownership of data instead.
+        if copy:
+            self._data = dict(data)
+            self._data["settings"] = dict(data["settings"])
+        else:
+            self._data = data
 
         # Change some default values
         if self._data["password"] == "":
@@ -313,14 +362,18 @@ class Lesson(base.EdObject[base.LessonID]):
         self._schedule = Lesson.ScheduledSettings(self)
         self._quiz = Lesson.QuizSettings(self)
 
-        # Set up slides
-        self._slides = [
-            Slide.from_dict(slide_data) for slide_data in self._data["slides"]
-        ]
+        self._timezone = None
+        self._cached_created_at = None
+
+        # Slides are built on first access, since many uses of a lesson never look at them
+        self._slides = None
+        self._copy_slides = copy
 
     @staticmethod
-    def from_dict(data: base.JSON) -> "Lesson":
-        return Lesson(data)
+    def from_dict(
+        data: base.JSON, api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> "Lesson":
+        return Lesson(data, api=api, copy=copy)
 
     @property
     def id(self) -> base.LessonID:
@@ -386,11 +439,39 @@ class Lesson(base.EdObject[base.LessonID]):
         return self._quiz
 
     @property
-    def slides(self) -> list[Slide]:
+    def slides(self) -> base.EdCollection[Slide]:
+        if self._slides is None:
+            self._slides = base.EdCollection(
+                Slide.from_dict(slide_data, api=self._api, copy=self._copy_slides)
+                for slide_data in self._data["slides"]
+            )
         return self._slides
 
     def get_slide(self, id_or_name: base.SlideID | str):
-        return base.EdObject._filter_single_id_or_name(self._slides, id_or_name)
+        return base.EdObject._filter_single_id_or_name(self.slides, id_or_name)
+
+    def _full_slides(self) -> base.EdCollection[Slide]:
+        """This lesson's slides, fetching the full lesson first if they are missing.
+
+        Lessons from a course listing are sent with no slides, so the full lesson is
+        fetched once and its slides replace the missing ones.
+        """
+        if len(self.slides) < self._data.get("slide_count", 0):
+            slides = self._api.get_lesson(self.id)["slides"]
+            self._data["slides"] = slides
+            self._data["slide_count"] = len(slides)
+            self._copy_slides = False
+            self._slides = None
+        return self.slides
+
+    @property
+    def challenges(self) -> base.EdCollection[Challenge]:
+        """The coding challenges on this lesson's slides, in slide order."""
+        challenges = (slide.challenge for slide in self._full_slides())
+        return base.EdCollection(c for c in challenges if c is not None)
+
+    def get_challenge(self, id_or_name: base.ChallengeID | str) -> Challenge:
+        return base.EdObject._filter_single_id_or_name(self.challenges, id_or_name)
 
     def _tuple(self) -> tuple:
         return (
@@ -401,34 +482,139 @@ class Lesson(base.EdObject[base.LessonID]):
     def __repr__(self) -> str:
         return f"Lesson(id={self.id}, name={self.name})"
 
+    @staticmethod
+    def schedules_to_dataframe(
+        lessons: Iterable["Lesson"], timezone: str | None = None
+    ) -> "DataFrame":
+        """Returns the schedule timestamps of many lessons as a DataFrame.
+
+        Each timestamp column is parsed in a single vectorized pass, which is much faster
+        than reading the schedule properties of thousands of lessons one at a time.
+
+        Args:
+            lessons: Lessons to include, one row each
+        Optional Args:
+            timezone: Timezone to convert timestamps to. Defaults to UTC.
+
+        Returns:
+            A DataFrame indexed by lesson id with a name column and one datetime column per
+            schedule timestamp (available_at, due_at, locked_at, solutions_at)
+        """
+        from pandas import DataFrame, to_datetime
+
+        lessons = list(lessons)
+        frame = DataFrame(
+            {"name": [lesson.name for lesson in lessons]},
+            index=[lesson.id for lesson in lessons],
+        )
+        frame.index.name = "id"
+        for key in Lesson.ScheduledSettings.TIMESTAMP_KEYS:
+            column = to_datetime(
+                [lesson._data[key] for lesson in lessons], utc=True, format="ISO8601"
+            )
+            frame[key] = column.tz_convert(timezone) if timezone else column
+        return frame
+
     # API Methods
     @staticmethod
-    def get_all_lessons(course_id: base.CourseID) -> list["Lesson"]:
-        api = base.EdStemAPI()
+    def get_all_lessons(
+        course_id: base.CourseID, api: Optional[EdStemAPI] = None
+    ) -> base.EdCollection["Lesson"]:
+        api = api if api is not None else get_default_api()
         lessons = api.get_all_lessons(course_id)
-        return [Lesson.from_dict(l) for l in lessons]
+        return base.EdCollection(Lesson.from_dict(l, api=api) for l in lessons)
 
     @staticmethod
     def get_lesson(
-        course_id: base.CourseID, id_or_name: base.LessonID | str
+        course_id: base.CourseID,
+        id_or_name: base.LessonID | str,
+        api: Optional[EdStemAPI] = None,
     ) -> "Lesson":
-        lessons = Lesson.get_all_lessons(course_id)
+        lessons = Lesson.get_all_lessons(course_id, api)
         return base.EdObject._filter_single_id_or_name(lessons, id_or_name)
 
+    def get_questions(
+        self, max_workers: int = 8
+    ) -> dict[base.SlideID, base.EdCollection[QuizQuestion]]:
+        """Gets the questions of every quiz slide in this lesson, concurrently.
+
+        Raises:
+            HTTPError: If the questions of a slide could not be fetched
+        """
+        quizzes = [s.id for s in self._full_slides() if s.type == "quiz"]
+        return QuizQuestion.get_questions_by_slide(quizzes, self._api, max_workers)
+
+    def clone_into(
+        self,
+        titles: Sequence[str],
+        course_id: Optional[base.CourseID] = None,
+        options: Optional[dict[str, Any]] = None,
+        max_workers: int = 8,
+    ) -> BulkReport["Lesson"]:
+        """Creates a new lesson for each title and clones this lesson's slides into it.
+
+        The new lessons are built concurrently. Ed adds a cloned slide to the end of its
+        lesson, so the slides of each new lesson are cloned one at a time, in order. Each
+        slide keeps whether it is hidden.
+
+        Args:
+            titles: Title of each new lesson
+        Optional Args:
+            course_id: Course to create the lessons in. Defaults to this lesson's course.
+            options: Settings for every new lesson (see EdStemAPI.create_lesson)
+            max_workers: Maximum number of lessons built at the same time
+
+        Returns:
+            A BulkReport keyed by title, holding each new Lesson and how long it all took.
+            A lesson that failed part way through is left in Ed with the slides cloned so
+            far, and is not retried so that it isn't created twice.
+        """
+        course_id = course_id if course_id is not None else self.course_id
+        sources = [(slide.id, slide.hidden) for slide in self._full_slides()]
+
+        def clone(title: str) -> Lesson:
+            data = self._api.create_lesson(title, options or {}, course_id=course_id)
+            data["slides"] = [
+                self._api.clone_slide(
+                    slide_id, data["id"], is_hidden=hidden, course_id=course_id
+                )
+                for slide_id, hidden in sources
+            ]
+            return Lesson.from_dict(data, api=self._api, copy=False)
+
+        return run_bulk(clone, titles, max_workers=max_workers)
+
     def get_module(self) -> Optional["Module"]:
         if self.module_id is None:
             return None
         else:
-            return Module.get_module(self.course_id, self.module_id)
+            return Module.get_module(self.course_id, self.module_id, self._api)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._changed) or any(s.is_dirty for s in self._slides or [])
 
     def post_changes(self):
-        # Have each slide post changes
-        for slide in self._slides:
+        # Have each slide post changes (slides never built can't have any)
+        for slide in self._slides or []:
             slide.post_changes()
+        self._post_lesson_changes()
 
+    def _post_lesson_changes(self) -> None:
+        """Posts changes to the lesson itself, but not its slides."""
+        if not self._changed:
+            return
         lesson_data = self._to_dict(changes_only=True)
-        new_lesson_data = self._api.edit_lesson(self.id, lesson_data)
+        # Send the local state so Ed isn't read before writing. Ed uses "" for an unset
+        # password or tutorial regex, which the constructor turned into None.
+        current = {k: v for k, v in self._data.items() if k not in _NON_LESSON_KEYS}
+        current["password"] = self._data["password"] or ""
+        current["tutorial_regex"] = self._data["tutorial_regex"] or ""
+        new_lesson_data = self._api.edit_lesson(self.id, lesson_data, current=current)
         self._data.update(new_lesson_data)
+        self._cached_created_at = None
+        self._schedule._parsed.clear()
+        self._mark_clean()
 
 
 from edstem.module import (
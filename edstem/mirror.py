@@ -0,0 +1,330 @@
+"""
+Module defining a local SQLite mirror of an EdStem course
+
+A CourseMirror keeps the users, modules, lessons, slides and quiz questions of a course
+in a SQLite file so tools can query them locally instead of re-downloading the course
+every run:
+
+>>> mirror = CourseMirror("cse163.db", course_id)
+>>> mirror.sync()  # Only fetches what changed since the last sync
+>>> mirror.lessons(module_id=13194)
+
+Every row stores the object's JSON along with a hash of it. A sync lists users, modules
+and lessons (one request each), then fetches only the lessons whose listing changed (e.g.
+a new updated_at or slide_count), concurrently. Quiz questions are fetched only for quiz
+slides that are new or changed. Objects no longer in the course are removed.
+
+Ed does not always bump a lesson's updated_at when its slides or questions are edited,
+so sync(full=True) re-fetches everything.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from edstem.bulk import BulkResult, run_bulk
+from edstem.ed_api import EdStemAPI, get_default_api
+from edstem.lesson import Lesson
+from edstem.module import Module
+from edstem.slide import Slide
+from edstem.user import User
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY, hash TEXT NOT NULL, data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modules (
+    id INTEGER PRIMARY KEY, hash TEXT NOT NULL, data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lessons (
+    id INTEGER PRIMARY KEY, module_id INTEGER, hash TEXT NOT NULL, data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slides (
+    id INTEGER PRIMARY KEY, lesson_id INTEGER NOT NULL, hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY, slide_id INTEGER NOT NULL, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lessons_module ON lessons (module_id);
+CREATE INDEX IF NOT EXISTS slides_lesson ON slides (lesson_id);
+CREATE INDEX IF NOT EXISTS questions_slide ON questions (slide_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+@dataclass
+class SyncStats:
+    requests: int = 0
+    changed: Dict[str, int] = field(default_factory=dict)  # Rows added or updated
+    deleted: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0  # Seconds
+
+
+def _hash(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CourseMirror:
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        course_id: int,
+        api: Optional[EdStemAPI] = None,
+        max_workers: int = 8,
+    ):
+        """Opens (creating if needed) a local mirror of a course.
+
+        Args:
+            path: SQLite database file. Use ":memory:" for a mirror that is not saved.
+            course_id: Identifier for course
+        Optional Args:
+            api: Client used to sync. Defaults to the default client.
+            max_workers: Maximum number of requests made at once while syncing
+        """
+        self.course_id = course_id
+        self.max_workers = max_workers
+        self._api = api if api is not None else get_default_api()
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+        stored = self._get_meta("course_id")
+        if stored is not None and int(stored) != course_id:
+            raise ValueError(f"{path} mirrors course {stored}, not {course_id}")
+        with self._db:
+            self._set_meta("course_id", str(course_id))
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "CourseMirror":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def last_synced(self) -> Optional[float]:
+        """Time of the last completed sync (seconds since the epoch), if any."""
+        value = self._get_meta("last_synced")
+        return float(value) if value is not None else None
+
+    # Syncing
+    def _hashes(self, table: str, where: str = "", *args: Any) -> Dict[int, str]:
+        query = f"SELECT id, hash FROM {table} {where}"
+        return dict(self._db.execute(query, args).fetchall())
+
+    def _delete(self, table: str, ids: Iterable[int], stats: SyncStats) -> None:
+        ids = list(ids)
+        self._db.executemany(f"DELETE FROM {table} WHERE id = ?", [(i,) for i in ids])
+        stats.deleted[table] = stats.deleted.get(table, 0) + len(ids)
+
+    def _sync_flat(
+        self, table: str, objects: List[Dict[str, Any]], stats: SyncStats
+    ) -> None:
+        """Syncs a table whose objects are all returned by one listing request."""
+        stored = self._hashes(table)
+        rows = []
+        for data in objects:
+            data_hash = _hash(data)
+            if stored.get(data["id"]) != data_hash:
+                rows.append((data["id"], data_hash, json.dumps(data)))
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO {table} (id, hash, data) VALUES (?, ?, ?)", rows
+        )
+        stats.changed[table] = stats.changed.get(table, 0) + len(rows)
+        self._delete(table, stored.keys() - {data["id"] for data in objects}, stats)
+
+    def _sync_slides(
+        self, lesson_id: int, slides: List[Dict[str, Any]], stats: SyncStats
+    ) -> List[int]:
+        """Syncs a lesson's slides, returning the ids of quiz slides that changed."""
+        stored = self._hashes("slides", "WHERE lesson_id = ?", lesson_id)
+        rows = []
+        for data in slides:
+            data_hash = _hash(data)
+            if stored.get(data["id"]) != data_hash:
+                rows.append((data["id"], lesson_id, data_hash, json.dumps(data)))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO slides (id, lesson_id, hash, data) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        stats.changed["slides"] = stats.changed.get("slides", 0) + len(rows)
+        removed = stored.keys() - {data["id"] for data in slides}
+        self._delete_questions(removed, stats)
+        self._delete("slides", removed, stats)
+        quiz_ids = {data["id"] for data in slides if data["type"] == "quiz"}
+        return [row[0] for row in rows if row[0] in quiz_ids]
+
+    def _delete_questions(self, slide_ids: Iterable[int], stats: SyncStats) -> None:
+        for slide_id in slide_ids:
+            cursor = self._db.execute(
+                "DELETE FROM questions WHERE slide_id = ?", (slide_id,)
+            )
+            stats.deleted["questions"] = (
+                stats.deleted.get("questions", 0) + cursor.rowcount
+            )
+
+    def _sync_questions(
+        self, slide_id: int, questions: List[Dict[str, Any]], stats: SyncStats
+    ) -> None:
+        self._db.execute("DELETE FROM questions WHERE slide_id = ?", (slide_id,))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO questions (id, slide_id, data) VALUES (?, ?, ?)",
+            [(q["id"], slide_id, json.dumps(q)) for q in questions],
+        )
+        stats.changed["questions"] = stats.changed.get("questions", 0) + len(questions)
+
+    def sync(self, full: bool = False) -> SyncStats:
+        """Brings the mirror up to date with Ed.
+
+        All changes are applied in one transaction, so if a request fails the mirror is
+        left as it was after the previous sync.
+
+        Optional Args:
+            full: If True, re-fetches every lesson and quiz rather than only changed ones
+
+        Returns:
+            The number of requests made and rows changed or deleted per table
+        """
+        start = time.perf_counter()
+        stats = SyncStats()
+        api = self._api
+
+        users = api.get_all_users(self.course_id)
+        modules = api.get_all_modules(self.course_id)
+        lessons = api.get_all_lessons(self.course_id)
+        stats.requests += 3
+
+        with self._db:
+            self._sync_flat("users", users, stats)
+            self._sync_flat("modules", modules, stats)
+
+            # A lesson's listing hash decides whether its slides need fetching
+            stored = {} if full else self._hashes("lessons")
+            changed = [l for l in lessons if stored.get(l["id"]) != _hash(l)]
+
+            def store_lesson(result: BulkResult[Dict[str, Any]]) -> None:
+                # The lesson may be shared with the API's conditional GET cache, so its
+                # slides are stored separately without removing them from it
+                listing, lesson = result.key, result.result()
+                slides = lesson.get("slides", [])
+                lesson = {k: v for k, v in lesson.items() if k != "slides"}
+                self._db.execute(
+                    "INSERT OR REPLACE INTO lessons (id, module_id, hash, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        lesson["id"],
+                        lesson.get("module_id"),
+                        _hash(listing),
+                        json.dumps(lesson),
+                    ),
+                )
+                quizzes.extend(self._sync_slides(lesson["id"], slides, stats))
+
+            quizzes: List[int] = []
+            report = run_bulk(
+                lambda listing: api.get_lesson(listing["id"]),
+                changed,
+                key=lambda listing: listing,
+                max_workers=self.max_workers,
+                on_result=store_lesson,
+            )
+            stats.requests += len(report.results)
+            stats.changed["lessons"] = len(changed)
+
+            removed = self._hashes("lessons").keys() - {l["id"] for l in lessons}
+            for lesson_id in removed:
+                slide_ids = self._hashes("slides", "WHERE lesson_id = ?", lesson_id)
+                self._delete_questions(slide_ids, stats)
+                self._delete("slides", slide_ids, stats)
+            self._delete("lessons", removed, stats)
+
+            if full:
+                quizzes = [
+                    slide_id
+                    for (slide_id,) in self._db.execute(
+                        "SELECT id FROM slides WHERE json_extract(data, '$.type') = 'quiz'"
+                    )
+                ]
+
+            def store_questions(result: BulkResult[List[Dict[str, Any]]]) -> None:
+                self._sync_questions(result.key, result.result(), stats)
+
+            questions_report = run_bulk(
+                api.get_questions,
+                quizzes,
+                max_workers=self.max_workers,
+                on_result=store_questions,
+            )
+            stats.requests += len(questions_report.results)
+            self._set_meta("last_synced", str(time.time()))
+
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    # Querying
+    def _load(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        return [json.loads(data) for (data,) in self._db.execute(query, args)]
+
+    def users(self) -> List[User]:
+        return [
+            User.from_dict(data, api=self._api)
+            for data in self._load("SELECT data FROM users ORDER BY id")
+        ]
+
+    def modules(self) -> List[Module]:
+        return [
+            Module.from_dict(data, api=self._api)
+            for data in self._load("SELECT data FROM modules ORDER BY id")
+        ]
+
+    def lessons(self, module_id: Optional[int] = None) -> List[Lesson]:
+        """Returns the mirrored lessons, with their slides, optionally for one module."""
+        if module_id is None:
+            lessons = self._load("SELECT data FROM lessons ORDER BY id")
+        else:
+            lessons = self._load(
+                "SELECT data FROM lessons WHERE module_id = ? ORDER BY id", module_id
+            )
+        for lesson in lessons:
+            lesson["slides"] = self._slide_data(lesson["id"])
+        return [Lesson.from_dict(l, api=self._api, copy=False) for l in lessons]
+
+    def lesson(self, lesson_id: int) -> Lesson:
+        lessons = self._load("SELECT data FROM lessons WHERE id = ?", lesson_id)
+        if not lessons:
+            raise ValueError(f"Could not find lesson with ID {lesson_id}")
+        lessons[0]["slides"] = self._slide_data(lesson_id)
+        return Lesson.from_dict(lessons[0], api=self._api, copy=False)
+
+    def _slide_data(self, lesson_id: int) -> List[Dict[str, Any]]:
+        slides = self._load("SELECT data FROM slides WHERE lesson_id = ?", lesson_id)
+        return sorted(slides, key=lambda s: s["index"])
+
+    def slides(self, lesson_id: int) -> List[Slide]:
+        return [
+            Slide.from_dict(data, api=self._api, copy=False)
+            for data in self._slide_data(lesson_id)
+        ]
+
+    def questions(self, slide_id: int) -> List[Dict[str, Any]]:
+        """Returns the mirrored questions of a quiz slide, as returned by get_questions."""
+        return self._load(
+            "SELECT data FROM questions WHERE slide_id = ? ORDER BY id", slide_id
+        )
@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Any, Iterable, NotRequired, TypedDict
+from typing import Any, Iterable, NotRequired, Optional, TypedDict
 
 import edstem._base as base
-from edstem.ed_api import EdStemAPI
+from edstem.ed_api import EdStemAPI, get_default_api
 from edstem.lesson import Lesson
 
 
@@ -17,6 +17,8 @@ class ModuleData(TypedDict):
 
 
 class Module(base.EdObject[base.ModuleID]):
+    __slots__ = ("_cached_created_at",)
+
     _data: dict[str, Any]
 
     def __init__(
@@ -28,8 +30,10 @@ class Module(base.EdObject[base.ModuleID]):
         created_at: str | None,  # TODO datetime input?
         updated_at: str | None,  # TODO datetime input?
         timezone: str | None = None,
+        api: Optional[EdStemAPI] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(api)
+        self._cached_created_at: datetime | None = None
         # Currently left out: updated_at (assumed always null?)
         self._data: ModuleData = {
             "id": id,
@@ -41,10 +45,10 @@ class Module(base.EdObject[base.ModuleID]):
         }
 
     @staticmethod
-    def from_dict(data: dict[str, Any]) -> "Module":
+    def from_dict(data: dict[str, Any], api: Optional[EdStemAPI] = None) -> "Module":
         base._proper_keys(data, ModuleData)
         rename_data = base._rename_dict(data, [("user_id", "creator_id")])  # type: ignore
-        return Module(**rename_data)
+        return Module(**rename_data, api=api)
 
     @property
     def id(self) -> base.ModuleID:
@@ -69,8 +73,9 @@ class Module(base.EdObject[base.ModuleID]):
 
     @property
     def created_at(self) -> datetime | None:
-        # Cache?
-        return Module.str_to_datetime(self._data["created_at"])
+        if self._cached_created_at is None:
+            self._cached_created_at = Module.str_to_datetime(self._data["created_at"])
+        return self._cached_created_at
 
     def _tuple(self) -> tuple:
         return (
@@ -85,28 +90,40 @@ class Module(base.EdObject[base.ModuleID]):
 
     # API Methods
     @staticmethod
-    def get_all_modules(course_id: base.CourseID) -> list["Module"]:
-        api = EdStemAPI()
+    def get_all_modules(
+        course_id: base.CourseID, api: Optional[EdStemAPI] = None
+    ) -> base.EdCollection["Module"]:
+        api = api if api is not None else get_default_api()
         modules = api.get_all_modules(course_id)
-        return [Module.from_dict(m) for m in modules]
+        return base.EdCollection(Module.from_dict(m, api=api) for m in modules)
 
     @staticmethod
     def get_module(
-        course_id: base.CourseID, id_or_name: base.ModuleID | str
+        course_id: base.CourseID,
+        id_or_name: base.ModuleID | str,
+        api: Optional[EdStemAPI] = None,
     ) -> "Module":
-        modules = Module.get_all_modules(course_id)
+        modules = Module.get_all_modules(course_id, api)
         return Module._filter_single_id_or_name(modules, id_or_name)  # type: ignore
 
-    def get_lessons(self) -> list[Lesson]:
-        lessons = Lesson.get_all_lessons(self.course_id)
-        return [lesson for lesson in lessons if lesson.module_id == self.id]
+    def get_lessons(self) -> base.EdCollection[Lesson]:
+        lessons = Lesson.get_all_lessons(self.course_id, self._api)
+        return base.EdCollection(
+            lesson for lesson in lessons if lesson.module_id == self.id
+        )
 
     def get_lesson(self, id_or_name: base.LessonID | str) -> Lesson:
         lessons = self.get_lessons()
         return Module._filter_single_id_or_name(lessons, id_or_name)  # type: ignore
 
     def post_changes(self):
+        if not self.is_dirty:
+            return True
         module_data = self._to_dict(changes_only=True)
-        module_data = self._api.edit_module(self.course_id, self.id, module_data)
+        module_data = self._api.edit_module(
+            self.course_id, self.id, module_data, current=dict(self._data)
+        )
         self._data.update(module_data)
+        self._cached_created_at = None
+        self._mark_clean()
         return True
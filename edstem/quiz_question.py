@@ -1,2 +1,171 @@
-class QuizQuestion:
-    pass
+"""
+Module defining quiz questions and concurrent fetching, editing and deleting of them
+
+Question banks span many quiz slides, each needing its own request.
+QuizQuestion.get_questions_by_slide gets the questions of many slides at once (see
+EdStemAPI.get_questions_bulk and EdStemAPI.delete_questions for the bulk requests).
+Edited questions can be posted together with a ChangeSet (see edstem.changes).
+"""
+from typing import Any, Iterable, NotRequired, Optional, TypedDict
+
+import edstem._base as base
+from edstem.ed_api import EdStemAPI, get_default_api
+
+
+class QuizQuestionData(TypedDict):
+    id: base.QuestionID
+    lesson_slide_id: base.SlideID
+    index: int
+    type: str  # TODO Enum? multiple-choice, short-answer, ...
+    auto_points: int
+    data: dict[str, Any]  # content, answers, solution, explanation, ...
+    created_at: NotRequired[str]
+
+
+class QuizQuestion(base.EdObject[base.QuestionID]):
+    __slots__ = ()
+
+    _data: dict[str, Any]
+
+    def __init__(
+        self, data: QuizQuestionData, api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> None:
+        super().__init__(api)
+        base._proper_keys(data, QuizQuestionData)  # type: ignore
+        # Setters replace top-level values and values of the nested data dict, so copying
+        # those two levels keeps the caller's dict intact
+        if copy:
+            self._data = dict(data)
+            self._data["data"] = dict(data["data"])
+        else:
+            self._data = data  # type: ignore
+
+    @staticmethod
+    def from_dict(
+        data: base.JSON, api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> "QuizQuestion":
+        return QuizQuestion(data, api=api, copy=copy)  # type: ignore
+
+    @property
+    def id(self) -> base.QuestionID:
+        return self._data["id"]
+
+    @property
+    def name(self) -> str:
+        return self.content
+
+    @property
+    def slide_id(self) -> base.SlideID:
+        return self._data["lesson_slide_id"]
+
+    @property
+    def index(self) -> int:
+        return self._data["index"]
+
+    @property
+    def type(self) -> str:
+        return self._data["type"]
+
+    @property
+    def points(self) -> int:
+        return self._data["auto_points"]
+
+    @points.setter
+    def points(self, value: int) -> None:
+        self._changes.add("auto_points")
+        self._data["auto_points"] = value
+
+    def _get(self, key: str, default: Any = None) -> Any:
+        return self._data["data"].get(key, default)
+
+    def _set(self, key: str, value: Any) -> None:
+        self._changes.add("data")
+        self._data["data"][key] = value
+
+    @property
+    def content(self) -> base.XML:
+        return self._get("content", "")
+
+    @content.setter
+    def content(self, value: base.XML) -> None:
+        self._set("content", value)
+
+    @property
+    def answers(self) -> list[base.XML]:
+        return self._get("answers", [])
+
+    @answers.setter
+    def answers(self, value: list[base.XML]) -> None:
+        self._set("answers", list(value))
+
+    @property
+    def solution(self) -> list[int]:
+        """Indexes of the correct answers."""
+        return self._get("solution", [])
+
+    @solution.setter
+    def solution(self, value: list[int]) -> None:
+        self._set("solution", list(value))
+
+    @property
+    def explanation(self) -> base.XML:
+        return self._get("explanation", "")
+
+    @explanation.setter
+    def explanation(self, value: base.XML) -> None:
+        self._set("explanation", value)
+
+    def _tuple(self) -> tuple:
+        return (
+            self.id,
+            self.slide_id,
+            self.content,
+        )
+
+    def __repr__(self) -> str:
+        return f"QuizQuestion(id={self.id}, slide_id={self.slide_id})"
+
+    # API Methods
+    @staticmethod
+    def get_questions(
+        slide_id: base.SlideID, api: Optional[EdStemAPI] = None
+    ) -> base.EdCollection["QuizQuestion"]:
+        api = api if api is not None else get_default_api()
+        return base.EdCollection(
+            QuizQuestion.from_dict(q, api=api) for q in api.get_questions(slide_id)
+        )
+
+    @staticmethod
+    def get_questions_by_slide(
+        slide_ids: Iterable[base.SlideID],
+        api: Optional[EdStemAPI] = None,
+        max_workers: int = 8,
+    ) -> dict[base.SlideID, base.EdCollection["QuizQuestion"]]:
+        """Gets the questions of many quiz slides concurrently.
+
+        Returns:
+            Each slide's questions, keyed by slide id in the order given
+
+        Raises:
+            HTTPError: If the questions of a slide could not be fetched
+        """
+        api = api if api is not None else get_default_api()
+        slide_ids = list(slide_ids)
+        report = api.get_questions_bulk(slide_ids, max_workers)
+        return {
+            slide_id: base.EdCollection(
+                QuizQuestion.from_dict(q, api=api) for q in questions
+            )
+            for slide_id, questions in zip(slide_ids, report.values())
+        }
+
+    def post_changes(self):
+        if not self.is_dirty:
+            return
+        question_data = self._to_dict(changes_only=True)
+        new_question_data = self._api.edit_question(self.id, question_data)
+        self._data.update(new_question_data)
+        self._mark_clean()
+
+    def delete(self) -> None:
+        self._api.delete_question(self.id)
@@ -0,0 +1,109 @@
+"""
+Module defining client-side rate limiting for the EdStem API
+
+TokenBucket spaces out requests so a client stays under a target rate. When Ed responds
+with 429 (Too Many Requests), the bucket halves its rate and pauses for the server's
+Retry-After period, then creeps back up towards the target rate as requests succeed.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0  # Responses received, including ones that were retried
+    retries: int = 0
+    throttled: int = 0  # 429 responses
+    server_errors: int = 0  # 5xx responses
+    connection_errors: int = 0
+    waited: float = 0.0  # Seconds spent waiting on the rate limiter or backing off
+    cache_hits: int = 0  # Conditional GETs answered with 304 (Not Modified)
+    cache_misses: int = 0  # Conditional GETs that downloaded a new body
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        min_rate: Optional[float] = None,
+        decrease: float = 0.5,
+        increase: Optional[float] = None,
+    ):
+        """Initializes a token bucket allowing rate requests per second.
+
+        Args:
+            rate: Target (and maximum) requests per second
+        Optional Args:
+            burst: Number of requests that can be made at once after being idle.
+              Defaults to one second's worth of requests.
+            min_rate: Slowest rate to fall back to after being throttled. Defaults to
+              1/16 of rate.
+            decrease: Factor the rate is multiplied by each time the server throttles us
+            increase: Requests per second added back after each successful request.
+              Defaults to 5% of rate.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._rate = rate
+        self._decrease = decrease
+        self._increase = increase if increase is not None else rate / 20
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current requests per second allowed."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Blocks until a request may be made.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+            waited += wait
+
+    def slow_down(self, pause: Optional[float] = None) -> None:
+        """Lowers the rate after being throttled, optionally pausing all requests.
+
+        Args:
+            pause: Seconds no requests should be made for (e.g. from Retry-After)
+        """
+        with self._lock:
+            self._rate = max(self.min_rate, self._rate * self._decrease)
+            if pause is not None:
+                now = time.monotonic()
+                self._refill(now)
+                self._tokens = 0
+                self._paused_until = max(self._paused_until, now + pause)
+
+    def speed_up(self) -> None:
+        """Raises the rate back towards the target after a successful request."""
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._rate = min(self.max_rate, self._rate + self._increase)
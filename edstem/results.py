@@ -0,0 +1,206 @@
+"""
+Module for parsing EdStem results CSVs into typed pandas DataFrames
+
+The results endpoints of EdStemAPI (get_lesson_completions, get_challenge_results,
+get_quiz_results and their download_* variants) return CSV files. The functions here
+read them in a single pass of pandas.read_csv, with columns given useful types:
+student identity columns (email, tutorial, role) become categoricals, timestamp
+columns become timezone-aware datetimes and scores are numeric.
+
+pandas is only imported when one of these functions is called, so importing edstem stays
+fast for scripts that never parse results.
+"""
+import csv
+import io
+import os
+from typing import IO, TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# A results CSV as returned by a get_* method, or the path a download_* method wrote to
+Source = bytes | str | os.PathLike
+
+# Columns describing the student rather than their results (compared in lower case)
+IDENTITY_COLUMNS = frozenset(
+    {"name", "email", "tutorial", "role", "sis id", "sis_id", "username", "user id"}
+)
+CATEGORY_COLUMNS = frozenset({"email", "tutorial", "role"})
+
+PASS_VALUES = ["pass", "Pass", "PASS", "passed", "Passed", "true", "True"]
+FAIL_VALUES = ["fail", "Fail", "FAIL", "failed", "Failed", "false", "False"]
+
+# Cells in a score column that mean "no score" rather than making the column text
+NO_SCORE_VALUES = ["-", "N/A", "n/a"]
+
+# Timestamp columns without an " at" suffix (compared in lower case). Test case names
+# often contain "time" or "date", so other columns are not guessed from their names.
+TIMESTAMP_COLUMNS = frozenset({"date", "time", "timestamp"})
+
+
+def _is_timestamp_column(column: str) -> bool:
+    name = column.strip().lower()
+    return name.endswith((" at", "_at")) or name in TIMESTAMP_COLUMNS
+
+
+def _open(source: Source) -> IO[bytes]:
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return open(source, "rb")
+
+
+def _read_results(
+    source: Source,
+    extra_header_rows: Iterable[str] = (),
+    timestamp_columns: Optional[Iterable[str]] = None,
+    boolean_columns: Iterable[str] = (),
+    tz: Optional[str] = None,
+) -> "DataFrame":
+    """Reads a results CSV, typing its columns.
+
+    Args:
+        source: CSV content or path
+        extra_header_rows: Names for rows directly after the header that describe each
+          column (e.g. slide numbers). They are stored in the DataFrame's attrs.
+        timestamp_columns: Columns to parse as datetimes, in addition to any whose name
+          looks like a timestamp (e.g. "Submitted At"). A column that doesn't hold ISO 8601
+          timestamps is left as text.
+        boolean_columns: Columns holding pass/fail values
+        tz: Timezone to convert datetimes to. Defaults to UTC.
+    """
+    import pandas as pd
+
+    extra_header_rows = list(extra_header_rows)
+    with _open(source) as f:
+        # Peek at the header rows to decide column types before the single full parse
+        lines = [
+            f.readline().decode("utf-8-sig") for _ in range(1 + len(extra_header_rows))
+        ]
+        header, *extra_rows = list(csv.reader(lines))
+        f.seek(0)
+
+        timestamps = set(timestamp_columns or ())
+        timestamps |= {c for c in header if _is_timestamp_column(c)}
+        booleans = set(boolean_columns)
+        dtype: dict[str, Any] = {
+            c: "category" for c in header if c.lower() in CATEGORY_COLUMNS
+        }
+        dtype |= {c: "string" for c in timestamps}
+        # Pass/fail cells are read as booleans by the parser itself. A column that also
+        # holds other text keeps its cells as strings.
+        passfail: dict[str, Any] = (
+            {"true_values": PASS_VALUES, "false_values": FAIL_VALUES}
+            if booleans
+            else {}
+        )
+
+        frame = pd.read_csv(
+            f,
+            encoding="utf-8-sig",
+            skiprows=range(1, 1 + len(extra_rows)),
+            dtype=dtype,
+            **passfail,
+        )
+
+    for column in header:
+        values = frame[column]
+        if column in timestamps:
+            parsed = pd.to_datetime(values, utc=True, format="ISO8601", errors="coerce")
+            if not (parsed.isna() & values.notna()).any():
+                frame[column] = parsed.dt.tz_convert(tz) if tz else parsed
+        elif column in booleans:
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind == "boolean" or values.isna().all():
+                frame[column] = values.astype("boolean")
+        elif column.lower() not in IDENTITY_COLUMNS and not (
+            pd.api.types.is_numeric_dtype(values)
+            or isinstance(values.dtype, pd.CategoricalDtype)
+        ):
+            converted = pd.to_numeric(values, errors="coerce")
+            failed = values[converted.isna() & values.notna()]
+            if failed.isin(NO_SCORE_VALUES).all():
+                frame[column] = converted
+
+    for name, row in zip(extra_header_rows, extra_rows):
+        frame.attrs[name] = dict(zip(header, row))
+    return frame
+
+
+def _result_columns(source: Source) -> list[str]:
+    with _open(source) as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]))
+    return [c for c in header if c.lower() not in IDENTITY_COLUMNS]
+
+
+def parse_lesson_completions(
+    source: Source,
+    completions: bool = True,
+    numbers: bool = True,
+    scores: bool = True,
+    tz: Optional[str] = None,
+) -> "DataFrame":
+    """Parses the CSV from get_lesson_completions/download_lesson_completions.
+
+    The optional arguments must match the flags the CSV was downloaded with.
+
+    Args:
+        source: CSV content or path
+    Optional Args:
+        completions: True if the CSV holds completion timestamps, False if it holds scores
+        numbers: True if the CSV has a slide numbers header row (stored in
+          frame.attrs["slide_numbers"])
+        scores: True if the CSV has a slide scores header row (stored in
+          frame.attrs["slide_scores"])
+        tz: Timezone to convert datetimes to. Defaults to UTC.
+
+    Returns:
+        A DataFrame with one row per student
+    """
+    extra_header_rows = []
+    if numbers:
+        extra_header_rows.append("slide_numbers")
+    if scores:
+        extra_header_rows.append("slide_scores")
+    return _read_results(
+        source,
+        extra_header_rows,
+        timestamp_columns=_result_columns(source) if completions else None,
+        tz=tz,
+    )
+
+
+def parse_challenge_results(
+    source: Source, score_type: str = "pertestcase", tz: Optional[str] = None
+) -> "DataFrame":
+    """Parses the CSV from get_challenge_results/download_challenge_results.
+
+    Args:
+        source: CSV content or path
+    Optional Args:
+        score_type: The score_type the CSV was downloaded with. For 'passfail', testcase
+          columns are parsed as booleans; for 'pertestcase' they are numeric.
+        tz: Timezone to convert datetimes to. Defaults to UTC.
+
+    Returns:
+        A DataFrame with one row per submission
+    """
+    boolean_columns: list[str] = []
+    if score_type == "passfail":
+        boolean_columns = [
+            c for c in _result_columns(source) if not _is_timestamp_column(c)
+        ]
+    return _read_results(source, boolean_columns=boolean_columns, tz=tz)
+
+
+def parse_quiz_results(source: Source, tz: Optional[str] = None) -> "DataFrame":
+    """Parses the CSV from get_quiz_results/download_quiz_results.
+
+    Args:
+        source: CSV content or path
+    Optional Args:
+        tz: Timezone to convert datetimes to. Defaults to UTC.
+
+    Returns:
+        A DataFrame with one row per student response
+    """
+    return _read_results(source, tz=tz)
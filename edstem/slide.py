@@ -1,9 +1,10 @@
-import copy
 from datetime import datetime
 from typing import Any, NotRequired, Optional, TypedDict
 
 import edstem._base as base
-from edstem.ed_api import EdStemAPI
+from edstem.challenge import Challenge
+from edstem.ed_api import EdStemAPI, get_default_api
+from edstem.quiz_question import QuizQuestion
 
 
 class SlideData(TypedDict):
@@ -31,17 +32,26 @@ class SlideData(TypedDict):
 
 
 class Slide(base.EdObject[base.SlideID]):
+    __slots__ = ("_cached_created_at", "_challenge")
+
     _data: dict[str, Any]
 
-    def __init__(self, data: SlideData) -> None:
-        super().__init__()
+    def __init__(
+        self, data: SlideData, api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> None:
+        super().__init__(api)
+        self._cached_created_at: datetime | None = None
+        self._challenge: Optional[Challenge] = None
         base._proper_keys(data, SlideData)  # type: ignore
-        self._data = copy.deepcopy(data)  # type: ignore
+        # All slide values are replaced rather than mutated, so a shallow copy suffices.
+        # With copy=False, the slide takes ownership of data instead.
+        self._data = dict(data) if copy else data  # type: ignore
 
     @staticmethod
-    def from_dict(data: base.JSON) -> "Slide":
-        base._proper_keys(data, SlideData)
-        return Slide(**data)
+    def from_dict(
+        data: base.JSON, api: Optional[EdStemAPI] = None, copy: bool = True
+    ) -> "Slide":
+        return Slide(data, api=api, copy=copy)  # type: ignore
 
     @property
     def id(self) -> base.SlideID:
@@ -99,9 +109,12 @@ class Slide(base.EdObject[base.SlideID]):
 
     @property
     def created_at(self) -> datetime:
-        value = base.EdObject.str_to_datetime(self._data["created_at"])
-        assert value is not None
-        return value
+        if self._cached_created_at is None:
+            self._cached_created_at = base.EdObject.str_to_datetime(
+                self._data["created_at"]
+            )
+        assert self._cached_created_at is not None
+        return self._cached_created_at
 
     @property
     def passage(self) -> base.XML:
@@ -135,14 +148,38 @@ class Slide(base.EdObject[base.SlideID]):
 
     # API Methods
     @staticmethod
-    def slide(slide_id: base.SlideID) -> "Slide":
-        api = EdStemAPI()
-        return Slide.from_dict(api.get_slide(slide_id))
+    def slide(slide_id: base.SlideID, api: Optional[EdStemAPI] = None) -> "Slide":
+        api = api if api is not None else get_default_api()
+        return Slide.from_dict(api.get_slide(slide_id), api=api)
+
+    @property
+    def challenge(self) -> Optional[Challenge]:
+        """The coding challenge on this slide, or None if it has none.
+
+        The same Challenge is returned each time, so its users, submissions and results
+        are only downloaded once.
+        """
+        challenge_id = self._data.get("challenge_id")
+        if challenge_id is None:
+            return None
+        if self._challenge is None or self._challenge.id != challenge_id:
+            self._challenge = Challenge(challenge_id, name=self.name, api=self._api)
+        return self._challenge
+
+    def get_questions(self) -> base.EdCollection[QuizQuestion]:
+        return QuizQuestion.get_questions(self.id, self._api)
 
     def post_changes(self):
+        if not self.is_dirty:
+            return
         slide_data = self._to_dict(changes_only=True)
-        new_slide_data = self._api.edit_slide(self.id, slide_data)
+        # Slides listed in a lesson lack their content, so only a slide loaded with
+        # Slide.slide holds enough state to be written without reading it first
+        current = self._data if "content" in self._data else None
+        new_slide_data = self._api.edit_slide(self.id, slide_data, current=current)
         self._data.update(new_slide_data)
+        self._cached_created_at = None
+        self._mark_clean()
 
     def delete(self) -> None:
-        self._api.delete_slide(self.id)
+        self._api.delete_slide(self.id, course_id=self.course_id)
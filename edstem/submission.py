@@ -0,0 +1,241 @@
+"""
+Module defining challenge submission records and incremental decoding of them
+
+A submissions export can hold every submission of every student, so
+EdStemAPI.iter_submissions decodes the response as it downloads and yields one
+Submission at a time instead of loading the whole document.
+
+SubmissionIndex groups submissions by challenge and user so questions like "the latest
+submission of every student on a challenge" are dictionary lookups, e.g. after fetching
+a course's submissions concurrently with EdStemAPI.get_submissions_bulk.
+"""
+import codecs
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, Optional
+
+from edstem.bulk import BulkReport
+
+_WHITESPACE = " \t\n\r"
+
+
+@dataclass(frozen=True, slots=True)
+class Submission:
+    id: int
+    user_id: int
+    challenge_id: Optional[int]
+    created_at: Optional[datetime]
+    score: Optional[float]  # None if Ed did not report a score
+    data: dict[str, Any] = field(repr=False, compare=False)  # The full JSON record
+
+    @staticmethod
+    def from_dict(
+        data: dict[str, Any],
+        user_id: Optional[int] = None,
+        challenge_id: Optional[int] = None,
+    ) -> "Submission":
+        """Makes a submission from Ed's JSON.
+
+        Optional Args:
+            user_id: Used if the JSON doesn't say which user made the submission
+            challenge_id: Used if the JSON doesn't say which challenge it is for
+        """
+        result = data.get("result") or {}
+        score = data.get("score", result.get("score"))
+        created_at = data.get("created_at")
+        if user_id is None or "user_id" in data:
+            user_id = data["user_id"]
+        return Submission(
+            id=data["id"],
+            user_id=user_id,
+            challenge_id=data.get("challenge_id", challenge_id),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            score=float(score) if score is not None else None,
+            data=data,
+        )
+
+
+# Orders submissions oldest first. Submissions without a timestamp sort first, and ids
+# break ties since Ed assigns them in increasing order.
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _age(submission: Submission) -> tuple[datetime, int]:
+    created_at = submission.created_at or _EPOCH
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at, submission.id
+
+
+def _rank(submission: Submission) -> tuple[float, datetime, int]:
+    score = submission.score if submission.score is not None else float("-inf")
+    return (score, *_age(submission))
+
+
+class SubmissionIndex:
+    """Submissions grouped by challenge and user, with each user's latest and best.
+
+    The latest and best submissions are kept up to date as submissions are added, so
+    every query is a dictionary lookup. The best submission has the highest score, the
+    latest one breaking ties.
+    """
+
+    def __init__(self, submissions: Iterable[Submission] = ()) -> None:
+        self._submissions: dict[tuple[Optional[int], int], list[Submission]] = {}
+        self._by_user: dict[int, list[Submission]] = {}
+        self._by_challenge: dict[Optional[int], list[Submission]] = {}
+        self._latest: dict[Optional[int], dict[int, Submission]] = {}
+        self._best: dict[Optional[int], dict[int, Submission]] = {}
+        for submission in submissions:
+            self.add(submission)
+
+    @staticmethod
+    def from_report(report: BulkReport[list[Submission]]) -> "SubmissionIndex":
+        """Indexes the submissions fetched successfully in a bulk fetch."""
+        return SubmissionIndex(
+            submission for result in report.results for submission in result.value or []
+        )
+
+    def add(self, submission: Submission) -> None:
+        challenge_id, user_id = submission.challenge_id, submission.user_id
+        self._submissions.setdefault((challenge_id, user_id), []).append(submission)
+        self._by_user.setdefault(user_id, []).append(submission)
+        self._by_challenge.setdefault(challenge_id, []).append(submission)
+
+        latest = self._latest.setdefault(challenge_id, {})
+        if user_id not in latest or _age(submission) > _age(latest[user_id]):
+            latest[user_id] = submission
+        best = self._best.setdefault(challenge_id, {})
+        if user_id not in best or _rank(submission) > _rank(best[user_id]):
+            best[user_id] = submission
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._submissions.values())
+
+    @property
+    def challenge_ids(self) -> list[Optional[int]]:
+        return list(self._by_challenge)
+
+    @property
+    def user_ids(self) -> list[int]:
+        return list(self._by_user)
+
+    def get(self, challenge_id: Optional[int], user_id: int) -> list[Submission]:
+        """Returns a user's submissions to a challenge, oldest first."""
+        return sorted(self._submissions.get((challenge_id, user_id), []), key=_age)
+
+    def by_user(self, user_id: int) -> list[Submission]:
+        """Returns a user's submissions to every challenge, oldest first."""
+        return sorted(self._by_user.get(user_id, []), key=_age)
+
+    def by_challenge(self, challenge_id: Optional[int]) -> list[Submission]:
+        """Returns every submission to a challenge, oldest first."""
+        return sorted(self._by_challenge.get(challenge_id, []), key=_age)
+
+    def latest(self, challenge_id: Optional[int]) -> dict[int, Submission]:
+        """Returns each user's latest submission to a challenge, keyed by user id."""
+        return dict(self._latest.get(challenge_id, {}))
+
+    def best(self, challenge_id: Optional[int]) -> dict[int, Submission]:
+        """Returns each user's best submission to a challenge, keyed by user id."""
+        return dict(self._best.get(challenge_id, {}))
+
+
+class _JSONStream:
+    """Decodes JSON values one at a time from chunks of UTF-8 bytes."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        # Decoded text not consumed yet starts at _position, so values can be decoded in
+        # place rather than copying the rest of the buffer after each one
+        self._buffer = ""
+        self._position = 0
+        self._done = False
+
+    def _read(self) -> bool:
+        """Appends the next chunk to the buffer, returning False at the end of input."""
+        if self._done:
+            return False
+        try:
+            text = self._decoder.decode(next(self._chunks))
+        except StopIteration:
+            text = self._decoder.decode(b"", final=True)
+            self._done = True
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character, or "" at the end of input."""
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer) or not self._read():
+                return self._buffer[self._position : self._position + 1]
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(f"Expected one of {characters!r} but found {character!r}")
+        self._position += 1
+        return character
+
+    def value(self) -> Any:
+        """Decodes the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._position)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._done:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._done:
+                    raise
+            self._read()
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: Optional[str] = None
+) -> Iterator[Any]:
+    """Yields the items of a JSON array as soon as each is fully downloaded.
+
+    Args:
+        chunks: The JSON document, in pieces
+    Optional Args:
+        key: If the document is an object rather than an array, the key holding the
+          array. Other values in the object are skipped.
+
+    Raises:
+        ValueError: If the document is not valid JSON of the expected shape
+    """
+    stream = _JSONStream(chunks)
+    if stream.peek() == "{":
+        if key is None:
+            raise ValueError("Expected a JSON array but found an object")
+        stream.expect("{")
+        while True:
+            if stream.peek() == "}":
+                raise ValueError(f"Key not found in JSON object: {key}")
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                break
+            stream.value()
+            if stream.expect(",}") == "}":
+                raise ValueError(f"Key not found in JSON object: {key}")
+
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        if stream.expect(",]") == "]":
+            return
@@ -1,7 +1,7 @@
 from typing import Any, NotRequired, Optional, TypedDict
 
 import edstem._base as base
-from edstem.ed_api import EdStemAPI
+from edstem.ed_api import EdStemAPI, get_default_api
 
 
 class UserData(TypedDict):
@@ -15,6 +15,8 @@ class UserData(TypedDict):
 
 
 class User(base.EdObject[base.UserID]):
+    __slots__ = ()
+
     _data: dict[str, Any]
 
     def __init__(
@@ -26,10 +28,11 @@ class User(base.EdObject[base.UserID]):
         tutorial: Optional[str] = None,
         accepted: bool = False,
         sourced_id: str = "",
+        api: Optional[EdStemAPI] = None,
         **kwargs,
     ) -> None:
         # Currently left out: username, lab_id, lti_synced
-        super().__init__()
+        super().__init__(api)
         self._data: UserData = {
             "id": id,
             "name": name,
@@ -41,9 +44,9 @@ class User(base.EdObject[base.UserID]):
         }
 
     @staticmethod
-    def from_dict(data: base.JSON) -> "User":
+    def from_dict(data: base.JSON, api: Optional[EdStemAPI] = None) -> "User":
         base._proper_keys(data, UserData)
-        return User(**data)
+        return User(**data, api=api)
 
     # TODO Set name, email, role?
 
@@ -106,17 +109,26 @@ class User(base.EdObject[base.UserID]):
 
     # API Methods
     @staticmethod
-    def get_all_users(course_id: base.CourseID) -> list["User"]:
-        api = EdStemAPI()
+    def get_all_users(
+        course_id: base.CourseID, api: Optional[EdStemAPI] = None
+    ) -> base.EdCollection["User"]:
+        api = api if api is not None else get_default_api()
         users = api.get_all_users(course_id)
-        return [User.from_dict(u) for u in users]
+        return base.EdCollection(User.from_dict(u, api=api) for u in users)
 
     @staticmethod
-    def get_user(course_id: base.CourseID, id_or_name: base.UserID | str) -> "User":
-        users = User.get_all_users(course_id)
+    def get_user(
+        course_id: base.CourseID,
+        id_or_name: base.UserID | str,
+        api: Optional[EdStemAPI] = None,
+    ) -> "User":
+        users = User.get_all_users(course_id, api)
         return base.EdObject._filter_single_id_or_name(users, id_or_name)
 
     def post_changes(self):
+        if not self.is_dirty:
+            return
         user_data = self._to_dict(changes_only=True)
         new_user_data = self._api.edit_user(self.id, user_data)
         self._data.update(new_user_data)
+        self._mark_clean()
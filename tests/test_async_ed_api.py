@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import responses
+
+import edstem.auth
+from edstem.async_ed_api import AsyncEdStemAPI
+from edstem.ed_api import EdStemAPI
+
+
+class AsyncEdStemAPITest(unittest.TestCase):
+    @responses.activate
+    def test_get_slides(self):
+        edstem.auth.set_token("Fake Token")
+        for slide_id in range(5):
+            responses.get(
+                f"https://us.edstem.org/api/lessons/slides/{slide_id}",
+                json={"slide": {"id": slide_id}},
+            )
+
+        async def get_slides():
+            async with AsyncEdStemAPI(max_concurrency=3) as ed:
+                return await asyncio.gather(*(ed.get_slide(i) for i in range(5)))
+
+        slides = asyncio.run(get_slides())
+        self.assertEqual([{"id": i} for i in range(5)], slides)
+
+    def test_max_concurrency(self):
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def get_lesson(lesson_id):
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return {"id": lesson_id}
+
+        api = MagicMock(spec=EdStemAPI)
+        api.pool_maxsize = 4
+        api.get_lesson.side_effect = get_lesson
+
+        async def get_lessons():
+            async with AsyncEdStemAPI(max_concurrency=4, api=api) as ed:
+                return await asyncio.gather(*(ed.get_lesson(i) for i in range(20)))
+
+        lessons = asyncio.run(get_lessons())
+        self.assertEqual([{"id": i} for i in range(20)], lessons)
+        self.assertLessEqual(most_running, 4)
+        self.assertGreater(most_running, 1)
+        # The api was passed in, so it belongs to the caller and stays open
+        api.close.assert_not_called()
+
+    def test_pool_smaller_than_concurrency(self):
+        api = MagicMock(spec=EdStemAPI)
+        api.pool_maxsize = 10
+        with self.assertRaises(ValueError):
+            AsyncEdStemAPI(max_concurrency=16, api=api)
+
+    def test_exit_closes_off_event_loop(self):
+        api = MagicMock(spec=EdStemAPI)
+        api.pool_maxsize = 16
+        closed_on = []
+
+        async def open_and_exit():
+            ed = AsyncEdStemAPI(api=api)
+            ed.close = lambda: closed_on.append(threading.current_thread())  # type: ignore
+            async with ed:
+                return threading.current_thread()
+
+        loop_thread = asyncio.run(open_and_exit())
+        self.assertEqual(1, len(closed_on))
+        self.assertIsNot(loop_thread, closed_on[0])
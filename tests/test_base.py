@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+import unittest
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from testing_utils import *
+
+import edstem
+from edstem._base import EdCollection, EdObject
+from edstem.user import User
+
+
+class EdCollectionTest(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.users = EdCollection(User.from_dict(u) for u in TEST_USER_JSON)
+
+    def test_get(self):
+        self.assertEqual(321, self.users.get("Archie Andrews").id)
+        self.assertEqual("Sabrina Spellman", self.users.get(555).name)
+        with self.assertRaises(ValueError):
+            self.users.get("Not a user")
+
+    def test_duplicates(self):
+        self.assertEqual({}, self.users.duplicate_names())
+        self.users.append(User.from_dict(TEST_USER_AANG_JSON | {"id": 124}))
+        self.assertEqual(
+            [123, 124], [u.id for u in self.users.duplicate_names()["Aang Airbender"]]
+        )
+        with self.assertRaises(ValueError):
+            self.users.get("Aang Airbender")
+        self.assertEqual(124, self.users.get(124).id)
+
+    def test_reindex_after_rename(self):
+        self.users.get(123)
+        self.users[0].name = "Avatar Aang"
+        self.users.reindex()
+        self.assertEqual(123, self.users.get("Avatar Aang").id)
+
+
+class StrToDatetimeTest(unittest.TestCase):
+    def test_iso_8601(self):
+        self.assertEqual(
+            datetime(2023, 5, 17, 22, 0, tzinfo=timezone.utc),
+            EdObject.str_to_datetime("2023-05-18T08:00:00+10:00"),
+        )
+        self.assertIsNone(EdObject.str_to_datetime(None))
+
+    def test_timezone(self):
+        result = EdObject.str_to_datetime(
+            "2023-05-18T08:00:00+10:00", "America/Los_Angeles"
+        )
+        assert result is not None
+        self.assertEqual(15, result.hour)
+        self.assertEqual(ZoneInfo("America/Los_Angeles"), result.tzinfo)
+
+    def test_not_iso_8601(self):
+        self.assertEqual(
+            datetime(2023, 5, 18, 8, 0), EdObject.str_to_datetime("May 18 2023 8:00")
+        )
+
+    def test_import_does_not_load_pandas(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(edstem.__file__)))
+        code = "import sys, edstem; print('pandas' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=os.environ | {"PYTHONPATH": root},
+        )
+        self.assertEqual("False", result.stdout.strip())
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+import requests
+import responses
+
+import edstem.auth
+from edstem.bulk import run_bulk
+from edstem.ed_api import EdStemAPI
+
+
+def feedback_url(submission_id: int) -> str:
+    return f"https://us.edstem.org/api/challenges/submissions/{submission_id}/feedback"
+
+
+class RunBulkTest(unittest.TestCase):
+    def test_results_in_order(self):
+        report = run_bulk(lambda x: x * 2, range(10), max_workers=4)
+        self.assertEqual(list(range(10)), [r.key for r in report.results])
+        self.assertEqual([x * 2 for x in range(10)], [r.value for r in report.results])
+        self.assertEqual(10, len(report.succeeded))
+
+    def test_retries_transient_errors(self):
+        calls = {"count": 0}
+
+        def flaky(x):
+            calls["count"] += 1
+            if calls["count"] < 3:
+                raise requests.ConnectionError("Connection reset")
+            return x
+
+        report = run_bulk(flaky, [1], retries=3, backoff=0)
+        self.assertTrue(report.results[0].ok)
+        self.assertEqual(3, report.results[0].attempts)
+
+    def test_failures_reported(self):
+        def fail(x):
+            raise ValueError(x)
+
+        report = run_bulk(fail, [1, 2], retries=3, backoff=0)
+        self.assertEqual(2, len(report.failed))
+        # Not transient, so never retried
+        self.assertEqual([1, 1], [r.attempts for r in report.results])
+
+    def test_values(self):
+        # A successful call may return None
+        report = run_bulk(lambda x: None, [1, 2])
+        self.assertEqual([None, None], report.values())
+
+        def fail(x):
+            if x == 2:
+                raise ValueError(x)
+
+        with self.assertRaises(ValueError):
+            run_bulk(fail, [1, 2, 3]).values()
+
+    def test_dry_run(self):
+        called = []
+        report = run_bulk(called.append, [1, 2, 3], skip=lambda i: i == 2, dry_run=True)
+        self.assertEqual([], called)
+        self.assertEqual([1, 3], [r.key for r in report.succeeded])
+        self.assertEqual([2], [r.key for r in report.skipped])
+        self.assertTrue(report.dry_run)
+
+
+class PostGradesBulkTest(unittest.TestCase):
+    @responses.activate
+    def test_checkpoint(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI()
+        records = [(i, [], None) for i in range(1, 5)]
+        for submission_id, _, _ in records:
+            status = 400 if submission_id == 3 else 200
+            responses.put(feedback_url(submission_id), json={}, status=status)
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "grades.checkpoint")
+            report = api.post_grades_bulk(records, checkpoint=checkpoint)
+            self.assertEqual([1, 2, 4], [r.key for r in report.succeeded])
+            self.assertEqual([3], [r.key for r in report.failed])
+
+            # Only the failed submission is posted again
+            responses.replace(responses.PUT, feedback_url(3), json={})
+            report = api.post_grades_bulk(records, checkpoint=checkpoint)
+            self.assertEqual([1, 2, 4], [r.key for r in report.skipped])
+            self.assertEqual([3], [r.key for r in report.succeeded])
+            self.assertEqual(5, len(responses.calls))
+
+
+class BulkEndpointsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        edstem.auth.set_token("Fake Token")
+        self.api = EdStemAPI(rate_limit=1000)
+
+    @responses.activate
+    def test_delete_submissions(self):
+        for submission_id in [1, 2, 3]:
+            responses.delete(
+                f"https://us.edstem.org/api/challenges/submissions/{submission_id}",
+                status=404 if submission_id == 2 else 200,
+            )
+
+        report = self.api.delete_submissions([1, 2, 3, 1])
+
+        self.assertEqual([1, 3], [r.key for r in report.succeeded])
+        self.assertEqual([2], [r.key for r in report.failed])
+        self.assertEqual(3, len(responses.calls))
+        self.assertGreater(report.throughput, 0)
+
+    @responses.activate
+    def test_connect_users_dry_run(self):
+        report = self.api.connect_users_to_workspace(5, [123, 321], dry_run=True)
+        self.assertEqual([123, 321], [r.key for r in report.succeeded])
+        self.assertEqual(0, len(responses.calls))
+
+        responses.post("https://us.edstem.org/api/challenges/5/connect")
+        report = self.api.connect_users_to_workspace(5, [123, 321])
+        self.assertEqual(2, len(report.succeeded))
+        self.assertEqual(2, len(responses.calls))
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from testing_utils import *
+
+from edstem._base import ChallengeID
+from edstem.challenge import Challenge
+from edstem.lesson import Lesson
+from edstem.submission import Submission
+
+TEST_RESULTS_CSV = b"Name,Email,Score\nAlice,alice@uw.edu,10\nBob,bob@uw.edu,7\n"
+
+
+def submission(id, user_id, day, score):
+    return Submission.from_dict(
+        {"id": id, "user_id": user_id, "challenge_id": 77, "score": score}
+        | {"created_at": f"2023-05-{day:02}T08:00:00+10:00"}
+    )
+
+
+class ChallengeTest(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.api: MagicMock = self.course._api  # type: ignore
+        self.api.get_all_users_for_challenge.return_value = [{"id": 123}]
+        self.api.iter_submissions.side_effect = lambda challenge_id, type: iter(
+            [submission(1, 123, 1, 10), submission(2, 123, 2, 5)]
+        )
+        self.api.get_challenge_results.return_value = TEST_RESULTS_CSV
+        self.challenge = Challenge(ChallengeID(77), name="Homework 1")
+
+    def test_loads_once(self):
+        for _ in range(3):
+            self.assertEqual([{"id": 123}], self.challenge.users())
+            self.assertEqual(2, self.challenge.latest_submissions()[123].id)
+            self.assertEqual(1, self.challenge.best_submissions()[123].id)
+            self.assertEqual(2, len(self.challenge.results()))
+
+        self.api.get_all_users_for_challenge.assert_called_once_with(77)
+        self.api.iter_submissions.assert_called_once_with(77, type="all")
+        self.api.get_challenge_results.assert_called_once_with(77)
+
+        # Results with different options are cached separately
+        self.challenge.results(type="all")
+        self.challenge.results(type="all")
+        self.assertEqual(2, self.api.get_challenge_results.call_count)
+
+    def test_refresh(self):
+        self.challenge.users()
+        self.challenge.submissions()
+        self.challenge.users(refresh=True)
+        self.assertEqual(2, self.api.get_all_users_for_challenge.call_count)
+
+        self.challenge.refresh()
+        self.challenge.users()
+        self.challenge.submissions()
+        self.assertEqual(3, self.api.get_all_users_for_challenge.call_count)
+        self.assertEqual(2, self.api.iter_submissions.call_count)
+
+    def test_from_slide_and_lesson(self):
+        slides = [
+            TEST_SLIDE_0_JSON | {"challenge_id": 77},
+            TEST_SLIDE_1_JSON | {"challenge_id": None},
+        ]
+        lesson = Lesson.from_dict(TEST_LESSON_WITH_SLIDES_JSON | {"slides": slides})
+
+        slide = lesson.slides[0]
+        self.assertIs(slide.challenge, slide.challenge)
+        self.assertIsNone(lesson.slides[1].challenge)
+        self.assertEqual([77], [c.id for c in lesson.challenges])
+        self.assertIs(slide.challenge, lesson.get_challenge(slide.name))
+
+    def test_from_listing_lesson(self):
+        slides = [
+            TEST_SLIDE_0_JSON | {"challenge_id": 77},
+            TEST_SLIDE_1_JSON | {"challenge_id": None},
+        ]
+        self.api.get_lesson.return_value = TEST_LESSON_0_JSON | {"slides": slides}
+        # Lessons from a course listing have a slide count but no slides
+        lesson = Lesson.from_dict(TEST_LESSON_0_JSON)
+
+        self.assertEqual([77], [c.id for c in lesson.challenges])
+        challenge = lesson.get_challenge(TEST_SLIDE_0_JSON["title"])
+        self.assertIs(lesson.slides[0].challenge, challenge)
+        self.api.get_lesson.assert_called_once_with(TEST_LESSON_0_JSON["id"])
@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+
+import requests
+from testing_utils import *
+
+from edstem.changes import ChangeSet
+from edstem.lesson import Lesson
+from edstem.module import Module
+from edstem.user import User
+
+
+class TestChangeSet(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.api: MagicMock = self.course._api  # type: ignore
+        self.api.edit_lesson.return_value = {}
+        self.api.edit_slide.return_value = {}
+        self.api.edit_module.return_value = {}
+        self.api.edit_user.return_value = {}
+
+    def test_post_changes_skips_clean_objects(self):
+        lesson = Lesson.from_dict(TEST_LESSON_WITH_SLIDES_JSON)
+        lesson.slides[0].hidden = True
+        self.assertTrue(lesson.is_dirty)
+        self.assertFalse(lesson.slides[1].is_dirty)
+
+        lesson.post_changes()
+
+        self.api.edit_slide.assert_called_once_with(
+            335934, {"is_hidden": True}, current=None
+        )
+        self.api.edit_lesson.assert_not_called()
+        self.assertFalse(lesson.is_dirty)
+
+        # Nothing left to post
+        lesson.post_changes()
+        self.assertEqual(1, self.api.edit_slide.call_count)
+
+    def test_flush(self):
+        lessons = [Lesson.from_dict(TEST_LESSON_0_JSON) for _ in range(3)]
+        lessons[0].visibility.hidden = False
+        lessons[2].visibility.hidden = False
+        module = Module.from_dict(TEST_MODULE_0_JSON)
+        module.name = "Renamed"
+        user = User.from_dict(TEST_USER_AANG_JSON)
+
+        changes = ChangeSet()
+        changes.add_all(lessons)
+        changes.add(module, user)
+        self.assertEqual([lessons[0], lessons[2], module], changes.dirty)
+
+        report = changes.flush()
+
+        self.assertEqual(3, len(report.succeeded))
+        self.assertEqual(2, self.api.edit_lesson.call_count)
+        self.api.edit_module.assert_called_once()
+        self.api.edit_user.assert_not_called()
+        self.assertEqual(0, len(changes))
+
+    def test_flush_posts_lesson_slides_separately(self):
+        lesson = Lesson.from_dict(TEST_LESSON_WITH_SLIDES_JSON)
+        lesson.visibility.hidden = False
+        lesson.slides[1].name = "Quiz"
+
+        changes = ChangeSet()
+        changes.add(lesson)
+        report = changes.flush()
+
+        self.assertEqual([lesson.slides[1], lesson], [r.key for r in report.results])
+        self.api.edit_slide.assert_called_once()
+        self.api.edit_lesson.assert_called_once()
+        self.assertEqual(
+            (60007, {"is_hidden": False}), self.api.edit_lesson.call_args.args
+        )
+
+    def test_failed_objects_stay_dirty(self):
+        users = [User.from_dict(u) for u in TEST_USER_JSON]
+        for user in users:
+            user.tutorial = "AA"
+        error = requests.HTTPError("Forbidden")
+        self.api.edit_user.side_effect = lambda user_id, data: (
+            self._raise(error) if user_id == 321 else {}
+        )
+
+        with self.assertRaises(requests.HTTPError):
+            with ChangeSet() as changes:
+                changes.add_all(users)
+
+        self.assertEqual([users[1]], changes.dirty)
+        self.assertEqual([users[1]], [r.key for r in changes.last_report.failed])
+
+    def test_nothing_posted_if_block_raises(self):
+        module = Module.from_dict(TEST_MODULE_0_JSON)
+        with self.assertRaises(KeyError):
+            with ChangeSet() as changes:
+                module.name = "Renamed"
+                changes.add(module)
+                raise KeyError()
+        self.api.edit_module.assert_not_called()
+
+    @staticmethod
+    def _raise(error):
+        raise error
@@ -79,3 +79,11 @@ class TestCourse(BaseTest):
         # ID not found
         with self.assertRaises(ValueError):
             self.course.get_lesson(3)
+
+    def test_objects_share_api(self):
+        api = self.course._api
+        users = self.course.get_all_users()
+        modules = self.course.get_all_modules()
+        lessons = self.course.get_all_lessons()
+        for obj in [*users, *modules, *lessons]:
+            self.assertIs(api, obj._api)
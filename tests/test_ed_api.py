@@ -0,0 +1,236 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+import responses
+
+import edstem.auth
+from edstem.ed_api import EdStemAPI, EditConflictError
+from edstem.rate_limit import TokenBucket
+
+LESSON_URL = "https://us.edstem.org/api/lessons/1"
+
+
+class EdStemAPITest(unittest.TestCase):
+    def setUp(self) -> None:
+        edstem.auth.set_token("Fake Token")
+        self.api = EdStemAPI(rate_limit=1000, backoff=0)
+
+    @responses.activate
+    def test_retry_after_throttled(self):
+        responses.get(LESSON_URL, status=429, headers={"Retry-After": "0"})
+        responses.get(LESSON_URL, json={"lesson": {"id": 1}})
+
+        self.assertEqual({"id": 1}, self.api.get_lesson(1))
+        stats = self.api.stats
+        self.assertEqual(2, stats.requests)
+        self.assertEqual(1, stats.throttled)
+        self.assertEqual(1, stats.retries)
+        assert self.api.rate_limiter is not None
+        self.assertLess(self.api.rate_limiter.rate, 1000)
+
+    @responses.activate
+    def test_retry_server_error_idempotent_only(self):
+        responses.get(LESSON_URL, status=503)
+        responses.get(LESSON_URL, json={"lesson": {"id": 1}})
+        self.assertEqual({"id": 1}, self.api.get_lesson(1))
+
+        clone_url = "https://us.edstem.org/api/lessons/slides/2/clone"
+        responses.post(clone_url, status=503)
+        with self.assertRaises(requests.HTTPError):
+            self.api.clone_slide(2, 1)
+        self.assertEqual(1, self.api.stats.retries)
+
+    @responses.activate
+    def test_malformed_retry_after(self):
+        for retry_after in ["soon", "Wed, 21 Oct 2015 07:28:00 -0000"]:
+            responses.get(LESSON_URL, status=429, headers={"Retry-After": retry_after})
+        responses.get(LESSON_URL, json={"lesson": {"id": 1}})
+
+        with patch.object(requests.Response, "close", autospec=True) as close:
+            self.assertEqual({"id": 1}, self.api.get_lesson(1))
+        self.assertEqual(2, self.api.stats.retries)
+        # Each retried response is closed so its connection can be reused
+        self.assertEqual(2, close.call_count)
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self):
+        api = EdStemAPI(max_retries=2, backoff=0)
+        responses.get(LESSON_URL, status=500)
+        with self.assertRaises(requests.HTTPError):
+            api.get_lesson(1)
+        self.assertEqual(3, api.stats.requests)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_slow_down_and_recover(self):
+        bucket = TokenBucket(100, min_rate=10)
+        for _ in range(10):
+            bucket.slow_down()
+        self.assertEqual(10, bucket.rate)
+        for _ in range(100):
+            bucket.speed_up()
+        self.assertEqual(100, bucket.rate)
+
+    def test_burst(self):
+        bucket = TokenBucket(1000, burst=5)
+        self.assertEqual(0, sum(bucket.acquire() for _ in range(5)))
+        self.assertGreater(bucket.acquire(), 0)
+
+
+class CourseCacheTest(unittest.TestCase):
+    LESSONS_URL = "https://us.edstem.org/api/courses/1234/lessons"
+    MODULE = {"id": 1, "name": "Module", "course_id": 1234}
+
+    def setUp(self) -> None:
+        edstem.auth.set_token("Fake Token")
+
+    @responses.activate
+    def test_lessons_and_modules_share_request(self):
+        api = EdStemAPI(lessons_cache_ttl=30)
+        responses.get(
+            self.LESSONS_URL, json={"lessons": [{"id": 2}], "modules": [self.MODULE]}
+        )
+        self.assertEqual([{"id": 2}], api.get_all_lessons(1234))
+        self.assertEqual([self.MODULE], api.get_all_modules(1234))
+        self.assertEqual(1, len(responses.calls))
+
+        # Writes invalidate the cached listing
+        responses.put(
+            "https://us.edstem.org/api/lessons/modules/1",
+            json={"module": self.MODULE | {"name": "New"}},
+        )
+        api.edit_module(1234, 1, {"name": "New"})
+        api.get_all_lessons(1234)
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_invalidates_known_course_only(self):
+        api = EdStemAPI(lessons_cache_ttl=30)
+        other_url = "https://us.edstem.org/api/courses/5678/lessons"
+        for url in [self.LESSONS_URL, other_url]:
+            responses.get(url, json={"lessons": [], "modules": []})
+        responses.delete("https://us.edstem.org/api/lessons/slides/2")
+        api.get_all_lessons(1234)
+        api.get_all_lessons(5678)
+
+        api.delete_slide(2, course_id=1234)
+        api.get_all_lessons(1234)
+        api.get_all_lessons(5678)
+
+        urls = [
+            call.request.url for call in responses.calls if call.request.method == "GET"
+        ]
+        self.assertEqual([self.LESSONS_URL, other_url, self.LESSONS_URL], urls)
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        api = EdStemAPI()
+        responses.get(self.LESSONS_URL, json={"lessons": [], "modules": []})
+        api.get_all_lessons(1234)
+        api.get_all_modules(1234)
+        self.assertEqual(2, len(responses.calls))
+
+
+class ConditionalGetTest(unittest.TestCase):
+    @responses.activate
+    def test_not_modified(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI(conditional_get=True)
+        responses.get(LESSON_URL, json={"lesson": {"id": 1}}, headers={"ETag": '"v1"'})
+        responses.get(
+            LESSON_URL,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        self.assertEqual({"id": 1}, api.get_lesson(1))
+        self.assertEqual({"id": 1}, api.get_lesson(1))
+        self.assertEqual(1, api.stats.cache_hits)
+        self.assertEqual(1, api.stats.cache_misses)
+
+    @responses.activate
+    def test_not_modified_without_cached_response(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI(conditional_get=True)
+        responses.get(LESSON_URL, status=304)
+        responses.get(LESSON_URL, json={"lesson": {"id": 1}})
+
+        self.assertEqual({"id": 1}, api.get_lesson(1))
+        self.assertNotIn("If-None-Match", responses.calls[1].request.headers)
+
+
+class DownloadTest(unittest.TestCase):
+    @responses.activate
+    def test_download_challenge_results(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI()
+        csv = b"name,email,score\n" + b"Aang,aang@uw.edu,10\n" * 1000
+        responses.post("https://us.edstem.org/api/challenges/5/results", body=csv)
+
+        buffer = io.BytesIO()
+        stats = api.download_challenge_results(
+            5, buffer, chunk_size=1024, score_type="passfail"
+        )
+        self.assertEqual(csv, buffer.getvalue())
+        self.assertEqual(len(csv), stats.bytes)
+        self.assertIn("score_type=passfail", responses.calls[0].request.url)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.csv")
+            api.download_challenge_results(5, path)
+            with open(path, "rb") as f:
+                self.assertEqual(csv, f.read())
+
+
+class EditTest(unittest.TestCase):
+    def setUp(self) -> None:
+        edstem.auth.set_token("Fake Token")
+        self.api = EdStemAPI()
+
+    @responses.activate
+    def test_edit_lesson_reads_first(self):
+        responses.get(LESSON_URL, json={"lesson": {"id": 1, "title": "Old"}})
+        responses.put(LESSON_URL, json={"lesson": {"id": 1, "title": "New"}})
+
+        self.api.edit_lesson(1, {"title": "New"})
+        self.assertEqual(["GET", "PUT"], [c.request.method for c in responses.calls])
+
+    @responses.activate
+    def test_edit_lesson_with_current(self):
+        current = {"id": 1, "title": "Old", "updated_at": "2023-05-05T05:51:36.9+10:00"}
+        put = responses.put(LESSON_URL, json={"lesson": {"id": 1, "title": "New"}})
+
+        lesson = self.api.edit_lesson(1, {"title": "New"}, current=current)
+
+        self.assertEqual({"id": 1, "title": "New"}, lesson)
+        self.assertEqual(1, len(responses.calls))
+        request = put.calls[0].request
+        # Rounded up to the next whole second, as Ed's updated_at has microseconds
+        self.assertEqual(
+            "Thu, 04 May 2023 19:51:37 GMT", request.headers["If-Unmodified-Since"]
+        )
+        self.assertEqual(
+            {"lesson": current | {"title": "New"}}, json.loads(request.body)
+        )
+
+    @responses.activate
+    def test_edit_conflict(self):
+        current = {"id": 1, "updated_at": "2023-05-05T05:51:36.9+10:00"}
+        responses.put(LESSON_URL, status=412)
+        with self.assertRaises(EditConflictError):
+            self.api.edit_lesson(1, {"title": "New"}, current=current)
+
+    @responses.activate
+    def test_no_precondition_without_updated_at(self):
+        slide_url = "https://us.edstem.org/api/lessons/slides/2"
+        put = responses.put(slide_url, json={"slide": {"id": 2}})
+        for updated_at in [None, "yesterday"]:
+            current = {"id": 2, "updated_at": updated_at}
+            self.api.edit_slide(2, {"title": "New"}, current=current)
+        for call in put.calls:
+            self.assertNotIn("If-Unmodified-Since", call.request.headers)
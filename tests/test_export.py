@@ -0,0 +1,120 @@
+import functools
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+
+from edstem.ed_api import DownloadStats, EdStemAPI
+from edstem.export import MANIFEST_NAME, ExportItem, export_results, find_export_items
+
+TEST_LESSON_JSON = {
+    "id": 1,
+    "title": "Lesson",
+    "slides": [
+        {"id": 10, "type": "document", "title": "Intro"},
+        {"id": 11, "type": "code", "title": "Challenge", "challenge_id": 500},
+        {"id": 12, "type": "quiz", "title": "Quiz"},
+    ],
+}
+
+
+def write(content: bytes):
+    def download(item_id, f, **options):
+        f.write(content)
+        return DownloadStats(len(content), 0.01)
+
+    return MagicMock(side_effect=download)
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = MagicMock(spec=EdStemAPI)
+        self.api.get_all_lessons.return_value = [{"id": 1}]
+        self.api.get_lesson.return_value = TEST_LESSON_JSON
+        self.api.get_lessons_bulk.side_effect = functools.partial(
+            EdStemAPI.get_lessons_bulk, self.api
+        )
+        self.api.download_lesson_completions = write(b"lesson")
+        self.api.download_challenge_results = write(b"challenge")
+        self.api.download_quiz_results = write(b"quiz")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+
+    def read(self, filename: str) -> bytes:
+        with open(os.path.join(self.directory, filename), "rb") as f:
+            return f.read()
+
+    def test_find_export_items(self):
+        self.assertEqual(
+            [
+                ExportItem("lesson", 1, "Lesson", 1),
+                ExportItem("challenge", 500, "Challenge", 1),
+                ExportItem("quiz", 12, "Quiz", 1),
+            ],
+            find_export_items(self.api, 1234),
+        )
+
+    def test_export_results(self):
+        report = export_results(self.api, 1234, self.directory)
+
+        self.assertEqual(3, len(report.succeeded))
+        self.assertTrue(all(r.value.changed for r in report.succeeded))
+        self.assertEqual(b"lesson", self.read("lesson-1.csv"))
+        self.assertEqual(b"challenge", self.read("challenge-500.csv"))
+        self.assertEqual(b"quiz", self.read("quiz-12.csv"))
+        manifest = json.loads(self.read(MANIFEST_NAME))
+        self.assertEqual(1234, manifest["course_id"])
+        self.assertEqual(
+            {"lesson-1.csv", "challenge-500.csv", "quiz-12.csv"}, set(manifest["files"])
+        )
+        # No temporary files are left behind
+        self.assertEqual(4, len(os.listdir(self.directory)))
+
+    def test_unchanged_results_are_not_replaced(self):
+        export_results(self.api, 1234, self.directory)
+        path = os.path.join(self.directory, "lesson-1.csv")
+        os.utime(path, (0, 0))
+        self.api.download_quiz_results = write(b"new quiz")
+
+        report = export_results(self.api, 1234, self.directory)
+
+        changed = {r.key: r.value.changed for r in report.results}
+        self.assertEqual(
+            {"lesson-1.csv": False, "challenge-500.csv": False, "quiz-12.csv": True},
+            changed,
+        )
+        self.assertEqual(0, os.path.getmtime(path))
+        self.assertEqual(b"new quiz", self.read("quiz-12.csv"))
+
+    def test_failed_download_keeps_previous_file(self):
+        export_results(self.api, 1234, self.directory)
+        self.api.download_quiz_results = MagicMock(
+            side_effect=requests.HTTPError("Forbidden")
+        )
+
+        report = export_results(self.api, 1234, self.directory)
+
+        self.assertEqual(["quiz-12.csv"], [r.key for r in report.failed])
+        self.assertEqual(b"quiz", self.read("quiz-12.csv"))
+        manifest = json.loads(self.read(MANIFEST_NAME))
+        self.assertIn("quiz-12.csv", manifest["files"])
+        self.assertEqual(4, len(os.listdir(self.directory)))
+
+    def test_removed_items_are_dropped(self):
+        export_results(self.api, 1234, self.directory)
+        slides = TEST_LESSON_JSON["slides"][:2]
+        self.api.get_lesson.return_value = TEST_LESSON_JSON | {"slides": slides}
+
+        export_results(self.api, 1234, self.directory)
+
+        manifest = json.loads(self.read(MANIFEST_NAME))
+        self.assertEqual({"lesson-1.csv", "challenge-500.csv"}, set(manifest["files"]))
+        self.assertEqual(3, len(os.listdir(self.directory)))
+
+
+if __name__ == "__main__":
+    unittest.main()
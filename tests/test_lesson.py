@@ -1,3 +1,4 @@
+import copy
 from datetime import datetime
 
 from dateutil import tz
@@ -72,3 +73,99 @@ class LessonTest(BaseTest):
         # ID not found
         with self.assertRaises(ValueError):
             Lesson.get_lesson(TEST_COURSE_ID, 3)
+
+    def test_from_dict_does_not_modify_data(self):
+        data = copy.deepcopy(TEST_LESSON_0_JSON)
+        lesson = Lesson.from_dict(data)
+        lesson.name = "New Name"
+        lesson.quiz_settings.quiz_mode = "exam"
+        self.assertEqual(TEST_LESSON_0_JSON, data)
+
+        # Ownership transfer uses data as is
+        lesson = Lesson.from_dict(data, copy=False)
+        lesson.name = "New Name"
+        self.assertEqual("New Name", data["title"])
+
+    def test_slides_built_lazily(self):
+        lesson = Lesson.from_dict(TEST_LESSON_WITH_SLIDES_JSON)
+        self.assertIsNone(lesson._slides)
+        self.assertEqual([335934, 335935], [s.id for s in lesson.slides])
+        self.assertIs(lesson.slides, lesson.slides)
+        self.assertEqual(335935, lesson.get_slide("Check-in").id)
+
+    def test_schedule_cached_until_set(self):
+        lesson = Lesson.from_dict(TEST_LESSON_0_JSON)
+        due_at = lesson.schedule.due_at
+        self.assertIs(due_at, lesson.schedule.due_at)
+
+        lesson.schedule.due_at = "2023-06-01T08:00:00+10:00"
+        self.assertEqual(
+            datetime(2023, 5, 31, 15, 0, 0, 0, tzinfo=tz.gettz("America/Los_Angeles")),
+            lesson.schedule.due_at,
+        )
+
+    def test_schedules_to_dataframe(self):
+        lesson_0 = Lesson.from_dict(TEST_LESSON_0_JSON)
+        lesson_1 = Lesson.from_dict(TEST_LESSON_1_JSON)
+        lesson_1.schedule.due_at = datetime(2023, 6, 1, tzinfo=tz.UTC)
+
+        frame = Lesson.schedules_to_dataframe([lesson_0, lesson_1])
+        self.assertEqual([60007, 62178], list(frame.index))
+        self.assertEqual(lesson_0.schedule.due_at, frame.loc[60007, "due_at"])
+        self.assertEqual(lesson_1.schedule.due_at, frame.loc[62178, "due_at"])
+        self.assertTrue(frame["available_at"].isna()[62178])
+
+    def test_post_changes_sends_local_state(self):
+        api = self.course._api
+        api.edit_lesson.return_value = {}  # type: ignore
+        lesson = Lesson.from_dict(TEST_LESSON_0_JSON)
+        lesson.visibility.hidden = False
+
+        lesson.post_changes()
+
+        args, kwargs = api.edit_lesson.call_args  # type: ignore
+        self.assertEqual((60007, {"is_hidden": False}), args)
+        self.assertEqual(False, kwargs["current"]["is_hidden"])
+        self.assertEqual(TEST_LESSON_0_JSON["title"], kwargs["current"]["title"])
+        # Slides and the viewer's progress are not sent back as lesson fields
+        self.assertNotIn("slides", kwargs["current"])
+        self.assertNotIn("status", kwargs["current"])
+
+    def test_clone_into(self):
+        api = self.course._api
+        new_ids = iter([70001, 70002])
+        api.create_lesson.side_effect = lambda title, options, course_id: (  # type: ignore
+            TEST_LESSON_0_JSON | {"id": next(new_ids), "title": title}
+        )
+        api.clone_slide.side_effect = lambda slide_id, lesson_id, **kwargs: (  # type: ignore
+            TEST_SLIDE_0_JSON | {"id": slide_id + 1, "lesson_id": lesson_id}
+        )
+        slides = [TEST_SLIDE_0_JSON, TEST_SLIDE_1_JSON | {"is_hidden": True}]
+        lesson = Lesson.from_dict(
+            TEST_LESSON_WITH_SLIDES_JSON | {"slides": slides, "slide_count": 2}
+        )
+
+        report = lesson.clone_into(["Section A", "Section B"], max_workers=1)
+
+        self.assertEqual(["Section A", "Section B"], [r.key for r in report.succeeded])
+        new_lesson = report.results[0].value
+        assert new_lesson is not None
+        self.assertEqual("Section A", new_lesson.name)
+        self.assertEqual(
+            [slide["id"] + 1 for slide in slides], [s.id for s in new_lesson.slides]
+        )
+        api.create_lesson.assert_called_with(  # type: ignore
+            "Section B", {}, course_id=lesson.course_id
+        )
+        self.assertEqual(
+            [
+                (
+                    (slide["id"], lesson_id),
+                    {"is_hidden": slide["is_hidden"], "course_id": lesson.course_id},
+                )
+                for lesson_id in [70001, 70002]
+                for slide in slides
+            ],
+            api.clone_slide.call_args_list,  # type: ignore
+        )
+        api.get_lesson.assert_not_called()  # type: ignore
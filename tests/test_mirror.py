@@ -0,0 +1,154 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import responses
+
+from testing_utils import *
+
+import edstem.auth
+
+from edstem.ed_api import EdStemAPI
+from edstem.mirror import CourseMirror
+
+TEST_QUESTION_JSON = {"id": 9001, "slide_id": 335935, "type": "multiple-choice"}
+
+
+def lesson_json(lesson_id):
+    # get_lesson returns the lesson with its slides
+    if lesson_id == TEST_LESSON_0_JSON["id"]:
+        return dict(TEST_LESSON_WITH_SLIDES_JSON)
+    return dict(TEST_LESSON_1_JSON)
+
+
+class TestCourseMirror(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = MagicMock(spec=EdStemAPI)
+        self.api.get_all_users.return_value = TEST_USER_JSON
+        self.api.get_all_modules.return_value = TEST_MODULE_JSON
+        self.api.get_all_lessons.return_value = TEST_LESSON_JSON
+        self.api.get_lesson.side_effect = lesson_json
+        self.api.get_questions.return_value = [TEST_QUESTION_JSON]
+        self.mirror = CourseMirror(":memory:", TEST_COURSE_ID, api=self.api)
+
+    def tearDown(self) -> None:
+        self.mirror.close()
+
+    def test_sync(self):
+        stats = self.mirror.sync()
+
+        self.assertEqual(3 + 2 + 1, stats.requests)
+        self.assertEqual(
+            {"users": 3, "modules": 2, "lessons": 2, "slides": 2, "questions": 1},
+            stats.changed,
+        )
+        self.assertEqual([123, 321, 555], [u.id for u in self.mirror.users()])
+        self.assertEqual(
+            ["First Module", "Second Module"], [m.name for m in self.mirror.modules()]
+        )
+        self.assertEqual(
+            [TEST_LESSON_0_JSON["id"]],
+            [l.id for l in self.mirror.lessons(module_id=13194)],
+        )
+        lesson = self.mirror.lesson(TEST_LESSON_0_JSON["id"])
+        self.assertEqual(["Introduction", "Check-in"], [s.name for s in lesson.slides])
+        self.assertEqual([TEST_QUESTION_JSON], self.mirror.questions(335935))
+        self.assertIsNotNone(self.mirror.last_synced)
+
+    def test_sync_only_fetches_changes(self):
+        self.mirror.sync()
+        self.api.get_lesson.reset_mock()
+        self.api.get_questions.reset_mock()
+
+        stats = self.mirror.sync()
+
+        self.assertEqual(3, stats.requests)
+        self.api.get_lesson.assert_not_called()
+        self.api.get_questions.assert_not_called()
+
+        # Only the lesson whose listing changed is fetched again
+        self.api.get_all_lessons.return_value = [
+            TEST_LESSON_0_JSON | {"updated_at": "2023-06-01T10:00:00+10:00"},
+            TEST_LESSON_1_JSON,
+        ]
+        stats = self.mirror.sync()
+        self.api.get_lesson.assert_called_once_with(TEST_LESSON_0_JSON["id"])
+        self.assertEqual(0, stats.changed["slides"])
+        self.api.get_questions.assert_not_called()
+
+    def test_sync_full(self):
+        self.mirror.sync()
+        self.api.get_questions.reset_mock()
+
+        stats = self.mirror.sync(full=True)
+
+        self.assertEqual(3 + 2 + 1, stats.requests)
+        self.api.get_questions.assert_called_once_with(335935)
+
+    def test_sync_removes_deleted(self):
+        self.mirror.sync()
+        self.api.get_all_users.return_value = TEST_USER_JSON[:1]
+        self.api.get_all_lessons.return_value = [TEST_LESSON_1_JSON]
+
+        stats = self.mirror.sync()
+
+        self.assertEqual(2, stats.deleted["users"])
+        self.assertEqual(1, stats.deleted["lessons"])
+        self.assertEqual(2, stats.deleted["slides"])
+        self.assertEqual(1, stats.deleted["questions"])
+        self.assertEqual([], self.mirror.slides(TEST_LESSON_0_JSON["id"]))
+        with self.assertRaises(ValueError):
+            self.mirror.lesson(TEST_LESSON_0_JSON["id"])
+
+    def test_failed_sync_changes_nothing(self):
+        self.api.get_questions.side_effect = ConnectionError("Connection reset")
+        with self.assertRaises(ConnectionError):
+            self.mirror.sync()
+        self.assertEqual([], self.mirror.lessons())
+        self.assertIsNone(self.mirror.last_synced)
+
+    def test_persists_between_runs(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "course.db")
+        with CourseMirror(path, TEST_COURSE_ID, api=self.api) as mirror:
+            mirror.sync()
+        with CourseMirror(path, TEST_COURSE_ID, api=self.api) as mirror:
+            self.assertEqual(3, len(mirror.users()))
+        with self.assertRaises(ValueError):
+            CourseMirror(path, TEST_COURSE_ID + 1, api=self.api)
+
+    @responses.activate
+    def test_sync_with_conditional_get(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI(conditional_get=True, lessons_cache_ttl=0)
+        url = EdStemAPI.API_URL
+        etag = {"ETag": '"v1"'}
+        responses.get(
+            f"{url}courses/{TEST_COURSE_ID}/admin", json={"users": TEST_USER_JSON}
+        )
+        responses.get(
+            f"{url}courses/{TEST_COURSE_ID}/lessons",
+            json={"lessons": TEST_LESSON_JSON, "modules": TEST_MODULE_JSON},
+        )
+        for lesson_id in [TEST_LESSON_0_JSON["id"], TEST_LESSON_1_JSON["id"]]:
+            lesson = {"lesson": lesson_json(lesson_id)}
+            responses.get(f"{url}lessons/{lesson_id}", json=lesson, headers=etag)
+            responses.get(f"{url}lessons/{lesson_id}", status=304)
+        responses.get(
+            f"{url}lessons/slides/335935/questions",
+            json={"questions": [TEST_QUESTION_JSON]},
+        )
+
+        with CourseMirror(":memory:", TEST_COURSE_ID, api=api) as mirror:
+            mirror.sync()
+            stats = mirror.sync(full=True)
+
+            self.assertEqual(2, api.stats.cache_hits)
+            self.assertEqual(0, stats.deleted["slides"])
+            self.assertEqual(2, len(mirror.slides(TEST_LESSON_0_JSON["id"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+import requests
+from testing_utils import *
+
+from edstem.changes import ChangeSet
+from edstem.lesson import Lesson
+from edstem.quiz_question import QuizQuestion
+
+TEST_QUESTION_0_JSON: JSON = {
+    "id": 9001,
+    "lesson_slide_id": 335935,
+    "index": 1,
+    "type": "multiple-choice",
+    "auto_points": 1,
+    "data": {
+        "content": '<document version="2.0"><paragraph>2 + 2?</paragraph></document>',
+        "answers": ["3", "4"],
+        "solution": [1],
+        "explanation": "",
+    },
+}
+TEST_QUESTION_1_JSON: JSON = TEST_QUESTION_0_JSON | {"id": 9002, "index": 2}
+
+
+class QuizQuestionTest(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.api: MagicMock = self.course._api  # type: ignore
+        self.api.get_questions.return_value = [
+            TEST_QUESTION_0_JSON,
+            TEST_QUESTION_1_JSON,
+        ]
+        self.api.edit_question.return_value = {}
+
+    def test_from_dict(self):
+        question = QuizQuestion.from_dict(TEST_QUESTION_0_JSON)
+        self.assertEqual(9001, question.id)
+        self.assertEqual(335935, question.slide_id)
+        self.assertEqual(["3", "4"], question.answers)
+        self.assertEqual([1], question.solution)
+
+        question.solution = [0]
+        self.assertEqual({"data"}, question._changes)
+        self.assertEqual([1], TEST_QUESTION_0_JSON["data"]["solution"])
+
+    def test_lesson_get_questions(self):
+        lesson = Lesson.from_dict(TEST_LESSON_WITH_SLIDES_JSON)
+        questions = lesson.get_questions()
+
+        # Only the quiz slide is fetched
+        self.api.get_questions.assert_called_once_with(335935)
+        self.assertEqual([335935], list(questions))
+        self.assertEqual([9001, 9002], [q.id for q in questions[335935]])
+        self.assertEqual(9002, questions[335935].get(9002).id)
+
+    def test_listing_lesson_get_questions(self):
+        self.api.get_lesson.return_value = TEST_LESSON_WITH_SLIDES_JSON
+        # Lessons from a course listing have a slide count but no slides
+        lesson = self.course.get_lesson(TEST_LESSON_0_JSON["id"])
+        questions = lesson.get_questions()
+
+        self.api.get_lesson.assert_called_once_with(TEST_LESSON_0_JSON["id"])
+        self.assertEqual([335935], list(questions))
+        self.assertEqual([9001, 9002], [q.id for q in questions[335935]])
+
+    def test_course_get_all_questions(self):
+        self.api.get_lesson.side_effect = lambda lesson_id: (
+            TEST_LESSON_WITH_SLIDES_JSON if lesson_id == 60007 else TEST_LESSON_1_JSON
+        )
+        questions = self.course.get_all_questions()
+        self.assertEqual([335935], list(questions))
+
+    def test_get_questions_bulk_reports_failures(self):
+        self.api.get_questions.side_effect = lambda slide_id: (
+            [TEST_QUESTION_0_JSON] if slide_id == 1 else self._raise(slide_id)
+        )
+        report = self.api.get_questions_bulk([1, 2])
+        self.assertEqual([1], [r.key for r in report.succeeded])
+        self.assertEqual([2], [r.key for r in report.failed])
+        with self.assertRaises(requests.HTTPError):
+            QuizQuestion.get_questions_by_slide([1, 2])
+
+    def test_edit_and_delete(self):
+        questions = QuizQuestion.get_questions(335935)
+        questions[0].points = 2
+        with ChangeSet() as changes:
+            changes.add_all(questions)
+        self.api.edit_question.assert_called_once_with(9001, {"auto_points": 2})
+
+        report = self.api.delete_questions(q.id for q in questions)
+        self.assertEqual([9001, 9002], [r.key for r in report.succeeded])
+        self.assertEqual(2, self.api.delete_question.call_count)
+
+    @staticmethod
+    def _raise(slide_id):
+        raise requests.HTTPError(f"Not found: {slide_id}")
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from edstem.results import (
+    parse_challenge_results,
+    parse_lesson_completions,
+    parse_quiz_results,
+)
+
+LESSON_COMPLETIONS_CSV = b"""Name,Email,Tutorial,Intro,Quiz
+,,,1,2
+,,,0,3
+Aang Airbender,aang@uw.edu,AA,2023-05-18T08:00:00+10:00,
+Archie Andrews,archie@cs.washington.edu,AE,2023-05-18T09:00:00+10:00,2023-05-19T09:00:00+10:00
+"""
+
+PASSFAIL_CSV = b"""Name,Email,Tutorial,Submitted At,Test 1,Test 2,Feedback
+Aang Airbender,aang@uw.edu,AA,2023-05-18T08:00:00+10:00,pass,fail,Nice
+Archie Andrews,archie@cs.washington.edu,AE,2023-05-18T09:00:00+10:00,fail,,
+"""
+
+PERTESTCASE_CSV = b"""Name,Email,Tutorial,Test 1,Test 2,test_runtime,Test date parsing
+Aang Airbender,aang@uw.edu,AA,1,0.5,1,1
+Archie Andrews,archie@cs.washington.edu,AE,0,-,0,1
+"""
+
+# Test cases whose names mention times or dates are still test cases
+PASSFAIL_TEST_NAMES_CSV = b"""Name,Email,Updated At,test_runtime,Feedback
+Aang Airbender,aang@uw.edu,not a timestamp,pass,True
+Archie Andrews,archie@cs.washington.edu,,fail,Nice
+"""
+
+
+class ResultsTest(unittest.TestCase):
+    def test_lesson_completions(self):
+        frame = parse_lesson_completions(LESSON_COMPLETIONS_CSV)
+        self.assertEqual(2, len(frame))
+        self.assertIsInstance(frame["Email"].dtype, pd.CategoricalDtype)
+        self.assertEqual(pd.Timestamp("2023-05-17T22:00:00Z"), frame.loc[0, "Intro"])
+        self.assertTrue(pd.isna(frame.loc[0, "Quiz"]))
+        self.assertEqual("2", frame.attrs["slide_numbers"]["Quiz"])
+        self.assertEqual("3", frame.attrs["slide_scores"]["Quiz"])
+
+    def test_challenge_results_passfail(self):
+        frame = parse_challenge_results(PASSFAIL_CSV, score_type="passfail")
+        self.assertEqual([True, False], list(frame["Test 1"]))
+        self.assertEqual("boolean", frame["Test 2"].dtype)
+        self.assertTrue(pd.isna(frame.loc[1, "Test 2"]))
+        self.assertEqual("Nice", frame.loc[0, "Feedback"])
+        self.assertEqual(
+            pd.Timestamp("2023-05-17T23:00:00Z"), frame.loc[1, "Submitted At"]
+        )
+
+    def test_challenge_results_column_names(self):
+        frame = parse_challenge_results(PASSFAIL_TEST_NAMES_CSV, score_type="passfail")
+        self.assertEqual("boolean", frame["test_runtime"].dtype)
+        self.assertEqual("not a timestamp", frame.loc[0, "Updated At"])
+        self.assertEqual(["True", "Nice"], list(frame["Feedback"]))
+
+    def test_challenge_results_pertestcase_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.csv")
+            with open(path, "wb") as f:
+                f.write(PERTESTCASE_CSV)
+            frame = parse_challenge_results(path)
+        self.assertEqual([1.0, 0.0], list(frame["Test 1"]))
+        self.assertEqual("float64", frame["Test 2"].dtype)
+        self.assertTrue(pd.isna(frame.loc[1, "Test 2"]))
+        self.assertEqual([1, 0], list(frame["test_runtime"]))
+        self.assertEqual([1, 1], list(frame["Test date parsing"]))
+
+    def test_quiz_results(self):
+        frame = parse_quiz_results(PERTESTCASE_CSV, tz="America/Los_Angeles")
+        self.assertEqual(["AA", "AE"], list(frame["Tutorial"]))
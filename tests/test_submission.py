@@ -0,0 +1,134 @@
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import responses
+
+import edstem.auth
+from edstem.ed_api import EdStemAPI
+from edstem.submission import Submission, SubmissionIndex, iter_json_array
+
+TEST_SUBMISSIONS_JSON = [
+    {
+        "id": 1,
+        "user_id": 123,
+        "challenge_id": 5,
+        "created_at": "2023-05-18T08:00:00+10:00",
+        "result": {"passed": True, "score": 10},
+    },
+    {"id": 2, "user_id": 321, "challenge_id": 5, "created_at": None, "score": 7.5},
+    {"id": 3, "user_id": 555, "note": 'ünïcödé ]}, "quoted"', "result": None},
+]
+
+
+def pieces(content: bytes, size: int) -> list[bytes]:
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+class IterJSONArrayTest(unittest.TestCase):
+    def test_any_chunk_size(self):
+        content = json.dumps(
+            TEST_SUBMISSIONS_JSON, indent=2, ensure_ascii=False
+        ).encode()
+        for size in [1, 2, 7, 64, len(content)]:
+            self.assertEqual(
+                TEST_SUBMISSIONS_JSON, list(iter_json_array(pieces(content, size)))
+            )
+
+    def test_wrapped_in_object(self):
+        content = json.dumps(
+            {"count": 3, "meta": {"a": [1, 2]}, "submissions": TEST_SUBMISSIONS_JSON}
+        ).encode()
+        items = iter_json_array(pieces(content, 5), key="submissions")
+        self.assertEqual(TEST_SUBMISSIONS_JSON, list(items))
+
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"other": []}'], key="submissions"))
+
+    def test_yields_before_end_of_input(self):
+        def chunks():
+            yield b'[{"id": 1}, {"id"'
+            raise AssertionError("read too far")
+
+        self.assertEqual({"id": 1}, next(iter_json_array(chunks())))
+
+    def test_numbers_and_empty(self):
+        self.assertEqual([12, 345], list(iter_json_array([b"[1", b"2, 34", b"5]"])))
+        self.assertEqual([], list(iter_json_array([b" [ ] "])))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[{"id": 1}']))
+
+
+class IterSubmissionsTest(unittest.TestCase):
+    @responses.activate
+    def test_iter_submissions(self):
+        edstem.auth.set_token("Fake Token")
+        responses.post(
+            "https://us.edstem.org/api/challenges/5/submissions",
+            json={"submissions": TEST_SUBMISSIONS_JSON},
+        )
+
+        submissions = list(EdStemAPI().iter_submissions(5, type="all", chunk_size=16))
+
+        self.assertEqual([1, 2, 3], [s.id for s in submissions])
+        self.assertEqual(
+            datetime(2023, 5, 18, 8, tzinfo=timezone(timedelta(hours=10))),
+            submissions[0].created_at,
+        )
+        self.assertEqual([10.0, 7.5, None], [s.score for s in submissions])
+        self.assertEqual(TEST_SUBMISSIONS_JSON[2], submissions[2].data)
+        self.assertIn("type=all", responses.calls[0].request.url)
+        self.assertIn("students=1", responses.calls[0].request.url)
+
+
+def submission(id, user_id, challenge_id, day, score):
+    created_at = f"2023-05-{day:02}T08:00:00+10:00"
+    return Submission.from_dict(
+        {"id": id, "user_id": user_id, "challenge_id": challenge_id, "score": score}
+        | {"created_at": created_at}
+    )
+
+
+class SubmissionIndexTest(unittest.TestCase):
+    def test_latest_and_best(self):
+        first = submission(1, 123, 5, day=1, score=10)
+        second = submission(2, 123, 5, day=2, score=5)
+        tied = submission(3, 123, 5, day=3, score=10)
+        other_user = submission(4, 321, 5, day=1, score=None)
+        other_challenge = submission(5, 123, 6, day=1, score=1)
+        index = SubmissionIndex([tied, second, other_user, first, other_challenge])
+
+        self.assertEqual(5, len(index))
+        self.assertEqual({123: tied, 321: other_user}, index.latest(5))
+        self.assertEqual({123: tied, 321: other_user}, index.best(5))
+        self.assertEqual({123: first}, SubmissionIndex([second, first]).best(5))
+        self.assertEqual([first, second, tied], index.get(5, 123))
+        self.assertEqual([first, other_challenge, second, tied], index.by_user(123))
+        self.assertEqual([first, other_user, second, tied], index.by_challenge(5))
+        self.assertEqual({}, index.latest(7))
+
+    @responses.activate
+    def test_get_submissions_bulk(self):
+        edstem.auth.set_token("Fake Token")
+        api = EdStemAPI()
+        responses.get(
+            "https://us.edstem.org/api/challenges/5/users",
+            json={"users": [{"id": 123}, {"id": 321}]},
+        )
+        for user_id, submissions in [(123, [{"id": 1}, {"id": 2}]), (321, [])]:
+            responses.get(
+                f"https://us.edstem.org/api/users/{user_id}/challenges/5/submissions",
+                json={"submissions": submissions},
+            )
+
+        report = api.get_submissions_bulk([5])
+
+        self.assertEqual([(5, 123), (5, 321)], [r.key for r in report.results])
+        index = SubmissionIndex.from_report(report)
+        self.assertEqual([1, 2], [s.id for s in index.get(5, 123)])
+        self.assertEqual(2, index.latest(5)[123].id)
+        self.assertEqual([], index.get(5, 321))
+
+
+if __name__ == "__main__":
+    unittest.main()
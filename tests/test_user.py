@@ -62,3 +62,12 @@ class UserTest(BaseTest):
         print(current_data)
         print(expected_data)
         self.assertEqual(expected_data, current_data)
+
+    def test_no_instance_dict(self):
+        user = User.from_dict(TEST_USER_AANG_JSON)
+        self.assertFalse(hasattr(user, "__dict__"))
+        self.assertIsNone(user._changed)
+
+        user.tutorial = "AA"
+        self.assertEqual({"tutorial"}, user._changes)
+        self.assertEqual({"tutorial": "AA"}, user._to_dict(changes_only=True))
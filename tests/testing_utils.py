@@ -1,10 +1,11 @@
+import functools
 import unittest
 from unittest.mock import MagicMock, patch
 
 import edstem.auth
 from edstem._base import JSON, CourseID
 from edstem.course import EdCourse
-from edstem.ed_api import EdStemAPI
+from edstem.ed_api import EdStemAPI, set_default_api
 
 TEST_COURSE_ID = 1234
 
@@ -162,12 +163,48 @@ TEST_LESSON_1_JSON: JSON = {
 }
 TEST_LESSON_JSON = [TEST_LESSON_0_JSON, TEST_LESSON_1_JSON]
 
+TEST_SLIDE_0_JSON: JSON = {
+    "id": 335934,
+    "original_id": None,
+    "lesson_id": 60007,
+    "user_id": 369,
+    "course_id": 38139,
+    "type": "document",
+    "title": "Introduction",
+    "points": 0,
+    "index": 1,
+    "is_hidden": False,
+    "status": "unseen",
+    "created_at": "2023-03-29T11:04:36.691113+11:00",
+    "passage": '<document version="2.0"><paragraph>Hello</paragraph></document>',
+    "is_survey": False,
+    "mode": "",
+    "active_status": "active",
+    "correct": None,
+    "response": None,
+    "updated_at": None,
+}
+TEST_SLIDE_1_JSON: JSON = TEST_SLIDE_0_JSON | {
+    "id": 335935,
+    "type": "quiz",
+    "title": "Check-in",
+    "index": 2,
+}
+TEST_LESSON_WITH_SLIDES_JSON: JSON = TEST_LESSON_0_JSON | {
+    "slides": [TEST_SLIDE_0_JSON, TEST_SLIDE_1_JSON],
+    "slide_count": 2,
+}
+
 
 def MockAPI():
     mock_api = MagicMock(spec=EdStemAPI)
     mock_api().get_all_users.return_value = TEST_USER_JSON
     mock_api().get_all_modules.return_value = TEST_MODULE_JSON
     mock_api().get_all_lessons.return_value = TEST_LESSON_JSON
+    # Bulk methods run for real on top of the mocked single requests
+    for name in ["get_lessons_bulk", "get_questions_bulk", "delete_questions"]:
+        method = functools.partial(getattr(EdStemAPI, name), mock_api())
+        getattr(mock_api(), name).side_effect = method
     return mock_api
 
 
@@ -176,6 +213,7 @@ class BaseTest(unittest.TestCase):
         # sedstem.auth.set_token("Fake Token")
 
         self.mock_patchers = {}
+        mock_api = MockAPI()
         modules_to_patch = [
             "_base",
             "course",
@@ -184,15 +222,17 @@ class BaseTest(unittest.TestCase):
             "user",
         ]
         for to_patch in modules_to_patch:
-            patcher = patch(f"edstem.{to_patch}.EdStemAPI", MockAPI())
+            patcher = patch(f"edstem.{to_patch}.EdStemAPI", mock_api)
             self.mock_patchers[to_patch] = patcher
             patcher.start()
+        set_default_api(mock_api())
 
         self.course = EdCourse(CourseID(TEST_COURSE_ID))
 
     def _stop_api_patch(self) -> None:
         for patcher in self.mock_patchers.values():
             patcher.stop()
+        set_default_api(None)
 
     def tearDown(self) -> None:
         self._stop_api_patch()